@@ -1,8 +1,6 @@
 import numpy as np
 import csv
-import openpyxl
-import sqlalchemy
-from sqlalchemy.engine import URL
+import os
 
 __version__ = '1.0.4'
 
@@ -13,6 +11,10 @@ class DataFrame:
         A DataFrame holds two dimensional heterogenous data.
         Create it by passing a dictionary of NumPy arrays to the values parameter.
 
+        The arrays are not copied. DataFrames derived from this one share
+        them until one of the DataFrames writes to a column with
+        `df[rows, cols] = value`, which copies that column first.
+
         Parameters
         -------
         1. data (dict): A dictionary of strings mapped to NumPy arrays. The key will
@@ -28,9 +30,54 @@ class DataFrame:
         # Convert unicode arrays to objects
         self._data = self._convert_unicode_to_object(data)
 
-        # Allow for special methods for strings
-        self.str = StringMethods(self)
-        self._add_docs()
+        # Columns whose arrays no one else holds, which can be written in place
+        self._owned = set()
+        # Set by `set_index`
+        self._index = None
+
+    @classmethod
+    def _from_dict(cls, data):
+        """
+        Build a DataFrame from data the library already knows is valid,
+        skipping the checks done by __init__. Every value must be a
+        one-dimensional array of the same length with no unicode dtype.
+
+        Parameters
+        ----------
+        data: dict of column names mapped to NumPy arrays
+
+        Returns
+        -------
+        A DataFrame
+        """
+        df = cls.__new__(cls)
+        df._data = data
+        df._owned = set()
+        df._index = None
+        return df
+
+    def _share(self, col):
+        """
+        Hands out the array of a column to another DataFrame. From then on
+        this DataFrame copies the column before writing to it.
+
+        Returns
+        -------
+        The array of the column
+        """
+        self._owned.discard(col)
+        return self._data[col]
+
+    @property
+    def str(self):
+        """
+        Allow for special methods for strings
+
+        Returns
+        -------
+        StringMethods
+        """
+        return StringMethods(self)
 
     def _check_input_types(self,data):
         if not isinstance(data, dict):
@@ -38,8 +85,9 @@ class DataFrame:
         for key, value in data.items():
             if not isinstance(key, str):
                 raise TypeError('keys of `data` must be of type str')
-            if not isinstance(value, np.ndarray):
-                raise TypeError('values of `data` must be NumPy arrays')
+            if not isinstance(value, (np.ndarray, Categorical, StringArray, NullableArray)):
+                raise TypeError('values of `data` must be NumPy arrays, Categoricals, '
+                                'StringArrays or NullableArrays')
             if value.ndim != 1:
                 raise ValueError('values of `data` must be some one-dimensional array')
     
@@ -110,6 +158,9 @@ class DataFrame:
         if len(columns) != len(set(columns)):
             raise ValueError('`columns` cannot have duplicates')
         # updating _data
+        self._owned = {new for new, old in zip(columns, self._data) if old in self._owned}
+        if self._index is not None:
+            self._index.col = columns[self.columns.index(self._index.col)]
         new_data = dict(zip(columns, self._data.values()))
         self._data = new_data
 
@@ -182,7 +233,10 @@ class DataFrame:
                         v = 'None'
                     html += f'<td>{v:10}</td>'
                 else:
-                    html += f'<td>{values[i]:10}</td>'
+                    v = values[i]
+                    if v is None:
+                        v = 'None'
+                    html += f'<td>{v:10}</td>'
             html += '</tr>'
 
         if not only_head:
@@ -204,7 +258,10 @@ class DataFrame:
                             v = 'None'
                         html += f'<td>{v:10}</td>'
                     else:
-                        html += f'<td>{values[i]:10}</td>'
+                        v = values[i]
+                        if v is None:
+                            v = 'None'
+                        html += f'<td>{v:10}</td>'
                 html += '</tr>'
 
         html += '</tbody></table>'
@@ -231,8 +288,9 @@ class DataFrame:
         col_names = np.array(self.columns)
 
         # Using iterable
-        dtypes = map(lambda value : DTYPE_NAME[value.dtype.kind], self._data.values())
-        new_data = {'Column Name': col_names, 'Data Type': np.fromiter(dtypes, 'U6')}
+        dtypes = map(lambda value : 'category' if isinstance(value, Categorical)
+                     else DTYPE_NAME[value.dtype.kind], self._data.values())
+        new_data = {'Column Name': col_names, 'Data Type': np.fromiter(dtypes, 'U8')}
 
         return DataFrame(new_data)
 
@@ -251,11 +309,11 @@ class DataFrame:
         """
         # select a single column -> df['colname']
         if isinstance(item, str):
-            return DataFrame({item: self._data[item]})
+            return DataFrame._from_dict({item: self._share(item)})
 
         # select multiple columns -> df[['colname1', 'colname2']]
         if isinstance(item, list):
-            return DataFrame({col: self._data[col] for col in item})
+            return DataFrame._from_dict({col: self._share(col) for col in item})
 
         # boolean selection
         if isinstance(item, DataFrame):
@@ -267,12 +325,15 @@ class DataFrame:
             bool_arr = next(iter(item._data.values()))
             if bool_arr.dtype.kind != 'b':
                 raise TypeError('DataFrame must be a boolean')
+            if isinstance(bool_arr, NullableArray):
+                # missing values are stored as False
+                bool_arr = bool_arr.values
 
             new_data = {}
             for col, values in self._data.items():
                 # values[bool_arr] -> NumPy does boolean selection. 
                 new_data[col] = values[bool_arr]
-            return DataFrame(new_data)
+            return DataFrame._from_dict(new_data)
 
         if isinstance(item, tuple):
             return self._getitem_tuple(item)
@@ -282,6 +343,26 @@ class DataFrame:
 
     def _getitem_tuple(self, item):
         # simultaneous selection of rows and cols -> df[rs, cs]
+        row_selection, col_selection = self._parse_tuple(item)
+        new_data = {}
+        for col in col_selection:
+            if isinstance(row_selection, slice):
+                # slicing makes a view that shares the array
+                values = self._share(col)
+            else:
+                values = self._data[col]
+            new_data[col] = values[row_selection]
+        return DataFrame._from_dict(new_data)
+
+    def _parse_tuple(self, item):
+        """
+        Checks a two-item tuple of a row and a column selection
+
+        Returns
+        -------
+        A two-item tuple of the rows as an index NumPy understands and a list
+        of column names
+        """
         if len(item) != 2:
             raise ValueError('Pass either a single string or a two-item tuple inside the '
                                 'selection operator.')
@@ -295,6 +376,8 @@ class DataFrame:
             row_selection = next(iter(row_selection._data.values()))
             if row_selection.dtype.kind != 'b':
                 raise TypeError('DataFrame must be a boolean')
+            if isinstance(row_selection, NullableArray):
+                row_selection = row_selection.values
         elif not isinstance(row_selection, (list, slice)):
             raise TypeError('Row selection must be either an int, slice, list, or DataFrame')
 
@@ -327,11 +410,7 @@ class DataFrame:
             col_selection = self.columns[start:stop:step]
         else:
             raise TypeError('Column selection must be either an int, string, list, or slice')
-
-        new_data = {}
-        for col in col_selection:
-            new_data[col] = self._data[col][row_selection]
-        return DataFrame(new_data)
+        return row_selection, col_selection
 
     def _ipython_key_completions_(self):
         # allows for tab completion when doing df['c
@@ -339,10 +418,14 @@ class DataFrame:
 
     def __setitem__(self, key, value):
         # add a new column or overwrite an exisiting column
+        if isinstance(key, tuple):
+            return self._setitem_tuple(key, value)
         if not isinstance(key, str):
-            raise NotImplementedError('Can only set a single column')
+            raise NotImplementedError('Can only set a single column or a row and column '
+                                      'selection')
+        self._owned.discard(key)
 
-        if isinstance(value, np.ndarray):
+        if isinstance(value, (np.ndarray, Categorical, StringArray, NullableArray)):
             if value.ndim != 1:
                 raise ValueError('The setting array must be one dimensional')
             if len(value) != len(self):
@@ -353,9 +436,10 @@ class DataFrame:
             if len(value) != len(self):
                 raise ValueError('Setting and Calling DataFrames must be the same length')
             # reassign value to the underlying numpy array of the column.
-            value = next(iter(value._data.values()))
+            value = value._share(value.columns[0])
         elif isinstance(value, (int, str, bool, float)):
             value = np.repeat(value, len(self))
+            self._owned.add(key)
         else:
             raise TypeError('Setting value must either be a NumPy array, DataFrame, integer, string, float, or boolean')
 
@@ -363,6 +447,59 @@ class DataFrame:
             value = value.astype('O')
         
         self._data[key] = value
+        if self._index is not None and self._index.col == key:
+            self._index.reset(value)
+
+    def _setitem_tuple(self, item, value):
+        """
+        Writes to the selected rows of existing columns -> df[rs, cs] = value
+        A column shared with another DataFrame is copied before the first
+        write, so the other DataFrame never sees the change. Categorical and
+        StringArray columns take strings and None, and NullableArray columns
+        take ints, bools and None, and keep their type.
+
+        Parameters
+        ----------
+        item: two-item tuple of a row and a column selection, as for `df[rs, cs]`
+        value: a scalar or a NumPy array with one value per selected row
+        """
+        row_selection, col_selection = self._parse_tuple(item)
+        if isinstance(value, DataFrame):
+            if value.shape[1] != 1:
+                raise ValueError('Setting DataFrame must be one column')
+            value = next(iter(value._data.values()))
+        value = np.asarray(value)
+        if value.ndim > 1:
+            raise ValueError('The setting value must be a scalar or one dimensional')
+        if value.dtype.kind == 'U':
+            value = value.astype('O')
+        for col in col_selection:
+            if col not in self._data:
+                raise KeyError(col)
+        for col in col_selection:
+            values = self._data[col]
+            if isinstance(values, (Categorical, StringArray, NullableArray)):
+                new_values = _set_wrapped_rows(col, values, row_selection, value)
+                if new_values is not None:
+                    self._data[col] = new_values
+                    self._owned.add(col)
+                    if self._index is not None and self._index.col == col:
+                        self._index.reset(new_values)
+                    continue
+            if not np.can_cast(value.dtype, values.dtype, 'same_kind'):
+                # e.g. floats written to an int column make it a float column
+                try:
+                    dtype = np.result_type(values.dtype, value.dtype)
+                except TypeError:
+                    dtype = np.dtype('O')
+                values = np.asarray(values).astype(dtype)
+            elif col not in self._owned or not isinstance(values, np.ndarray):
+                values = np.array(values)
+            values[row_selection] = value
+            self._data[col] = values
+            self._owned.add(col)
+            if self._index is not None and self._index.col == col:
+                self._index.reset(values)
 
     def head(self, n=5):
         """
@@ -392,6 +529,56 @@ class DataFrame:
         """
         return self[-n:, :]
 
+    def set_index(self, col, sorted=False):
+        """
+        Use a column to look up rows with `loc`. By default the column must
+        hold unique values and a hash table from each value to its row is
+        built once, here, so every lookup afterwards takes constant time.
+
+        With `sorted=True` the column must already be in ascending order
+        (use `sort_values` first if it is not) and may hold duplicates.
+        Lookups then binary search the column, and `loc` also accepts
+        ranges of values, returning rows that share memory with this
+        DataFrame.
+
+        Parameters
+        ----------
+        col: str of the column name
+        sorted: bool, whether to binary search an ascending column instead
+            of hashing its values
+
+        Returns
+        -------
+        A DataFrame that shares the columns of this one
+        """
+        if not isinstance(col, str):
+            raise TypeError('`col` must be a str')
+        if not isinstance(sorted, bool):
+            raise TypeError('`sorted` must be a bool')
+        df = self.copy()
+        index_class = _SortedIndex if sorted else _HashIndex
+        df._index = index_class(col, df._data[col])
+        return df
+
+    @property
+    def loc(self):
+        """
+        Select rows by their values in the column given to `set_index`
+        One value selects its row -> df.loc[key]
+        A list or array of values selects those rows in that order -> df.loc[[key1, key2]]
+        A range of values, both ends included, on a sorted index -> df.loc[start:stop]
+            either end may be left out
+        Rows and columns simultaneously -> df.loc[keys, cs]
+            where cs is a column selection as in df[rs, cs]
+
+        Returns
+        -------
+        An indexer that returns a DataFrame when indexed
+        """
+        if self._index is None:
+            raise ValueError('Call `set_index` before selecting rows with `loc`')
+        return _LocIndexer(self)
+
     ### Aggregation Methods ###
 
     def min(self):
@@ -442,10 +629,16 @@ class DataFrame:
         new_data = {}
         for col, value in self._data.items():
             try: 
-                new_data[col] = np.array([aggfunc(value)])
+                if isinstance(value, NullableArray):
+                    result = value._reduce(aggfunc)
+                else:
+                    result = np.array([aggfunc(value)])
             except TypeError:
-                pass
-        return DataFrame(new_data)
+                continue
+            if result.dtype.kind == 'U':
+                result = result.astype('object')
+            new_data[col] = result
+        return DataFrame._from_dict(new_data)
 
     def isna(self):
         """
@@ -458,11 +651,13 @@ class DataFrame:
         new_data = {}
         for col, value in self._data.items():
             kind = value.dtype.kind
-            if kind == 'O':
+            if isinstance(value, NullableArray):
+                new_data[col] = value.isna()
+            elif kind == 'O':
                 new_data[col] = value == None
             else:
                 new_data[col] = np.isnan(value)
-        return DataFrame(new_data)
+        return DataFrame._from_dict(new_data)
 
     def count(self):
         """
@@ -478,7 +673,7 @@ class DataFrame:
         for col, value in df._data.items():
             val = length - value.sum()
             new_data[col] = np.array([val])
-        return DataFrame(new_data)
+        return DataFrame._from_dict(new_data)
 
     # In Pandas, only series have unique method, not DataFrames
     def unique(self):
@@ -492,8 +687,11 @@ class DataFrame:
         # @ToDo: Cover the case for missing values in strings
         dfs = []
         for col, value in self._data.items():
-            new_data = {col: np.unique(value)}
-            dfs.append(DataFrame(new_data))
+            if isinstance(value, (Categorical, NullableArray)):
+                new_data = {col: value.unique()}
+            else:
+                new_data = {col: np.unique(value)}
+            dfs.append(DataFrame._from_dict(new_data))
         if len(dfs) == 1:
             return dfs[0]
         return dfs
@@ -508,8 +706,11 @@ class DataFrame:
         """
         new_data = {}
         for col, value in self._data.items():
-            new_data[col] = np.array([len(np.unique(value))])
-        return DataFrame(new_data)
+            if isinstance(value, (Categorical, NullableArray)):
+                new_data[col] = np.array([len(value.unique())])
+            else:
+                new_data[col] = np.array([len(np.unique(value))])
+        return DataFrame._from_dict(new_data)
 
     def value_counts(self, normalize=False):
         """
@@ -526,7 +727,10 @@ class DataFrame:
         """
         dfs = []
         for col, value in self._data.items():
-            uniques, raw_counts = np.unique(value, return_counts=True)
+            if isinstance(value, (Categorical, NullableArray)):
+                uniques, raw_counts = value.value_counts()
+            else:
+                uniques, raw_counts = np.unique(value, return_counts=True)
 
             # Sort counts from greatest to lowest
             order = np.argsort(-raw_counts)
@@ -535,7 +739,7 @@ class DataFrame:
 
             if normalize:
                 raw_counts = raw_counts / raw_counts.sum()
-            df = DataFrame({col: uniques, 'count': raw_counts })
+            df = DataFrame._from_dict({col: uniques, 'count': raw_counts})
             dfs.append(df)
         if len(dfs) == 1:
             return dfs[0]
@@ -556,9 +760,9 @@ class DataFrame:
         if not isinstance(columns, dict):
             raise TypeError('`columns` must be a dictionary')
         new_data = {}
-        for col, value in self._data.items():
+        for col in self._data:
             new_col = columns.get(col, col)
-            new_data[new_col] = value
+            new_data[new_col] = self._share(col)
         return DataFrame(new_data)
 
     def drop(self, columns):
@@ -578,10 +782,10 @@ class DataFrame:
         elif not isinstance(columns, list):
             raise TypeError('`columns` must be either a string or list')
         new_data = {}
-        for col, value in self._data.items():
+        for col in self._data:
             if not col in columns:
-                new_data[col] = value
-        return DataFrame(new_data)
+                new_data[col] = self._share(col)
+        return DataFrame._from_dict(new_data)
 
     ### Non-Aggregation Methods ###
 
@@ -649,13 +853,14 @@ class DataFrame:
 
     def copy(self):
         """
-        Copies the DataFrame
+        Copies the DataFrame. The copy shares the arrays of the columns until
+        either DataFrame writes to one of them.
 
         Returns
         -------
         A DataFrame
         """
-        return self._non_agg(np.copy)
+        return DataFrame._from_dict({col: self._share(col) for col in self._data})
 
     # To Do: Write a better solution
     def _non_agg(self, funcname, kinds='bif', **kwargs):
@@ -676,9 +881,10 @@ class DataFrame:
             if values.dtype.kind in kinds:
                 values = funcname(values, **kwargs)
             else:
-                values = values.copy()
+                # unchanged columns are shared, not copied
+                values = self._share(col)
             new_data[col] = values
-        return DataFrame(new_data)
+        return DataFrame._from_dict(new_data)
 
     def diff(self, n=1):
         """
@@ -801,11 +1007,16 @@ class DataFrame:
             if other.shape[1] != 1:
                 raise ValueError('`other` must be a one-column DataFrame')
             other = next(iter(other._data.values()))
+        elif isinstance(other, np.ndarray) and other.ndim > 1:
+            raise ValueError('`other` must be a scalar or a one-dimensional array')
         new_data = {}
         for col, value in self._data.items():
+            if isinstance(value, (Categorical, StringArray)) and not hasattr(value, op):
+                # only comparisons work without converting to objects
+                value = np.asarray(value)
             func = getattr(value, op)
             new_data[col] = func(other)
-        return DataFrame(new_data)
+        return DataFrame._from_dict(new_data)
 
     def sort_values(self, by, asc=True):
         """
@@ -820,10 +1031,11 @@ class DataFrame:
         -------
         DataFrame
         """
+        # Categoricals sort by their codes
         if isinstance(by, str):
-            order = np.argsort(self._data[by])
+            order = np.argsort(_group_codes(self._data[by])[0])
         elif isinstance(by, list):
-            cols = [self._data[col] for col in by[::-1]]
+            cols = [_group_codes(self._data[col])[0] for col in by[::-1]]
             order = np.lexsort(cols)
         else:
             raise TypeError('`by` must be a str or a list')
@@ -862,7 +1074,24 @@ class DataFrame:
             rows = np.random.choice(range(len(self)), size=n, replace=replace)
         return self[rows.tolist(), :]
     
-    def pivot_table(self, rows=None, columns=None, values=None, aggfunc=None):
+    def groupby(self, by):
+        """
+        Groups the rows by the values of one or more columns. Aggregate the
+        groups by calling `size`, `count`, `sum`, `mean`, `min`, `max`, `var`
+        or `std` on the result, or `agg` for several aggregations at once.
+
+        Parameters
+        ----------
+        by: str or list of column names
+
+        Returns
+        -------
+        A GroupBy
+        """
+        return GroupBy(self, by)
+
+    def pivot_table(self, rows=None, columns=None, values=None, aggfunc=None,
+                    fill_value=None, margins=False):
         """
         Creates a pivot table from one or two 'grouping' columns
 
@@ -874,7 +1103,13 @@ class DataFrame:
             Optional
         values: str of column name to aggregate
             Required
-        aggfunc: str of aggregation function
+        aggfunc: str of aggregation function, one of the `GroupBy` methods
+            or the name of any other NumPy function
+        fill_value: scalar for the cells of a table grouped by both `rows`
+            and `columns` that no row falls in
+            Optional. Defaults to NaN.
+        margins: bool of whether to add a row and a column named 'All' that
+            aggregate each column, each row and the whole table
 
         Returns
         -------
@@ -890,185 +1125,932 @@ class DataFrame:
         else:
             if aggfunc is None:
                 aggfunc = 'size'
-                val_data = np.empty(len(self))
+                val_data = None
             else:
                 raise ValueError('You cannot provide `aggfunc` when `values` is `None`')
 
-        if rows is not None:
-            row_data = self._data[rows]
-        
-        if columns is not None:
-            col_data = self._data[columns]
-
         if rows is None:
-            pivot_type = 'columns'
+            group = self.groupby(columns)
+            result = group._reduce(val_data, aggfunc)
+            labels = group._keys()[columns].tolist()
+            new_data = {label: result[i:i + 1] for i, label in enumerate(labels)}
+            if margins:
+                total = _pivot_total(np.minimum(group._codes, 0), 1, val_data, aggfunc)
+                new_data = _add_pivot_margin(new_data, 'All', total)
         elif columns is None:
-            pivot_type = 'rows'
-        else:
-            pivot_type = 'all'
-
-        from collections import defaultdict
-        d = defaultdict(list)
-        if pivot_type == 'columns':
-            for group, val in zip(col_data, val_data):
-                d[group].append(val)
-        elif pivot_type == 'rows':
-            for group, val in zip(row_data, val_data):
-                d[group].append(val)
-        else:
-            for group1, group2, val in zip(row_data, col_data, val_data):
-                d[(group1, group2)].append(val)
-
-        # aggregation function
-        agg_dict = {}
-        for group, val in d.items():
-            arr = np.array(val)
-            func = getattr(np, aggfunc)
-            agg_dict[group] = func(arr)
-
-        # dataframe representation
-        new_data = {}
-        if pivot_type == 'columns':
-            for col in sorted(agg_dict):
-                value = agg_dict[col]
-                new_data[col] = np.array([value])
-        elif pivot_type == 'rows':
-            row_vals = np.array(list(agg_dict.keys()))
-            vals = np.array(list(agg_dict.values()))
-
-            order = np.argsort(row_vals)
-            new_data[rows] = row_vals[order]
-            new_data[aggfunc] = vals[order]
+            group = self.groupby(rows)
+            new_data = group._keys()
+            new_data[aggfunc] = group._reduce(val_data, aggfunc)
+            if margins:
+                total = _pivot_total(np.minimum(group._codes, 0), 1, val_data, aggfunc)
+                new_data = {rows: _append_margin(new_data[rows], 'All'),
+                            aggfunc: _append_margin(new_data[aggfunc], total[0])}
         else:
-            row_set = set()
-            col_set = set()
-            # group is a two-item tuple 
-            for group in agg_dict:
-                row_set.add(group[0])
-                col_set.add(group[1])
-            row_list = sorted(row_set)
-            col_list = sorted(col_set)
-            new_data[rows] = np.array(row_list)
-
-            for col in col_list:
-                new_vals = []
-                for row in row_list:
-                    new_val = agg_dict.get((row, col), np.nan)
-                    new_vals.append(new_val)
-                new_data[col] = np.array(new_vals)
+            # Number every cell of the table, column by column, and aggregate
+            # each cell's values in one pass
+            row_codes, row_keys = _factorize(self._data[rows])
+            col_codes, col_keys = _factorize(self._data[columns])
+            num_rows, num_cols = len(row_keys), len(col_keys)
+            valid = (row_codes >= 0) & (col_codes >= 0)
+            cells = np.where(valid, col_codes * num_rows + row_codes, -1)
+            group = GroupBy._from_codes(cells, num_rows * num_cols)
+            if aggfunc == 'size':
+                result = sizes = group._reduce(None, 'size')
+            else:
+                result, sizes = group._reduce_all(val_data, [aggfunc, 'size'])
+            if isinstance(result, NullableArray):
+                result = result.astype('float64')
+            empty = sizes == 0
+            if empty.any():
+                fill = np.nan if fill_value is None else fill_value
+                result = result.astype(np.result_type(result.dtype, np.asarray(fill).dtype))
+                result[empty] = fill
+
+            table = result.reshape(num_cols, num_rows)
+            sizes = sizes.reshape(num_cols, num_rows)
+            # values whose rows all have a missing value for the other key
+            # have no cells
+            used_rows = sizes.any(axis=0)
+            used_cols = sizes.any(axis=1)
+            if not used_rows.all() or not used_cols.all():
+                table = table[used_cols][:, used_rows]
+                row_keys = row_keys[np.flatnonzero(used_rows)]
+                col_keys = col_keys[np.flatnonzero(used_cols)]
+
+            new_data = {rows: row_keys}
+            for label, new_vals in zip(col_keys.tolist(), table):
+                new_data[label] = new_vals
+            if margins:
+                row_totals = _pivot_total(np.where(valid, row_codes, -1), num_rows,
+                                          val_data, aggfunc)[used_rows]
+                col_totals = _pivot_total(np.where(valid, col_codes, -1), num_cols,
+                                          val_data, aggfunc)[used_cols]
+                total = _pivot_total(np.minimum(cells, 0), 1, val_data, aggfunc)
+                new_data[rows] = _append_margin(row_keys, 'All')
+                for label, col_total in zip(col_keys.tolist(), col_totals):
+                    new_data[label] = _append_margin(new_data[label], col_total)
+                new_data = _add_pivot_margin(new_data, 'All', np.append(row_totals, total))
         return DataFrame(new_data)
 
-    def _add_docs(self):
-        agg_names = ['min', 'max', 'mean', 'median', 'sum', 'var', 'std', 'any', 'all', 'argmax', 'argmin']
-        agg_doc = \
+    def to_csv(self, file, header=True, chunksize=None):
         """
-        Find the {} of each column
+        Write the DataFrame to a comma-separated-value(CSV) file. Whole
+        columns are formatted at once, `chunksize` rows at a time, so only
+        the text of one chunk is held in memory.
+
+        Parameters
+        ----------
+        file: str of file location
+        header: bool of whether to write the column names as the first line
+        chunksize: int of the number of rows formatted at a time
+            Optional
 
         Returns
         -------
-        A DataFrame
+        None
         """
-        for name in agg_names:
-            getattr(DataFrame, name).__doc__ = agg_doc.format(name)
-
-class StringMethods:
-    # TODO : Add Docs for each method
-    def __init__(self, df):
-        self._df = df
-
-    def capitalize(self, col):
-        return self._str_method(str.capitalize, col)
+        if chunksize is None:
+            chunksize = _CSV_WRITE_CHUNKSIZE
+        if not isinstance(chunksize, int) or isinstance(chunksize, bool):
+            raise TypeError('`chunksize` must be of type int')
+        if chunksize < 1:
+            raise ValueError('`chunksize` must be a positive integer')
+
+        with open(file, 'w', encoding='utf-8', newline='') as f:
+            if header:
+                csv.writer(f, lineterminator='\n').writerow(self.columns)
+        with open(file, 'ab') as f:
+            for start in range(0, len(self), chunksize):
+                columns = [_format_csv_column(values[start:start + chunksize])
+                           for values in self._data.values()]
+                f.write(_join_csv_fields(columns))
+
+    def to_excel(self, file_path, sheet_name='Sheet1', chunksize=None):
+        """
+        Write the DataFrame to an Excel file. The workbook is written in
+        openpyxl's write-only mode, so rows are streamed to the file instead
+        of being kept as cells in memory.
 
-    def center(self, col, width, fillchar=None):
-        if fillchar is None:
-            fillchar = ' '
-        return self._str_method(str.center, col, width, fillchar)
+        Parameters
+        ----------
+        file_path: str of the path to the Excel file
+        sheet_name: str of sheet name
+        chunksize: int of the number of rows converted at a time
+            Optional
 
-    def count(self, col, sub, start=None, stop=None):
-        return self._str_method(str.count, col, sub, start, stop)
+        Returns
+        -------
+        None
+        """
+        if chunksize is None:
+            chunksize = _EXCEL_BATCHSIZE
+        if not isinstance(chunksize, int) or isinstance(chunksize, bool):
+            raise TypeError('`chunksize` must be of type int')
+        if chunksize < 1:
+            raise ValueError('`chunksize` must be a positive integer')
+        if len(self) >= _EXCEL_MAX_ROWS:
+            raise ValueError(f'Excel sheets hold at most {_EXCEL_MAX_ROWS - 1} rows of data')
+
+        openpyxl = _import_openpyxl()
+        workbook = openpyxl.Workbook(write_only=True)
+        worksheet = workbook.create_sheet(sheet_name)
+        worksheet.append(self.columns)
+        for start in range(0, len(self), chunksize):
+            # Each column is converted to Python values at once
+            columns = [_to_python_values(values[start:start + chunksize])
+                       for values in self._data.values()]
+            for row in zip(*columns):
+                worksheet.append(row)
+        workbook.save(file_path)
+
+    def to_ickle(self, file):
+        """
+        Write the DataFrame to a binary columnar file that `read_ickle` maps
+        back into memory. Each column is stored as one contiguous buffer.
+        String columns are stored as UTF-8 bytes and offsets.
 
-    def endswith(self, col, suffix, start=None, stop=None):
-        return self._str_method(str.endswith, col, suffix, start, stop)
+        Parameters
+        ----------
+        file: str of file location
 
-    def startswith(self, col, suffix, start=None, stop=None):
-        return self._str_method(str.startswith, col, suffix, start, stop)
+        Returns
+        -------
+        None
+        """
+        columns = []
+        buffers = []
+        position = 0
+        for col, values in self._data.items():
+            if isinstance(values, StringArray):
+                # already stored as UTF-8 bytes and offsets
+                col_buffers = [values.offsets[1:].astype('<i8'), values.data]
+                if values.valid is not None:
+                    col_buffers.append(values.valid)
+                col_buffers = [np.ascontiguousarray(buf) for buf in col_buffers]
+                dtype = 'str'
+            elif values.dtype.kind == 'O':
+                col_buffers = _encode_ickle_strings(col, values)
+                dtype = 'str'
+            elif isinstance(values, NullableArray):
+                # the values followed by the validity bitmap, if any
+                col_buffers = [np.ascontiguousarray(values.values)]
+                if values.bitmap is not None:
+                    col_buffers.append(values.bitmap)
+                dtype = values.dtype.str
+            else:
+                col_buffers = [np.ascontiguousarray(values)]
+                dtype = values.dtype.str
+            meta = []
+            for buf in col_buffers:
+                position = _align_ickle(position)
+                meta.append({'offset': position, 'nbytes': buf.nbytes})
+                buffers.append((position, buf))
+                position += buf.nbytes
+            columns.append({'name': col, 'dtype': dtype, 'buffers': meta})
+
+        import json
+        header = json.dumps({'version': _ICKLE_VERSION, 'num_rows': len(self),
+                             'columns': columns}).encode('utf-8')
+        data_start = _align_ickle(16 + len(header))
+        with open(file, 'wb') as f:
+            f.write(_ICKLE_MAGIC)
+            f.write(np.uint64(len(header)).astype('<u8').tobytes())
+            f.write(header)
+            for offset, buf in buffers:
+                f.write(bytes(data_start + offset - f.tell()))
+                f.write(buf.view(np.uint8))
+
+    def to_sql(self, name, con, if_exists='fail', batchsize=10000):
+        """
+        Write the DataFrame to a table of a sql database. All rows are
+        inserted in one transaction, `batchsize` rows per `executemany`.
 
-    def find(self, col, sub, start=None, stop=None):
-        return self._str_method(str.find, col, sub, start, stop)
+        Parameters
+        ----------
+        name: str of table name
+        con: database URL (str or sqlalchemy URL), sqlalchemy Engine or
+            sqlalchemy Connection
+        if_exists: str of what to do when the table already exists
+            'fail' raises a ValueError, 'replace' drops the table first and
+            'append' inserts into the existing table
+        batchsize: int of the number of rows inserted at a time
 
-    def len(self, col):
-        return self._str_method(str.__len__, col)
+        Returns
+        -------
+        None
+        """
+        if if_exists not in ('fail', 'replace', 'append'):
+            raise ValueError("`if_exists` must be 'fail', 'replace' or 'append'")
+        if not isinstance(batchsize, int) or isinstance(batchsize, bool):
+            raise TypeError('`batchsize` must be of type int')
+        if batchsize < 1:
+            raise ValueError('`batchsize` must be a positive integer')
+
+        sqlalchemy = _import_sqlalchemy()
+        con = _sql_connectable(con, None, None, None, None, None)
+        if isinstance(con, sqlalchemy.engine.Engine):
+            with con.begin() as conn:
+                _write_sql(self, name, conn, if_exists, batchsize)
+        elif con.in_transaction():
+            # the caller decides when to commit
+            _write_sql(self, name, con, if_exists, batchsize)
+        else:
+            with con.begin():
+                _write_sql(self, name, con, if_exists, batchsize)
 
-    def get(self, col, item):
-        return self._str_method(str.__getitem__, col, item)
+    @classmethod
+    def _add_docs(cls):
+        agg_names = ['min', 'max', 'mean', 'median', 'sum', 'var', 'std', 'any', 'all', 'argmax', 'argmin']
+        agg_doc = \
+        """
+        Find the {} of each column
 
-    def index(self, col, sub, start=None, stop=None):
-        return self._str_method(str.index, col, sub, start, stop)
+        Returns
+        -------
+        A DataFrame
+        """
+        for name in agg_names:
+            getattr(cls, name).__doc__ = agg_doc.format(name)
 
-    def isalnum(self, col):
-        return self._str_method(str.isalnum, col)
+DataFrame._add_docs()
 
-    def isalpha(self, col):
-        return self._str_method(str.isalpha, col)
+class _HashIndex:
+    """
+    Maps the values of a key column to their row positions with a dict.
+    After the column is written to, the dict is rebuilt on the next lookup.
+    """
 
-    def isdecimal(self, col):
-        return self._str_method(str.isdecimal, col)
+    def __init__(self, col, values):
+        self.col = col
+        self.reset(values)
+        self._build()
 
-    def islower(self, col):
-        return self._str_method(str.islower, col)
+    def reset(self, values):
+        self.values = values
+        self._positions = None
 
-    def isnumeric(self, col):
-        return self._str_method(str.isnumeric, col)
+    def _build(self):
+        keys = self.values.tolist()
+        self._positions = dict(zip(keys, range(len(keys))))
+        if len(self._positions) != len(keys):
+            raise ValueError(f'Column {self.col!r} has duplicate values and cannot be an index')
 
-    def isspace(self, col):
-        return self._str_method(str.isspace, col)
+    def get_positions(self, keys):
+        """
+        Parameters
+        ----------
+        keys: a single value, or a list or 1D NumPy array of values
 
-    def istitle(self, col):
-        return self._str_method(str.istitle, col)
+        Returns
+        -------
+        A list of the row position of each key
+        """
+        if self._positions is None:
+            self._build()
+        positions = self._positions
+        if not isinstance(keys, (list, np.ndarray)):
+            keys = [keys]
+        elif isinstance(keys, np.ndarray):
+            keys = keys.tolist()
+        try:
+            return [positions[key] for key in keys]
+        except KeyError as e:
+            raise KeyError(f'{e.args[0]!r} is not in column {self.col!r}') from None
 
-    def isupper(self, col):
-        return self._str_method(str.isupper, col)
+    def get_range(self, start, stop, step):
+        raise TypeError('Selecting a range of values needs an index made with '
+                        '`set_index(col, sorted=True)`')
 
-    def lstrip(self, col, chars):
-        return self._str_method(str.lstrip, col, chars)
+class _SortedIndex:
+    """
+    Finds rows of an ascending key column by binary search. Each key or
+    range of keys maps to a slice of rows, so selecting it returns views.
+    After the column is written to, its order is checked again on the
+    next lookup.
+    """
 
-    def rstrip(self, col, chars):
-        return self._str_method(str.rstrip, col, chars)
+    def __init__(self, col, values):
+        self.col = col
+        self.reset(values)
+        self._build()
+
+    def reset(self, values):
+        self.values = values
+        self._checked = False
+
+    def _build(self):
+        if not isinstance(self.values, np.ndarray):
+            self.values = np.asarray(self.values)
+        values = self.values
+        if values.dtype.kind == 'f' and np.isnan(values).any():
+            raise ValueError(f'Column {self.col!r} has missing values and cannot be a sorted index')
+        if not (values[1:] >= values[:-1]).all():
+            raise ValueError(f'Column {self.col!r} is not in ascending order. '
+                             'Use `sort_values` first')
+        self._checked = True
+
+    def _key_slice(self, key):
+        start = self.values.searchsorted(key, 'left')
+        stop = self.values.searchsorted(key, 'right')
+        if start == stop:
+            raise KeyError(f'{key!r} is not in column {self.col!r}')
+        return slice(int(start), int(stop))
+
+    def get_positions(self, keys):
+        """
+        Parameters
+        ----------
+        keys: a single value, or a list or 1D NumPy array of values
 
-    def strip(self, col, chars):
-        return self._str_method(str.strip, col, chars)
+        Returns
+        -------
+        A slice of the rows equal to a single key, or a list of the rows
+        equal to each key in turn
+        """
+        if not self._checked:
+            self._build()
+        if not isinstance(keys, (list, np.ndarray)):
+            return self._key_slice(keys)
+        positions = []
+        for key in keys:
+            row_slice = self._key_slice(key)
+            positions.extend(range(row_slice.start, row_slice.stop))
+        return positions
+
+    def get_range(self, start, stop, step):
+        """
+        Parameters
+        ----------
+        start: lowest value to select, or None to start at the first row
+        stop: highest value to select, or None to end at the last row
+        step: must be None
 
-    def replace(self, col, old, new, count=None):
-        if count is None:
-            count = -1
-        return self._str_method(str.replace, col, old, new, count)
+        Returns
+        -------
+        A slice of the rows with values from `start` to `stop` inclusive
+        """
+        if step is not None:
+            raise ValueError('A range of values cannot have a step')
+        if not self._checked:
+            self._build()
+        values = self.values
+        lo = 0 if start is None else int(values.searchsorted(start, 'left'))
+        hi = len(values) if stop is None else int(values.searchsorted(stop, 'right'))
+        return slice(lo, max(lo, hi))
+
+class _LocIndexer:
+    # Returned by `DataFrame.loc`
+    def __init__(self, df):
+        self._df = df
 
-    def swapcase(self, col):
-        return self._str_method(str.swapcase, col)
+    def __getitem__(self, item):
+        if isinstance(item, tuple):
+            if len(item) != 2:
+                raise ValueError('Pass either keys or a two-item tuple of keys and columns')
+            keys, col_selection = item
+        else:
+            keys, col_selection = item, slice(None)
+        if isinstance(keys, slice):
+            positions = self._df._index.get_range(keys.start, keys.stop, keys.step)
+        else:
+            positions = self._df._index.get_positions(keys)
+        return self._df._getitem_tuple((positions, col_selection))
 
-    def title(self, col):
-        return self._str_method(str.title, col)
+class GroupBy:
+    """
+    The rows of a DataFrame grouped by the values of one or more columns,
+    returned by `DataFrame.groupby`. The key columns are numbered once, here,
+    so that each row has the number of its group, and every aggregation then
+    adds up values by group number with `np.bincount` or `ufunc.at` instead
+    of looping over rows in Python.
 
-    def lower(self, col):
-        return self._str_method(str.lower, col)
+    Groups come out in sorted order of their keys. Rows with a missing key
+    belong to no group, and missing values are left out of the aggregations.
 
-    def upper(self, col):
-        return self._str_method(str.upper, col)
+    Parameters
+    ----------
+    df: DataFrame
+    by: str or list of column names
+    """
 
-    def zfill(self, col, width):
-        return self._str_method(str.zfill, col, width)
+    # Aggregations that have their own kernel. Any other name is looked up
+    # in NumPy and called once per group.
+    _kernels = ('size', 'count', 'sum', 'mean', 'min', 'max', 'var', 'std')
 
-    def encode(self, col, encoding='utf-8', errors='strict'):
-        return self._str_method(str.encode, col, encoding, errors)
+    def __init__(self, df, by):
+        if isinstance(by, str):
+            by = [by]
+        elif not isinstance(by, list) or not by or \
+                not all(isinstance(col, str) for col in by):
+            raise TypeError('`by` must be a str or a non-empty list of str')
+        self._df = df
+        self._by = by
+        self._codes, self._key_uniques, self._levels = _factorize_keys(
+            [df._data[col] for col in by])
+        self._ngroups = len(self._levels[0])
+        # rows that belong to a group, or None when every row does
+        self._rows = _grouped_rows(self._codes)
+
+    @classmethod
+    def _from_codes(cls, codes, ngroups):
+        # Trusted constructor from the group number of each row, -1 for rows
+        # in no group. Only `_reduce` and `_reduce_all` can be used on it.
+        group = cls.__new__(cls)
+        group._codes = codes
+        group._ngroups = ngroups
+        group._rows = _grouped_rows(codes)
+        return group
+
+    def _keys(self):
+        # One column per key of the value of that key for each group
+        return {col: uniques[levels] for col, uniques, levels
+                in zip(self._by, self._key_uniques, self._levels)}
 
-    def _str_method(self, method, col, *args):
+    def _agg(self, aggfunc):
         """
-        Generic string method
+        Applies one aggregation to every column that is not a key
 
         Parameters
         ----------
-        method: existing string methods in Python
-        col: str name of the column
+        aggfunc: str of the aggregation name
+
+        Returns
+        -------
+        DataFrame
+        """
+        new_data = self._keys()
+        if aggfunc == 'size':
+            new_data['size'] = self._reduce(None, 'size')
+            return DataFrame._from_dict(new_data)
+        for col, values in self._df._data.items():
+            if col in new_data:
+                continue
+            try:
+                new_data[col] = self._reduce(values, aggfunc)
+            except TypeError:
+                continue
+        return DataFrame._from_dict(new_data)
+
+    def _reduce(self, values, aggfunc):
+        """
+        Aggregates a column by group
+
+        Parameters
+        ----------
+        values: a column of the grouped DataFrame
+        aggfunc: str of the aggregation name
+
+        Returns
+        -------
+        A 1D array with one value per group
+        """
+        return self._reduce_all(values, [aggfunc])[0]
+
+    def _reduce_all(self, values, aggfuncs):
+        """
+        Aggregates a column by group in several ways. The missing values are
+        dropped once, and the counts, sums and means that several
+        aggregations need are computed once.
+
+        Parameters
+        ----------
+        values: a column of the grouped DataFrame
+        aggfuncs: list of str of the aggregation names
+
+        Returns
+        -------
+        A list of 1D arrays with one value per group, one per aggregation
+        """
+        ngroups = self._ngroups
+        codes = self._codes
+        if values is None:
+            # only the size of the groups is asked for
+            if self._rows is not None:
+                codes = codes[self._rows]
+            return [np.bincount(codes, minlength=ngroups)]
+
+        sizes = None
+        if 'size' in aggfuncs:
+            sizes = self._reduce_all(None, ['size'])[0]
+        values, valid = _group_values(values)
+        if valid is None:
+            valid = self._rows
+        elif self._rows is not None:
+            valid = valid & self._rows
+        if valid is not None:
+            codes = codes[valid]
+            values = values[valid]
+        kind = values.dtype.kind
+
+        results = []
+        counts = sums = means = variances = None
+        for aggfunc in aggfuncs:
+            if aggfunc == 'size':
+                results.append(sizes)
+                continue
+            if aggfunc == 'count' or (aggfunc in self._kernels and counts is None):
+                if counts is None:
+                    counts = np.bincount(codes, minlength=ngroups)
+                if aggfunc == 'count':
+                    results.append(counts)
+                    continue
+            if aggfunc not in self._kernels or (aggfunc in ('min', 'max') and kind not in 'iubf'):
+                results.append(self._apply(codes, values, aggfunc))
+                continue
+            if kind not in 'iubf':
+                raise TypeError(f'Cannot take the {aggfunc} of values of type {values.dtype}')
+
+            if aggfunc in ('min', 'max'):
+                ufunc = np.minimum if aggfunc == 'min' else np.maximum
+                if kind == 'b':
+                    start = aggfunc == 'min'
+                elif kind == 'f':
+                    start = np.inf if aggfunc == 'min' else -np.inf
+                else:
+                    info = np.iinfo(values.dtype)
+                    start = info.max if aggfunc == 'min' else info.min
+                result = np.full(ngroups, start, dtype=values.dtype)
+                ufunc.at(result, codes, values)
+                results.append(result if counts.all() else _mask_result(result, counts > 0))
+                continue
+
+            if aggfunc == 'sum' and kind != 'f':
+                # integers add up exactly
+                result = np.zeros(ngroups, dtype='uint64' if kind == 'u' else 'int64')
+                np.add.at(result, codes, values)
+                results.append(result)
+                continue
+            if sums is None:
+                sums = np.bincount(codes, weights=values, minlength=ngroups).astype('float64', copy=False)
+            if aggfunc == 'sum':
+                results.append(sums)
+                continue
+            with np.errstate(invalid='ignore', divide='ignore'):
+                if means is None:
+                    means = sums / counts
+                if aggfunc == 'mean':
+                    results.append(means)
+                    continue
+                if variances is None:
+                    squares = (values - means[codes]) ** 2
+                    variances = np.bincount(codes, weights=squares, minlength=ngroups) / counts
+                results.append(variances if aggfunc == 'var' else np.sqrt(variances))
+        return results
+
+    def _apply(self, codes, values, aggfunc):
+        # Calls a NumPy function once per group, on the values of the group
+        func = getattr(np, aggfunc, None)
+        if func is None:
+            raise ValueError(f'{aggfunc!r} is not an aggregation')
+        order = np.argsort(codes, kind='stable')
+        bounds = np.searchsorted(codes[order], np.arange(self._ngroups + 1))
+        sorted_values = values[order]
+        results = []
+        for start, stop in zip(bounds[:-1].tolist(), bounds[1:].tolist()):
+            results.append(func(sorted_values[start:stop]) if start < stop else np.nan)
+        result = np.array(results)
+        if result.dtype.kind == 'U':
+            result = result.astype('O')
+        return result
+
+    def agg(self, aggfunc):
+        """
+        Aggregates several columns in several ways at once. Each column's
+        missing values are dropped once, and statistics that build on each
+        other, such as the count, sum, mean and std, are computed once.
+
+        Parameters
+        ----------
+        aggfunc: str of the aggregation name to apply to every column that
+            is not a key, or a dict mapping column names to an aggregation
+            name or a list of them. Results are named after their column
+            when it has one aggregation and '{column}_{aggregation}' when
+            it has a list.
+
+        Returns
+        -------
+        A DataFrame of the keys and the aggregated values of each group
+        """
+        if isinstance(aggfunc, str):
+            return self._agg(aggfunc)
+        if not isinstance(aggfunc, dict):
+            raise TypeError('`aggfunc` must be a str or a dict')
+        new_data = self._keys()
+        for col, funcs in aggfunc.items():
+            if col not in self._df._data:
+                raise KeyError(f'{col!r} is not a column')
+            if isinstance(funcs, str):
+                names = [col]
+                funcs = [funcs]
+            elif isinstance(funcs, list) and all(isinstance(func, str) for func in funcs):
+                names = [f'{col}_{func}' for func in funcs]
+            else:
+                raise TypeError('The values of `aggfunc` must be a str or a list of str')
+            for name in names:
+                if name in new_data:
+                    raise ValueError(f'Two result columns would be named {name!r}')
+            results = self._reduce_all(self._df._data[col], funcs)
+            new_data.update(zip(names, results))
+        return DataFrame._from_dict(new_data)
+
+    def size(self):
+        """
+        Returns
+        -------
+        A DataFrame of the keys and the number of rows of each group
+        """
+        return self._agg('size')
+
+    def count(self):
+        """
+        Returns
+        -------
+        A DataFrame of the keys and the number of non-missing values of
+        each column in each group
+        """
+        return self._agg('count')
+
+    def sum(self):
+        return self._agg('sum')
+
+    def mean(self):
+        return self._agg('mean')
+
+    def min(self):
+        return self._agg('min')
+
+    def max(self):
+        return self._agg('max')
+
+    def var(self):
+        return self._agg('var')
+
+    def std(self):
+        return self._agg('std')
+
+def _pivot_total(codes, ngroups, values, aggfunc):
+    # The aggregation of each group of a pivot table margin, given the
+    # group number of each row and -1 for rows left out
+    totals = GroupBy._from_codes(codes, ngroups)._reduce(values, aggfunc)
+    if isinstance(totals, NullableArray):
+        totals = totals.astype('float64')
+    return totals
+
+def _append_margin(values, total):
+    # A pivot table column with its value in the margin row appended
+    if isinstance(values, Categorical) or isinstance(total, str):
+        values = np.asarray(values, dtype='O')
+    return np.append(values, total)
+
+def _add_pivot_margin(new_data, label, totals):
+    if label in new_data:
+        raise ValueError(f'The margin cannot be named {label!r}, which is already a column')
+    new_data[label] = totals
+    return new_data
+
+def _grouped_rows(codes):
+    # A mask of the rows that have a group number, or None when all do
+    if len(codes) == 0 or codes.min() >= 0:
+        return None
+    return codes >= 0
+
+def _group_values(values):
+    # A column as an array of values and a mask of the ones that are not
+    # missing, or None when none are
+    if isinstance(values, NullableArray):
+        return values.values, None if values.bitmap is None else values.valid
+    if isinstance(values, (Categorical, StringArray)):
+        values = np.asarray(values)
+    kind = values.dtype.kind
+    if kind == 'f':
+        valid = ~np.isnan(values)
+    elif kind == 'O':
+        valid = np.not_equal(values, None)
+    else:
+        return values, None
+    return values, None if valid.all() else valid
+
+def _factorize(values):
+    """
+    Numbers the distinct values of a column in sorted order
+
+    Returns
+    -------
+    A two-item tuple of an int64 array of the number of each value, -1
+    where it is missing, and a column of the distinct values
+    """
+    if isinstance(values, Categorical):
+        # the codes are already numbers in sorted order, with gaps for
+        # categories that do not occur
+        codes = values.codes.astype('int64')
+        present = codes >= 0
+        used = np.bincount(codes[present], minlength=len(values.categories)) > 0
+        renumber = np.cumsum(used) - 1
+        codes[present] = renumber[codes[present]]
+        used_codes = np.flatnonzero(used).astype(values.codes.dtype)
+        return codes, Categorical._from_codes(used_codes, values.categories)
+
+    if isinstance(values, StringArray):
+        result = _factorize_strings(values)
+        if result is not None:
+            return result
+
+    values, valid = _group_values(values)
+    present = values if valid is None else values[valid]
+    kind = present.dtype.kind
+    if kind in 'iub':
+        codes, uniques = _factorize_ints(present)
+    elif kind == 'O':
+        codes, uniques = _factorize_objects(present)
+    else:
+        uniques, codes = np.unique(present, return_inverse=True)
+        codes = codes.reshape(-1).astype('int64')
+    if valid is not None:
+        all_codes = np.full(len(values), -1, dtype='int64')
+        all_codes[valid] = codes
+        codes = all_codes
+    return codes, uniques
+
+def _factorize_strings(values):
+    # Numbers the strings of a StringArray by sorting its bytes padded into
+    # fixed-width rows, which sort like the strings do. None when the padding
+    # would take much more memory than the buffer or a string holds a NUL,
+    # which the padding could not be told apart from.
+    lengths = np.diff(values.offsets)
+    width = int(lengths.max()) if len(lengths) else 0
+    if width * len(values) > 4 * len(values.data) + 1024 or (values.data == 0).any():
+        return None
+    rows = np.repeat(np.arange(len(values)), lengths)
+    cols = np.arange(len(values.data)) - np.repeat(values.offsets[:-1], lengths)
+    padded = np.zeros((len(values), max(width, 1)), dtype=np.uint8)
+    padded[rows, cols] = values.data
+    padded = padded.view(f'S{max(width, 1)}').ravel()
+    present = np.arange(len(values)) if values.valid is None else np.flatnonzero(values.valid)
+    _, first, inverse = np.unique(padded[present], return_index=True, return_inverse=True)
+    codes = np.full(len(values), -1, dtype='int64')
+    codes[present] = inverse.reshape(-1)
+    return codes, values[present[first]]
+
+def _factorize_ints(values):
+    # Integers within a range not much longer than the array are numbered by
+    # counting them in a table over the whole range. Others are sorted.
+    if len(values) == 0:
+        return np.empty(0, dtype='int64'), values
+    ints = values.view('uint8') if values.dtype.kind == 'b' else values
+    low = ints.min()
+    span = int(ints.max()) - int(low) + 1
+    if span > max(4 * len(values), 1 << 16):
+        uniques, codes = np.unique(values, return_inverse=True)
+        return codes.reshape(-1).astype('int64'), uniques
+    offsets = (ints - low).astype('intp')
+    used = np.bincount(offsets, minlength=span) > 0
+    renumber = np.cumsum(used) - 1
+    uniques = (np.flatnonzero(used) + low).astype(values.dtype)
+    return renumber[offsets], uniques
+
+def _factorize_objects(values):
+    # Numbers values by first appearance with a dict, then sorts the few
+    # distinct values instead of the whole array
+    table = {}
+    codes = np.fromiter((table.setdefault(val, len(table)) for val in values.tolist()),
+                        dtype='int64', count=len(values))
+    uniques = np.empty(len(table), dtype='O')
+    uniques[:] = list(table)
+    try:
+        order = np.argsort(uniques, kind='stable')
+    except TypeError:
+        # values that cannot be compared keep the order they appear in
+        return codes, uniques
+    ranks = np.empty(len(order), dtype='int64')
+    ranks[order] = np.arange(len(order))
+    return ranks[codes], uniques[order]
+
+def _factorize_keys(columns):
+    """
+    Numbers the distinct combinations of values of several columns in
+    sorted order
+
+    Returns
+    -------
+    A three-item tuple of an int64 array of the number of each row's
+    combination (-1 when any value is missing), a list of the distinct
+    values of each column and a list of, for each column, the position of
+    each combination's value among them
+    """
+    codes, uniques = _factorize(columns[0])
+    key_uniques = [uniques]
+    levels = [np.arange(len(uniques))]
+    for col in columns[1:]:
+        col_codes, col_uniques = _factorize(col)
+        num = len(col_uniques)
+        valid = (codes >= 0) & (col_codes >= 0)
+        # number the pairs of the groups so far and this column's values
+        pairs = codes[valid] * num + col_codes[valid]
+        pair_codes, pairs = _factorize_ints(pairs)
+        codes = np.full(len(codes), -1, dtype='int64')
+        codes[valid] = pair_codes
+        levels = [level[pairs // num] for level in levels] + [pairs % num]
+        key_uniques.append(col_uniques)
+    return codes, key_uniques, levels
+
+class StringMethods:
+    # TODO : Add Docs for each method
+    def __init__(self, df):
+        self._df = df
+
+    def capitalize(self, col):
+        return self._str_method(str.capitalize, col)
+
+    def center(self, col, width, fillchar=None):
+        if fillchar is None:
+            fillchar = ' '
+        return self._str_method(str.center, col, width, fillchar)
+
+    def count(self, col, sub, start=None, stop=None):
+        return self._str_method(str.count, col, sub, start, stop)
+
+    def endswith(self, col, suffix, start=None, stop=None):
+        return self._str_method(str.endswith, col, suffix, start, stop)
+
+    def startswith(self, col, suffix, start=None, stop=None):
+        return self._str_method(str.startswith, col, suffix, start, stop)
+
+    def find(self, col, sub, start=None, stop=None):
+        return self._str_method(str.find, col, sub, start, stop)
+
+    def len(self, col):
+        return self._str_method(str.__len__, col)
+
+    def get(self, col, item):
+        return self._str_method(str.__getitem__, col, item)
+
+    def index(self, col, sub, start=None, stop=None):
+        return self._str_method(str.index, col, sub, start, stop)
+
+    def isalnum(self, col):
+        return self._str_method(str.isalnum, col)
+
+    def isalpha(self, col):
+        return self._str_method(str.isalpha, col)
+
+    def isdecimal(self, col):
+        return self._str_method(str.isdecimal, col)
+
+    def islower(self, col):
+        return self._str_method(str.islower, col)
+
+    def isnumeric(self, col):
+        return self._str_method(str.isnumeric, col)
+
+    def isspace(self, col):
+        return self._str_method(str.isspace, col)
+
+    def istitle(self, col):
+        return self._str_method(str.istitle, col)
+
+    def isupper(self, col):
+        return self._str_method(str.isupper, col)
+
+    def lstrip(self, col, chars):
+        return self._str_method(str.lstrip, col, chars)
+
+    def rstrip(self, col, chars):
+        return self._str_method(str.rstrip, col, chars)
+
+    def strip(self, col, chars):
+        return self._str_method(str.strip, col, chars)
+
+    def replace(self, col, old, new, count=None):
+        if count is None:
+            count = -1
+        return self._str_method(str.replace, col, old, new, count)
+
+    def swapcase(self, col):
+        return self._str_method(str.swapcase, col)
+
+    def title(self, col):
+        return self._str_method(str.title, col)
+
+    def lower(self, col):
+        return self._str_method(str.lower, col)
+
+    def upper(self, col):
+        return self._str_method(str.upper, col)
+
+    def zfill(self, col, width):
+        return self._str_method(str.zfill, col, width)
+
+    def encode(self, col, encoding='utf-8', errors='strict'):
+        return self._str_method(str.encode, col, encoding, errors)
+
+    def _str_method(self, method, col, *args):
+        """
+        Generic string method
+
+        Parameters
+        ----------
+        method: existing string methods in Python
+        col: str name of the column
 
         Returns
         -------
@@ -1077,6 +2059,10 @@ class StringMethods:
         old_values = self._df._data[col]
         if old_values.dtype.kind != 'O':
             raise TypeError('The `str` accessor only works with string columns')
+        if isinstance(old_values, Categorical):
+            return DataFrame._from_dict({col: _categorical_str_method(old_values, method, *args)})
+        if isinstance(old_values, StringArray):
+            return DataFrame._from_dict({col: _string_array_str_method(old_values, method, *args)})
         new_values = []
         for val in old_values:
             if val is None:
@@ -1084,65 +2070,2108 @@ class StringMethods:
             else:
                 new_val = method(val, *args)
                 new_values.append(new_val)
-        return DataFrame({col: np.array(new_values)})
+        new_values = np.array(new_values)
+        if new_values.dtype.kind == 'U':
+            new_values = new_values.astype('object')
+        return DataFrame._from_dict({col: new_values})
+
+class Categorical:
+    """
+    A column of strings stored as integer codes into a sorted array of its
+    distinct values, the categories. Missing values have the code -1.
+    Because the categories are sorted, codes order the same way as the
+    strings they stand for, so sorting, grouping and comparing work on the
+    codes alone.
+
+    Parameters
+    ----------
+    values: 1D array or list of strings and None
+    """
+
+    def __init__(self, values):
+        values = np.asarray(values, dtype='O')
+        if values.ndim != 1:
+            raise ValueError('`values` must be one-dimensional')
+        missing = np.equal(values, None)
+        categories, inverse = np.unique(values[~missing], return_inverse=True)
+        codes = np.full(len(values), -1, dtype=_category_code_dtype(len(categories)))
+        codes[~missing] = inverse
+        self.codes = codes
+        self.categories = categories
+
+    @classmethod
+    def _from_codes(cls, codes, categories):
+        # Trusted constructor: `categories` must be a sorted object array of
+        # distinct strings and `codes` a 1D int array indexing into it
+        cat = cls.__new__(cls)
+        cat.codes = codes
+        cat.categories = categories
+        return cat
+
+    @property
+    def dtype(self):
+        # Categoricals stand in for object arrays of strings
+        return np.dtype('O')
+
+    @property
+    def ndim(self):
+        return 1
+
+    @property
+    def shape(self):
+        return self.codes.shape
+
+    @property
+    def size(self):
+        return self.codes.size
+
+    def __len__(self):
+        return len(self.codes)
+
+    def _labels(self):
+        # The categories followed by None, so code -1 looks up None
+        labels = np.empty(len(self.categories) + 1, dtype='O')
+        labels[:-1] = self.categories
+        return labels
+
+    def __array__(self, dtype=None, copy=None):
+        values = self._labels()[self.codes]
+        if dtype is not None:
+            values = values.astype(dtype)
+        return values
+
+    def __getitem__(self, item):
+        codes = self.codes[item]
+        if isinstance(codes, np.ndarray):
+            return Categorical._from_codes(codes, self.categories)
+        return None if codes < 0 else self.categories[codes]
+
+    def __iter__(self):
+        return iter(self.tolist())
+
+    def __repr__(self):
+        return f'Categorical({np.asarray(self)!r})'
+
+    def tolist(self):
+        return np.asarray(self).tolist()
+
+    def astype(self, dtype):
+        if isinstance(dtype, str) and dtype == 'category':
+            return self.copy()
+        return np.asarray(self).astype(dtype)
+
+    def copy(self):
+        return Categorical._from_codes(self.codes.copy(), self.categories)
+
+    def unique(self):
+        """
+        Returns
+        -------
+        A Categorical of the categories that occur, in sorted order
+        """
+        present = np.bincount(self.codes[self.codes >= 0], minlength=len(self.categories)) > 0
+        categories = self.categories[present]
+        codes = np.arange(len(categories), dtype=self.codes.dtype)
+        return Categorical._from_codes(codes, categories)
+
+    def value_counts(self):
+        """
+        Returns
+        -------
+        A two-item tuple of a Categorical of the categories that occur and
+        the number of times each occurs
+        """
+        counts = np.bincount(self.codes[self.codes >= 0], minlength=len(self.categories))
+        present = counts > 0
+        return self.unique(), counts[present]
+
+    def _compare(self, op, other):
+        # Compares with a single string by finding where it falls among the
+        # categories. Anything else is compared as an object array.
+        if other is None and op in ('__eq__', '__ne__'):
+            return getattr(self.codes, op)(-1)
+        if not isinstance(other, str):
+            return getattr(np.asarray(self), op)(other)
+        codes = self.codes
+        left = np.searchsorted(self.categories, other, 'left')
+        if op in ('__eq__', '__ne__'):
+            found = left < len(self.categories) and self.categories[left] == other
+            equal = codes == left if found else np.zeros(len(codes), dtype='bool')
+            return equal if op == '__eq__' else ~equal
+        right = np.searchsorted(self.categories, other, 'right')
+        if op == '__lt__':
+            return (codes < left) & (codes >= 0)
+        if op == '__le__':
+            return (codes < right) & (codes >= 0)
+        if op == '__gt__':
+            return codes >= right
+        return codes >= left
+
+    def __eq__(self, other):
+        return self._compare('__eq__', other)
+
+    def __ne__(self, other):
+        return self._compare('__ne__', other)
+
+    def __lt__(self, other):
+        return self._compare('__lt__', other)
+
+    def __le__(self, other):
+        return self._compare('__le__', other)
+
+    def __gt__(self, other):
+        return self._compare('__gt__', other)
+
+    def __ge__(self, other):
+        return self._compare('__ge__', other)
+
+    __hash__ = None
+
+def _categorical_str_method(values, method, *args):
+    # Calls a string method once per category instead of once per value
+    results = [method(val, *args) for val in values.categories.tolist()]
+    missing = values.codes < 0
+    if results and all(isinstance(val, str) for val in results):
+        # strings stay categorical, though several categories may now be equal
+        new = Categorical(results)
+        codes = new.codes[values.codes]
+        codes[missing] = -1
+        return Categorical._from_codes(codes, new.categories)
+    labels = np.empty(len(results) + 1, dtype='O')
+    labels[:-1] = results
+    new_values = labels[values.codes]
+    if not missing.any():
+        # same data type as for a column of strings
+        new_values = np.array(new_values.tolist())
+    return new_values
+
+def _category_code_dtype(num_categories):
+    # The smallest signed int type that holds every code and -1
+    for dtype in (np.int8, np.int16, np.int32):
+        if num_categories <= np.iinfo(dtype).max:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
+
+def _group_codes(values):
+    # Keys to group a column by, which sort like its values, and the
+    # categories the keys index into when the column is a Categorical
+    if isinstance(values, Categorical):
+        return values.codes, values.categories
+    return values, None
+
+class StringArray:
+    """
+    A column of strings stored like an Arrow string array: one contiguous
+    buffer of UTF-8 bytes and the offset where each string starts in it.
+    Missing values are marked in a boolean mask of the valid values.
+    `len`, `startswith`, `endswith`, `find`, `lower` and `upper` of the `str`
+    accessor work on the bytes of the buffer without creating Python strings.
+
+    Parameters
+    ----------
+    values: 1D array or list of strings and None
+    """
+
+    def __init__(self, values):
+        values = np.asarray(values, dtype='O')
+        if values.ndim != 1:
+            raise ValueError('`values` must be one-dimensional')
+        valid = np.not_equal(values, None)
+        encoded = []
+        for val in values[valid].tolist():
+            if not isinstance(val, str):
+                raise TypeError('`values` must only hold strings or None')
+            encoded.append(val.encode('utf-8'))
+        lengths = np.zeros(len(values), dtype=np.int64)
+        lengths[valid] = [len(val) for val in encoded]
+        self.data = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+        self.offsets = _lengths_to_offsets(lengths)
+        self.valid = None if valid.all() else valid
+
+    @classmethod
+    def _from_buffers(cls, data, offsets, valid=None):
+        # Trusted constructor: `offsets` must start at 0 and end at len(data)
+        arr = cls.__new__(cls)
+        arr.data = data
+        arr.offsets = offsets
+        arr.valid = valid
+        return arr
+
+    @property
+    def dtype(self):
+        # StringArrays stand in for object arrays of strings
+        return np.dtype('O')
+
+    @property
+    def ndim(self):
+        return 1
+
+    @property
+    def shape(self):
+        return (len(self),)
+
+    @property
+    def size(self):
+        return len(self)
+
+    @property
+    def nbytes(self):
+        nbytes = self.data.nbytes + self.offsets.nbytes
+        if self.valid is not None:
+            nbytes += self.valid.nbytes
+        return nbytes
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __array__(self, dtype=None, copy=None):
+        text = self.data.tobytes()
+        offsets = self.offsets.tolist()
+        values = np.empty(len(self), dtype='O')
+        values[:] = [text[start:stop].decode('utf-8')
+                     for start, stop in zip(offsets[:-1], offsets[1:])]
+        if self.valid is not None:
+            values[~self.valid] = None
+        if dtype is not None:
+            values = values.astype(dtype)
+        return values
+
+    def __getitem__(self, item):
+        if isinstance(item, (int, np.integer)):
+            if self.valid is not None and not self.valid[item]:
+                return None
+            item = range(len(self))[item]
+            return self.data[self.offsets[item]:self.offsets[item + 1]].tobytes().decode('utf-8')
+        valid = None if self.valid is None else self.valid[item]
+        if isinstance(item, slice) and item.step in (None, 1):
+            # a view of the same buffer
+            start, stop, _ = item.indices(len(self))
+            stop = max(start, stop)
+            offsets = self.offsets[start:stop + 1]
+            data = self.data[offsets[0]:offsets[-1]]
+            return StringArray._from_buffers(data, offsets - offsets[0], valid)
+        index = np.arange(len(self))[item]
+        starts = self.offsets[index]
+        data, offsets = _gather_bytes(self.data, starts, self.offsets[index + 1] - starts)
+        return StringArray._from_buffers(data, offsets, valid)
+
+    def __iter__(self):
+        return iter(self.tolist())
+
+    def __repr__(self):
+        return f'StringArray({np.asarray(self)!r})'
+
+    def tolist(self):
+        return np.asarray(self).tolist()
+
+    def astype(self, dtype):
+        if isinstance(dtype, str) and dtype == 'string':
+            return self.copy()
+        return np.asarray(self).astype(dtype)
+
+    def copy(self):
+        valid = None if self.valid is None else self.valid.copy()
+        return StringArray._from_buffers(self.data.copy(), self.offsets.copy(), valid)
+
+    def _byte_lengths(self):
+        return np.diff(self.offsets)
+
+    def _char_offsets(self):
+        # The offsets counted in characters instead of bytes. UTF-8
+        # continuation bytes look like 0b10xxxxxx.
+        is_char = (self.data & 0xC0) != 0x80
+        char_ends = np.zeros(len(self.data) + 1, dtype=np.int64)
+        np.cumsum(is_char, out=char_ends[1:])
+        return char_ends[self.offsets], char_ends
+
+    def _fill_missing(self, values):
+        # Missing strings give None, as the string methods of object columns do
+        if self.valid is None:
+            return values
+        values = values.astype('O')
+        values[~self.valid] = None
+        return values
+
+    def _match_at(self, rows, starts, pattern):
+        # Whether `pattern` is found at byte `starts` of each row in `rows`
+        result = np.zeros(len(self), dtype='bool')
+        if len(rows) > 0:
+            index = starts[:, None] + np.arange(len(pattern))
+            result[rows] = (self.data[index] == pattern).all(axis=1)
+        return result
+
+    def len(self):
+        char_offsets, _ = self._char_offsets()
+        return self._fill_missing(np.diff(char_offsets))
+
+    def startswith(self, prefix):
+        pattern = np.frombuffer(prefix.encode('utf-8'), dtype=np.uint8)
+        rows = np.flatnonzero(self._byte_lengths() >= len(pattern))
+        return self._fill_missing(self._match_at(rows, self.offsets[rows], pattern))
+
+    def endswith(self, suffix):
+        pattern = np.frombuffer(suffix.encode('utf-8'), dtype=np.uint8)
+        rows = np.flatnonzero(self._byte_lengths() >= len(pattern))
+        return self._fill_missing(self._match_at(rows, self.offsets[rows + 1] - len(pattern), pattern))
+
+    def find(self, sub):
+        pattern = np.frombuffer(sub.encode('utf-8'), dtype=np.uint8)
+        result = np.full(len(self), -1, dtype=np.int64)
+        if len(pattern) == 0:
+            result[:] = 0
+            return self._fill_missing(result)
+        # every byte position where the whole pattern matches
+        num_starts = len(self.data) - len(pattern) + 1
+        if num_starts > 0:
+            found = self.data[:num_starts] == pattern[0]
+            for k in range(1, len(pattern)):
+                found &= self.data[k:num_starts + k] == pattern[k]
+            positions = np.flatnonzero(found)
+            rows = np.searchsorted(self.offsets, positions, 'right') - 1
+            # drop matches that run into the next string
+            inside = positions + len(pattern) <= self.offsets[rows + 1]
+            positions, rows = positions[inside], rows[inside]
+            # positions are in order, so the first of each row comes first
+            rows, first = np.unique(rows, return_index=True)
+            char_offsets, char_ends = self._char_offsets()
+            result[rows] = char_ends[positions[first]] - char_offsets[rows]
+        return self._fill_missing(result)
+
+    def lower(self):
+        return self._change_case(_ASCII_LOWER, str.lower)
+
+    def upper(self):
+        return self._change_case(_ASCII_UPPER, str.upper)
+
+    def _change_case(self, table, method):
+        # ASCII bytes are mapped through a table. Strings with other
+        # characters, whose case change can alter their length, are redone
+        # in Python.
+        data = table[self.data]
+        non_ascii = np.zeros(len(self.data) + 1, dtype=np.int64)
+        np.cumsum(self.data >= 0x80, out=non_ascii[1:])
+        rows = np.flatnonzero(np.diff(non_ascii[self.offsets]))
+        if len(rows) == 0:
+            return StringArray._from_buffers(data, self.offsets, self.valid)
+        redone = StringArray([method(val) for val in self[rows].tolist()])
+        starts = self.offsets[:-1].copy()
+        lengths = self._byte_lengths()
+        starts[rows] = len(data) + redone.offsets[:-1]
+        lengths[rows] = redone._byte_lengths()
+        data, offsets = _gather_bytes(np.concatenate([data, redone.data]), starts, lengths)
+        return StringArray._from_buffers(data, offsets, self.valid)
+
+    def _equal(self, other):
+        pattern = np.frombuffer(other.encode('utf-8'), dtype=np.uint8)
+        rows = np.flatnonzero(self._byte_lengths() == len(pattern))
+        return self._match_at(rows, self.offsets[rows], pattern)
+
+    def _compare(self, op, other):
+        # Equality with a single string is checked on the bytes. Anything
+        # else is compared as an object array.
+        if op in ('__eq__', '__ne__'):
+            if other is None:
+                equal = np.zeros(len(self), dtype='bool') if self.valid is None else ~self.valid
+                return equal if op == '__eq__' else ~equal
+            if isinstance(other, str):
+                equal = self._equal(other)
+                return equal if op == '__eq__' else ~equal
+        return getattr(np.asarray(self), op)(other)
+
+    def __eq__(self, other):
+        return self._compare('__eq__', other)
+
+    def __ne__(self, other):
+        return self._compare('__ne__', other)
+
+    def __lt__(self, other):
+        return self._compare('__lt__', other)
+
+    def __le__(self, other):
+        return self._compare('__le__', other)
+
+    def __gt__(self, other):
+        return self._compare('__gt__', other)
+
+    def __ge__(self, other):
+        return self._compare('__ge__', other)
+
+    __hash__ = None
+
+_ASCII_LOWER = np.arange(256, dtype=np.uint8)
+_ASCII_LOWER[ord('A'):ord('Z') + 1] += 32
+_ASCII_UPPER = np.arange(256, dtype=np.uint8)
+_ASCII_UPPER[ord('a'):ord('z') + 1] -= 32
+
+def _lengths_to_offsets(lengths):
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    return offsets
+
+def _gather_bytes(data, starts, lengths):
+    """
+    Joins the byte ranges data[start:start + length] into one buffer
+
+    Returns
+    -------
+    A two-item tuple of the new buffer and the offsets of the ranges in it
+    """
+    offsets = _lengths_to_offsets(lengths)
+    index = np.arange(offsets[-1]) + np.repeat(starts - offsets[:-1], lengths)
+    return data[index], offsets
+
+def _string_array_str_method(values, method, *args):
+    # Runs the string methods that have a kernel on the buffer and every
+    # other method once per string
+    kernel = _STRING_KERNELS.get(method)
+    if kernel is not None and all(arg is None for arg in args[1:]):
+        if not args or isinstance(args[0], str):
+            return getattr(values, kernel)(*args[:1])
+    results = [None if val is None else method(val, *args) for val in values.tolist()]
+    if all(val is None or isinstance(val, str) for val in results):
+        return StringArray(results)
+    return np.array(results)
+
+_STRING_KERNELS = {
+    str.__len__: 'len',
+    str.startswith: 'startswith',
+    str.endswith: 'endswith',
+    str.find: 'find',
+    str.lower: 'lower',
+    str.upper: 'upper',
+}
+
+class NullableArray(np.lib.mixins.NDArrayOperatorsMixin):
+    """
+    A column of ints or bools that can hold missing values. The values keep
+    their own data type and a validity bitmap marks which of them are
+    present, one bit per value packed eight to a byte like in Arrow. Missing
+    values are stored as 0 or False. Elementwise operations and comparisons
+    give missing values wherever an operand is missing.
+
+    Parameters
+    ----------
+    values: 1D NumPy array of ints or bools
+    valid: 1D NumPy array of bools, True where a value is present
+        Optional. Every value is present when None.
+    """
+
+    def __init__(self, values, valid=None):
+        if not isinstance(values, np.ndarray) or values.dtype.kind not in 'iub':
+            raise TypeError('`values` must be a NumPy array of ints or bools')
+        if values.ndim != 1:
+            raise ValueError('`values` must be one-dimensional')
+        if valid is not None:
+            valid = np.asarray(valid, dtype='bool')
+            if valid.shape != values.shape:
+                raise ValueError('`valid` must be the same length as `values`')
+            values = values.copy()
+            values[~valid] = 0
+        self.values = values
+        self.bitmap = _pack_validity(valid)
+
+    @classmethod
+    def _from_valid(cls, values, valid):
+        # Trusted constructor: the values where `valid` is False must be 0
+        arr = cls.__new__(cls)
+        arr.values = values
+        arr.bitmap = _pack_validity(valid)
+        return arr
+
+    @property
+    def valid(self):
+        """
+        Returns
+        -------
+        A NumPy array of bools, True where a value is present
+        """
+        if self.bitmap is None:
+            return np.ones(len(self.values), dtype='bool')
+        return np.unpackbits(self.bitmap, count=len(self.values), bitorder='little').view('bool')
+
+    @property
+    def dtype(self):
+        return self.values.dtype
+
+    @property
+    def ndim(self):
+        return 1
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    @property
+    def size(self):
+        return self.values.size
+
+    @property
+    def nbytes(self):
+        return self.values.nbytes + (0 if self.bitmap is None else self.bitmap.nbytes)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __array__(self, dtype=None, copy=None):
+        # Missing values become NaN for ints and None for bools, as they are
+        # in columns without a bitmap
+        if self.bitmap is None:
+            values = self.values
+        elif self.values.dtype.kind == 'b':
+            values = self.astype('O')
+        else:
+            values = self.astype('float64')
+        if dtype is not None:
+            values = values.astype(dtype)
+        return values
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if method != '__call__' or 'out' in kwargs:
+            # reductions and accumulations see missing values as NaN
+            inputs = [x.astype('float64') if isinstance(x, NullableArray) else x for x in inputs]
+            return getattr(ufunc, method)(*inputs, **kwargs)
+        valid = None
+        raw = []
+        for x in inputs:
+            if isinstance(x, NullableArray):
+                if x.bitmap is not None:
+                    valid = x.valid if valid is None else valid & x.valid
+                x = x.values
+            elif isinstance(x, (Categorical, StringArray)):
+                x = np.asarray(x)
+            raw.append(x)
+        if valid is None:
+            result = ufunc(*raw, **kwargs)
+        else:
+            # the 0s behind missing values may divide by zero
+            with np.errstate(all='ignore'):
+                result = ufunc(*raw, **kwargs)
+        if isinstance(result, tuple):
+            return tuple(_mask_result(part, valid) for part in result)
+        return _mask_result(result, valid)
+
+    def __getitem__(self, item):
+        if isinstance(item, (int, np.integer)):
+            if self.bitmap is not None and not self.valid[item]:
+                return None
+            return self.values[item]
+        values = self.values[item]
+        if self.bitmap is None:
+            return NullableArray._from_valid(values, None)
+        return NullableArray._from_valid(values, self.valid[item])
+
+    def __iter__(self):
+        return iter(self.tolist())
+
+    def __repr__(self):
+        return f'NullableArray({np.array(self.tolist(), dtype="O")!r})'
+
+    def tolist(self):
+        return self.astype('O').tolist()
+
+    def astype(self, dtype):
+        dtype = np.dtype(dtype)
+        values = self.values.astype(dtype)
+        if self.bitmap is None:
+            return values
+        if dtype.kind == 'O':
+            values[~self.valid] = None
+        elif dtype.kind in 'fc':
+            values[~self.valid] = np.nan
+        else:
+            raise ValueError(f'Missing values cannot be converted to {dtype.name}')
+        return values
+
+    def clip(self, a_min=None, a_max=None, out=None, **kwargs):
+        valid = None if self.bitmap is None else self.valid
+        return _mask_result(self.values.clip(a_min, a_max, **kwargs), valid)
+
+    def round(self, decimals=0, out=None):
+        return self.copy()
+
+    def cumsum(self, axis=None, dtype=None, out=None):
+        # missing values make every later sum NaN, as in float columns
+        return np.cumsum(self.astype('float64'))
+
+    def copy(self):
+        bitmap = None if self.bitmap is None else self.bitmap.copy()
+        arr = NullableArray._from_valid(self.values.copy(), None)
+        arr.bitmap = bitmap
+        return arr
+
+    def isna(self):
+        """
+        Returns
+        -------
+        A NumPy array of bools, True where a value is missing
+        """
+        return ~self.valid
+
+    def unique(self):
+        """
+        Returns
+        -------
+        A NumPy array of the sorted distinct values that are present
+        """
+        return np.unique(self.values[self.valid])
+
+    def value_counts(self):
+        """
+        Returns
+        -------
+        A two-item tuple of the distinct values that are present and the
+        number of times each occurs
+        """
+        return np.unique(self.values[self.valid], return_counts=True)
+
+    def _reduce(self, aggfunc):
+        # Aggregates only the values that are present. A column with none
+        # aggregates to a missing value.
+        valid = self.valid
+        if not valid.any():
+            return NullableArray._from_valid(np.zeros(1, dtype=self.values.dtype), np.zeros(1, dtype='bool'))
+        result = aggfunc(self.values[valid])
+        if aggfunc in (np.argmax, np.argmin):
+            result = np.flatnonzero(valid)[result]
+        return np.array([result])
+
+def _set_wrapped_rows(col, values, rows, value):
+    """
+    Writes to the selected rows of a copy of a Categorical, StringArray or
+    NullableArray column
+
+    Returns
+    -------
+    The new column, or None for a NullableArray given values that need
+    floats or objects, which is then written like a plain array
+    """
+    flat = np.atleast_1d(value)
+    all_missing = flat.dtype.kind == 'O' and all(val is None for val in flat.tolist())
+    if isinstance(values, NullableArray):
+        if not all_missing and flat.dtype.kind not in 'iub':
+            return None
+        data = values.values
+        if not all_missing and not np.can_cast(value.dtype, data.dtype, 'same_kind'):
+            # e.g. ints written to a bool column
+            data = data.astype(np.result_type(data.dtype, value.dtype))
+        else:
+            data = data.copy()
+        valid = values.valid.copy()
+        data[rows] = 0 if all_missing else value
+        valid[rows] = not all_missing
+        return NullableArray._from_valid(data, valid)
+
+    if flat.dtype.kind != 'O' or \
+            not all(val is None or isinstance(val, str) for val in flat.tolist()):
+        raise TypeError(f'Column {col!r} only holds strings and None')
+    if isinstance(values, StringArray):
+        strings = np.asarray(values)
+        strings[rows] = value
+        return StringArray(strings)
+
+    # Categorical: new strings become new categories
+    categories = values.categories
+    new = [val for val in set(flat.tolist()) if val is not None]
+    codes = values.codes
+    if new and not np.isin(np.array(new, dtype='O'), categories).all():
+        categories = np.unique(np.concatenate([categories, np.array(new, dtype='O')]))
+        if len(values.categories):
+            remap = np.searchsorted(categories, values.categories)
+            codes = np.where(codes >= 0, remap[codes], -1)
+    codes = codes.astype(_category_code_dtype(len(categories)))
+    new_codes = np.full(len(flat), -1, dtype=codes.dtype)
+    present = np.not_equal(flat, None)
+    new_codes[present] = np.searchsorted(categories, flat[present])
+    codes[rows] = new_codes if value.ndim else new_codes[0]
+    return Categorical._from_codes(codes, categories)
+
+def _pack_validity(valid):
+    # The validity bitmap of a mask, or None when every value is present
+    if valid is None or valid.all():
+        return None
+    return np.packbits(valid, bitorder='little')
+
+def _mask_result(result, valid):
+    # Marks the missing values of the result of an elementwise operation
+    if valid is None:
+        return result
+    kind = result.dtype.kind
+    if kind in 'iub':
+        result[~valid] = 0
+        return NullableArray._from_valid(result, valid)
+    if kind in 'fc':
+        result[~valid] = np.nan
+        return result
+    result = result.astype('O')
+    result[~valid] = None
+    return result
+
+def _concat_arrays(parts):
+    # Joins arrays of one column. Ints or bools with bitmaps stay nullable
+    # when every part has the same kind, Categoricals take the union of the
+    # categories and StringArrays join their buffers.
+    if all(isinstance(part, Categorical) for part in parts):
+        categories = np.unique(np.concatenate([part.categories for part in parts]))
+        codes = []
+        for part in parts:
+            part_codes = np.full(len(part), -1, dtype=_category_code_dtype(len(categories)))
+            present = part.codes >= 0
+            part_codes[present] = np.searchsorted(categories, part.categories)[part.codes[present]]
+            codes.append(part_codes)
+        return Categorical._from_codes(np.concatenate(codes), categories)
+    if all(isinstance(part, StringArray) for part in parts):
+        data = np.concatenate([part.data for part in parts])
+        starts = np.cumsum([0] + [len(part.data) for part in parts[:-1]])
+        offsets = np.concatenate([np.zeros(1, dtype=np.int64)] +
+                                 [part.offsets[1:] + start for part, start in zip(parts, starts)])
+        valid = None
+        if any(part.valid is not None for part in parts):
+            valid = np.concatenate([np.ones(len(part), dtype='bool') if part.valid is None
+                                    else part.valid for part in parts])
+        return StringArray._from_buffers(data, offsets, valid)
+    if not any(isinstance(part, NullableArray) for part in parts):
+        return np.concatenate(parts)
+    kinds = {part.dtype.kind for part in parts}
+    if len(kinds) > 1:
+        return np.concatenate([np.asarray(part) for part in parts])
+    values = np.concatenate([getattr(part, 'values', part) for part in parts])
+    valid = np.concatenate([part.valid if isinstance(part, NullableArray)
+                            else np.ones(len(part), dtype='bool') for part in parts])
+    return NullableArray._from_valid(values, valid)
+
+def merge(left, right, on, how='inner', suffixes=('_x', '_y')):
+    """
+    Joins the rows of two DataFrames that have the same values in the key
+    columns. The keys of both are numbered together, the smaller DataFrame's
+    rows are grouped by key number, and the larger DataFrame's rows each look
+    up their matches in bulk. Every result column is then gathered with one
+    `np.take`. Rows with a missing key match nothing.
+
+    Parameters
+    ----------
+    left: DataFrame
+    right: DataFrame
+    on: str or list of the key column names, which both DataFrames must have
+    how: str, one of
+        'inner': only pairs of rows that match
+        'left': also the rows of `left` that match nothing
+        'outer': also the rows of either DataFrame that match nothing
+    suffixes: two-item tuple of str added to the names of the other columns
+        that both DataFrames have
+
+    Returns
+    -------
+    A DataFrame of the keys, the other columns of `left` and then the other
+    columns of `right`, with the rows in the order of `left` followed by the
+    rows of `right` that match nothing. Columns of a DataFrame that has no
+    match for a row hold missing values there.
+    """
+    if not isinstance(left, DataFrame) or not isinstance(right, DataFrame):
+        raise TypeError('`left` and `right` must be DataFrames')
+    if isinstance(on, str):
+        on = [on]
+    elif not isinstance(on, list) or not on or not all(isinstance(col, str) for col in on):
+        raise TypeError('`on` must be a str or a non-empty list of str')
+    if how not in ('inner', 'left', 'outer'):
+        raise ValueError("`how` must be 'inner', 'left' or 'outer'")
+    for col in on:
+        if col not in left._data or col not in right._data:
+            raise KeyError(f'{col!r} is not a column of both DataFrames')
+
+    num_left = len(left)
+    keys = [_concat_arrays([left._data[col], right._data[col]]) for col in on]
+    codes, _, levels = _factorize_keys(keys)
+    left_codes, right_codes = codes[:num_left], codes[num_left:]
+    ngroups = len(levels[0])
+
+    if num_left >= len(right):
+        left_idx, right_idx = _join_rows(right_codes, left_codes, ngroups, how != 'inner')
+    else:
+        right_idx, left_idx = _join_rows(left_codes, right_codes, ngroups)
+        if how != 'inner':
+            matched = np.bincount(left_idx, minlength=num_left) > 0
+            unmatched = np.flatnonzero(~matched)
+            left_idx = np.concatenate([left_idx, unmatched])
+            right_idx = np.concatenate([right_idx, np.full(len(unmatched), -1)])
+        # back into the order of the left rows
+        order = np.argsort(left_idx, kind='stable')
+        left_idx, right_idx = left_idx[order], right_idx[order]
+    if how == 'outer':
+        matched = np.bincount(right_idx[right_idx >= 0], minlength=len(right)) > 0
+        unmatched = np.flatnonzero(~matched)
+        left_idx = np.concatenate([left_idx, np.full(len(unmatched), -1)])
+        right_idx = np.concatenate([right_idx, unmatched])
+
+    # the keys of each row come from whichever side it has, taken from the
+    # keys of both sides joined end to end
+    positions = np.where(left_idx >= 0, left_idx, num_left + right_idx)
+    new_data = {col: _take_rows(values, positions) for col, values in zip(on, keys)}
+
+    for df, idx, suffix, other in ((left, left_idx, suffixes[0], right),
+                                   (right, right_idx, suffixes[1], left)):
+        for col, values in df._data.items():
+            if col in on:
+                continue
+            name = col + suffix if col in other._data else col
+            new_data[name] = _take_rows(values, idx)
+    return DataFrame._from_dict(new_data)
+
+def _join_rows(build_codes, probe_codes, ngroups, keep_unmatched=False):
+    """
+    Pairs the rows of two sides of a join that have the same key number
+
+    Parameters
+    ----------
+    build_codes: int64 array of the key number of each row of the smaller
+        side, -1 for missing keys
+    probe_codes: int64 array of the same for the larger side
+    ngroups: int of the number of distinct keys
+    keep_unmatched: bool of whether to pair the probe rows that match
+        nothing with -1
+
+    Returns
+    -------
+    A two-item tuple of the probe and build row of each pair, in the order
+    of the probe rows
+    """
+    counts = np.bincount(build_codes + 1, minlength=ngroups + 1)
+    if len(counts) == 1 or counts[1:].max() <= 1:
+        # Each key is on at most one build row, as when joining to a
+        # dimension table, so a table from key number to row is enough
+        rows = np.full(ngroups + 1, -1)
+        present = build_codes >= 0
+        rows[build_codes[present] + 1] = np.flatnonzero(present)
+        build_idx = rows[probe_codes + 1]
+        if keep_unmatched:
+            return np.arange(len(probe_codes)), build_idx
+        probe_idx = np.flatnonzero(build_idx >= 0)
+        return probe_idx, build_idx[probe_idx]
+
+    # Sorting the build rows by key number lays out the rows of each key
+    # together, so that a key's matches are the rows from where its run
+    # starts. Missing keys sort first and are counted in slot 0.
+    order = np.argsort(build_codes, kind='stable')
+    starts = np.cumsum(counts) - counts
+
+    matches = counts[probe_codes + 1]
+    matches[probe_codes < 0] = 0
+    repeats = np.maximum(matches, 1) if keep_unmatched else matches
+    probe_idx = np.repeat(np.arange(len(probe_codes)), repeats)
+    # position of each pair among the pairs of its probe row
+    firsts = np.cumsum(repeats) - repeats
+    within = np.arange(len(probe_idx)) - np.repeat(firsts, repeats)
+    build_pos = np.repeat(starts[probe_codes + 1], repeats) + within
+    if keep_unmatched:
+        unmatched = np.repeat(matches == 0, repeats)
+        build_pos[unmatched] = 0
+    build_idx = order[build_pos] if len(order) else np.zeros(len(build_pos), dtype='intp')
+    if keep_unmatched:
+        build_idx[unmatched] = -1
+    return probe_idx, build_idx
+
+def _take_rows(values, index):
+    """
+    Gathers the rows of a column at the positions of `index` with
+    `np.take`. Positions of -1 give missing values, so ints and bools with
+    any become NullableArrays.
+    """
+    missing = index < 0
+    if not missing.any():
+        if isinstance(values, np.ndarray):
+            return np.take(values, index)
+        return values[index]
+    index = np.where(missing, 0, index)
+    if isinstance(values, Categorical):
+        codes = _take_or_zeros(values.codes, index)
+        codes[missing] = -1
+        return Categorical._from_codes(codes, values.categories)
+    if isinstance(values, StringArray):
+        starts = _take_or_zeros(values.offsets[:-1], index)
+        lengths = _take_or_zeros(np.diff(values.offsets), index)
+        lengths[missing] = 0
+        data, offsets = _gather_bytes(values.data, starts, lengths)
+        valid = ~missing
+        if values.valid is not None:
+            valid &= _take_or_zeros(values.valid, index)
+        return StringArray._from_buffers(data, offsets, valid)
+    if isinstance(values, NullableArray):
+        result = _take_or_zeros(values.values, index)
+        result[missing] = 0
+        return NullableArray._from_valid(result, _take_or_zeros(values.valid, index) & ~missing)
+    result = _take_or_zeros(values, index)
+    kind = result.dtype.kind
+    if kind in 'iub':
+        result[missing] = 0
+        return NullableArray._from_valid(result, ~missing)
+    if kind in 'fc':
+        result[missing] = np.nan
+    elif kind in 'mM':
+        result[missing] = np.datetime64('NaT') if kind == 'M' else np.timedelta64('NaT')
+    else:
+        result = result.astype('O')
+        result[missing] = None
+    return result
+
+def _take_or_zeros(arr, index):
+    # np.take, which cannot take from an empty array even when the values
+    # taken will all be replaced by missing values
+    if len(arr) == 0:
+        return np.zeros(len(index), dtype=arr.dtype)
+    return np.take(arr, index)
 
 # TODO: Handle case of boolean data
 
-def read_csv(file,header=0):
+# Number of bytes read from a CSV file at a time
+_CSV_BLOCKSIZE = 1 << 22
+
+_QUOTE = ord('"')
+_COMMA = ord(',')
+_NEWLINE = ord('\n')
+_CR = ord('\r')
+
+def read_csv(file,header=0,chunksize=None,workers=None,dtype=None,usecols=None,nrows=None):
     """
     Read a simple comma-separated-value(CSV) file as a DataFrame
     Parameters
     ----------
     file: str of file location
     header: index value of header 
+    dtype: dict of column names mapped to data types
+        Optional. These columns are converted straight to the given data type
+        instead of having it inferred. Use 'str' or 'O' for strings,
+        'category' for strings stored as a Categorical and 'string' for
+        strings stored as a StringArray.
+    usecols: list of column names or column positions
+        Optional. Only these columns are read. The other columns are never
+        converted or stored. Columns keep their order in the file.
+    nrows: int of the number of rows to read
+        Optional. Reading stops after that many rows.
+    chunksize: int of the number of rows in each DataFrame
+        Optional. When given, an iterator of DataFrames is returned instead
+        of a single DataFrame. Data types are inferred from the first chunk
+        and every later chunk is converted to the same data types.
+    workers: int of the number of processes that parse the file
+        Optional. The file is split into that many byte ranges, each
+        starting at the beginning of a record, which are parsed in parallel.
+        At most one process per CPU core is used.
     Returns
     -------
-    A DataFrame
+    A DataFrame or an iterator of DataFrames
+    """
+    if nrows is not None:
+        if not isinstance(nrows, int) or isinstance(nrows, bool):
+            raise TypeError('`nrows` must be of type int')
+        if nrows < 0:
+            raise ValueError('`nrows` must be a non-negative integer')
+    if chunksize is not None:
+        if not isinstance(chunksize, int) or isinstance(chunksize, bool):
+            raise TypeError('`chunksize` must be of type int')
+        if chunksize < 1:
+            raise ValueError('`chunksize` must be a positive integer')
+        if workers is not None:
+            raise ValueError('`chunksize` and `workers` cannot be used together')
+        # open the file and read the header now, so errors are raised here
+        # rather than on the first chunk
+        column_names, blocks = _read_csv_blocks(file, header)
+        try:
+            usecols, dtypes = _csv_schema(column_names, usecols, dtype)
+        except BaseException:
+            blocks.close()
+            raise
+        if nrows is not None:
+            blocks = _head_csv_blocks(blocks, nrows)
+        return _read_csv_chunks(column_names, blocks, chunksize, usecols, dtypes)
+
+    if workers is not None:
+        if not isinstance(workers, int) or isinstance(workers, bool):
+            raise TypeError('`workers` must be of type int')
+        if workers < 1:
+            raise ValueError('`workers` must be a positive integer')
+        # more processes than cores only adds overhead
+        workers = min(workers, os.cpu_count() or 1)
+        # the first rows are read faster by a single process
+        if workers > 1 and nrows is None:
+            return _read_csv_parallel(file, header, workers, usecols, dtype)
+
+    column_names, blocks = _read_csv_blocks(file, header)
+    try:
+        usecols, dtypes = _csv_schema(column_names, usecols, dtype)
+    except BaseException:
+        blocks.close()
+        raise
+    if nrows is not None:
+        blocks = _head_csv_blocks(blocks, nrows)
+    return DataFrame(_parse_csv_blocks(blocks, column_names, dtypes, usecols=usecols))
+
+def _csv_schema(column_names, usecols, dtype):
     """
-    from collections import defaultdict
-    data = defaultdict(list)
-    with open(file) as f:
-        reader = csv.reader(f, delimiter=',', skipinitialspace=True)
-        if header == None:
-            with open(file) as nc:
-                readers = csv.reader(nc, delimiter=',', skipinitialspace=True)
-                first_row = next(readers)
-                num_cols = len(first_row)
-                column_names = [str(n) for n in range(0,num_cols)]  
-            for line in f:
-                values = line.strip('\n').split(',')
-                for col, val in zip(column_names, values):
-                    data[col].append(val)    
-        elif header != 0:
-            for header in range(0,header):
-                skip_header_number = next(reader)
-                num_cols = len(skip_header_number)
-                column_names = [str(n) for n in range(0,num_cols)]  
-            for line in f:
-                values = line.strip('\n').split(',')
-                for col, val in zip(column_names, values):
-                    data[col].append(val)    
-        else:   
-            header = f.readline()
-            column_names = header.strip('\n').split(',')    
-            for line in f:
-                values = line.strip('\n').split(',')
-                for col, val in zip(column_names, values):
-                    data[col].append(val)
+    Checks the `usecols` and `dtype` arguments of `read_csv`
+
+    Returns
+    -------
+    A two-item tuple of the list of column names to read, in file order, and
+    a dict of column names mapped to NumPy data types, 'category' or 'string'
+    """
+    usecols = _select_columns(column_names, usecols)
+    if dtype is None:
+        dtype = {}
+    if not isinstance(dtype, dict):
+        raise TypeError('`dtype` must be a dict of column names mapped to data types')
+    dtypes = {}
+    for col, col_dtype in dtype.items():
+        if col not in column_names:
+            raise ValueError(f'Column {col!r} is not in the CSV file')
+        if isinstance(col_dtype, str) and col_dtype in ('category', 'string'):
+            dtypes[col] = col_dtype
+            continue
+        col_dtype = np.dtype(col_dtype)
+        if col_dtype.kind == 'U':
+            # strings are stored as objects, like in `DataFrame`
+            col_dtype = np.dtype('O')
+        dtypes[col] = col_dtype
+    return usecols, dtypes
+
+def _select_columns(column_names, usecols):
+    """
+    Checks a `usecols` argument of column names or positions
+
+    Returns
+    -------
+    A list of the selected column names in file order
+    """
+    if usecols is None:
+        return column_names
+    if isinstance(usecols, (str, int)) or not hasattr(usecols, '__iter__'):
+        raise TypeError('`usecols` must be a list of column names or positions')
+    wanted = set()
+    for col in usecols:
+        if isinstance(col, bool) or not isinstance(col, (str, int)):
+            raise TypeError('`usecols` must be a list of column names or positions')
+        if isinstance(col, int):
+            if not 0 <= col < len(column_names):
+                raise ValueError(f'Column position {col} is out of range')
+            col = column_names[col]
+        elif col not in column_names:
+            raise ValueError(f'Column {col!r} is not in the file')
+        wanted.add(col)
+    return [col for col in column_names if col in wanted]
+
+def _head_csv_blocks(blocks, nrows):
+    # Yields blocks up to a total of `nrows` records and stops reading the file
+    try:
+        if nrows == 0:
+            return
+        for arr, starts, ends in blocks:
+            yield arr, starts[:nrows], ends[:nrows]
+            nrows -= len(starts)
+            if nrows <= 0:
+                break
+    finally:
+        blocks.close()
+
+def _parse_csv_blocks(blocks, column_names, dtypes=None, decode=True, usecols=None):
+    """
+    Parses blocks of a CSV file into one NumPy array per column
+
+    Parameters
+    ----------
+    blocks: iterator of blocks from `_iter_csv_blocks`
+    column_names: list of column names
+    dtypes: dict of column names mapped to NumPy data types
+        Optional. Columns not in `dtypes` have their data type inferred.
+    decode: bool
+        When False, string columns are returned as their raw bytes fields
+    usecols: list of the column names to parse
+        Optional. All columns are parsed when None.
+
+    Returns
+    -------
+    A dict of column names mapped to arrays
+    """
+    if dtypes is None:
+        dtypes = {}
+    if usecols is None:
+        usecols = column_names
+    positions = [column_names.index(col) for col in usecols]
+    # Raw fields of every block, one list of bytes arrays per column
+    parts = {col: [] for col in usecols}
+    for block in blocks:
+        for i, col in zip(positions, usecols):
+            parts[col].append(_csv_block_column(block, i))
+
     new_data = {}
-    # vals is a list of strings
-    for col, vals in data.items():
+    for col in usecols:
+        # pop so the raw fields of a column are freed once it is converted
+        new_data[col] = _convert_csv_column(col, parts.pop(col), dtypes.get(col), decode)
+    return new_data
+
+def _convert_csv_column(col, parts, dtype=None, decode=True):
+    # `_convert_csv_fields` with an error that names the column
+    if dtype is None:
+        return _convert_csv_fields(parts, decode=decode)
+    try:
+        return _convert_csv_fields(parts, dtype, decode)
+    except (ValueError, OverflowError):
+        raise ValueError(f'Column {col!r} has values that cannot be '
+                         f'converted to {dtype.name}') from None
+
+def _read_csv_parallel(file, header, workers, usecols=None, dtype=None):
+    # Splits the data of the file into byte ranges that each start at the
+    # beginning of a record and parses them in a pool of processes
+    from concurrent.futures import ProcessPoolExecutor
+
+    with open(file, 'rb') as f:
+        column_names, leftover = _read_csv_header(f, header, _CSV_BLOCKSIZE)
+        data_start = f.tell() - len(leftover)
+    usecols, dtypes = _csv_schema(column_names, usecols, dtype)
+    ranges = _csv_byte_ranges(file, data_start, workers)
+    if len(ranges) < 2:
+        with open(file, 'rb') as f:
+            f.seek(data_start)
+            blocks = _iter_csv_blocks(f, b'', len(column_names), _CSV_BLOCKSIZE)
+            return DataFrame(_parse_csv_blocks(blocks, column_names, dtypes, usecols=usecols))
+
+    with ProcessPoolExecutor(max_workers=len(ranges)) as pool:
+        # String columns come back as raw bytes, which are much cheaper to
+        # send between processes than arrays of Python strings
+        args = [(file, start, stop, column_names, dtypes, None, usecols) for start, stop in ranges]
+        results = list(pool.map(_read_csv_range, *zip(*args)))
+
+        # A column read as numbers in some ranges and as text in others is a
+        # string column. Only those columns of those ranges are read again
+        # as text, since the numbers no longer have their original text.
+        text_cols = [col for col in usecols
+                     if any(result[col].dtype.kind in 'SO' for result in results)]
+        redo = {}
+        for i, result in enumerate(results):
+            cols = [col for col in text_cols if result[col].dtype.kind not in 'SO']
+            if cols:
+                redo[i] = cols
+        if redo:
+            args = [(file, *ranges[i], column_names, None, cols) for i, cols in redo.items()]
+            for i, texts in zip(redo, pool.map(_read_csv_range, *zip(*args))):
+                results[i].update(texts)
+
+    new_data = {}
+    for col in usecols:
+        parts = [result.pop(col) for result in results]
+        if dtypes.get(col) == 'category':
+            new_data[col] = _categorize_csv_strings(parts)
+        elif dtypes.get(col) == 'string':
+            new_data[col] = _csv_string_array(parts)
+        elif col in text_cols:
+            new_data[col] = _decode_csv_strings(parts)
+        else:
+            new_data[col] = _concat_csv_ranges(parts)
+    return DataFrame(new_data)
+
+def _concat_csv_ranges(parts):
+    # Joins the numbers read from each byte range of a column. A range whose
+    # fields were all empty was read as NaNs, but in a column of ints or
+    # bools those are missing values, as when one process reads the file.
+    floats = [part for part in parts if part.dtype.kind == 'f']
+    others = {part.dtype for part in parts if part.dtype.kind != 'f'}
+    if floats and len(others) == 1 and next(iter(others)).kind in 'ib':
+        dtype = others.pop()
+        if all(np.isnan(part).all() for part in floats):
+            parts = [NullableArray._from_valid(np.zeros(len(part), dtype=dtype),
+                                               np.zeros(len(part), dtype='bool'))
+                     if part.dtype.kind == 'f' else part for part in parts]
+    # An int parsed as float gives the same value as converting the int, so
+    # ranges read as ints can simply be cast
+    return _concat_arrays(parts)
+
+def _csv_byte_ranges(file, start, num_ranges):
+    """
+    Splits the bytes from `start` to the end of the file into about equal
+    ranges that each start at the beginning of a record. Newlines inside
+    quoted fields are never used as split points.
+
+    Returns
+    -------
+    A list of two-item tuples of the start and stop offset of each range
+    """
+    size = os.path.getsize(file)
+    targets = [start + (size - start) * i // num_ranges for i in range(1, num_ranges)]
+    bounds = [start]
+    with open(file, 'rb') as f:
+        f.seek(start)
+        # `buf` always begins at a record, at file offset `offset`
+        offset = start
+        buf = b''
+        while targets:
+            chunk = f.read(_CSV_BLOCKSIZE)
+            if not chunk:
+                break
+            buf += chunk
+            if b'"' in buf:
+                # the quote state is only known by scanning from a record start
+                record_starts = offset + _csv_record_ends(buf) + 1
+                last = record_starts[-1] if len(record_starts) else offset
+                while targets and targets[0] < last:
+                    target = targets.pop(0)
+                    bounds.append(int(record_starts[np.searchsorted(record_starts, target)]))
+            else:
+                last = offset + buf.rfind(b'\n') + 1
+                while targets and targets[0] < last:
+                    target = targets.pop(0)
+                    pos = max(target, offset + 1)
+                    bounds.append(offset + buf.find(b'\n', pos - offset - 1) + 1)
+            buf = buf[last - offset:]
+            offset = last
+    bounds.append(size)
+    # drop empty ranges
+    bounds = sorted(set(bounds))
+    return list(zip(bounds[:-1], bounds[1:]))
+
+def _read_csv_range(file, start, stop, column_names, dtypes=None, text_cols=None, usecols=None):
+    # Runs in a worker process of `read_csv(workers=...)`. When `text_cols` is
+    # given, only the raw fields of those columns are returned.
+    with open(file, 'rb') as f:
+        f.seek(start)
+        blocks = _iter_csv_blocks(f, b'', len(column_names), _CSV_BLOCKSIZE, stop - start)
+        if text_cols is None:
+            return _parse_csv_blocks(blocks, column_names, dtypes, decode=False, usecols=usecols)
+        parts = {col: [] for col in text_cols}
+        for block in blocks:
+            for col in text_cols:
+                parts[col].append(_csv_block_column(block, column_names.index(col)))
+    return {col: _concat_csv_fields(col_parts) for col, col_parts in parts.items()}
+
+def _read_csv_chunks(column_names, blocks, chunksize, usecols=None, dtypes=None):
+    # Generator behind `read_csv(chunksize=...)`. Only the raw fields of one
+    # chunk and one block are held in memory at any time.
+    if usecols is None:
+        usecols = column_names
+    positions = [column_names.index(col) for col in usecols]
+    hints = dtypes or {}
+    dtypes = {}
+    parts = {col: [] for col in usecols}
+    num_rows = 0
+    for block in blocks:
+        fields = [_csv_block_column(block, i) for i in positions]
+        block_rows = len(block[1])
+        start = 0
+        while start < block_rows:
+            stop = min(start + chunksize - num_rows, block_rows)
+            for col, values in zip(usecols, fields):
+                parts[col].append(values[start:stop])
+            num_rows += stop - start
+            start = stop
+            if num_rows == chunksize:
+                new_data, dtypes = _convert_csv_chunk(parts, dtypes, hints)
+                yield DataFrame(new_data)
+                parts = {col: [] for col in usecols}
+                num_rows = 0
+    if num_rows > 0:
+        new_data, dtypes = _convert_csv_chunk(parts, dtypes, hints)
+        yield DataFrame(new_data)
+
+def _convert_csv_chunk(parts, dtypes=None, hints=None):
+    # Converts the raw fields of one chunk. The data type of each column is
+    # fixed by the first chunk in which it has a non-empty field, and the
+    # data types fixed so far are returned to be passed back in for the next
+    # chunk. Columns in `hints` always use the data type given to `read_csv`.
+    if hints is None:
+        hints = {}
+    dtypes = {} if dtypes is None else dtypes.copy()
+    new_data = {}
+    for col, col_parts in parts.items():
+        if col in hints or col not in dtypes:
+            new_data[col] = _convert_csv_column(col, col_parts, hints.get(col))
+            # a column of only empty fields is read as NaNs until a value
+            # says what it holds
+            if col not in hints and any((part != b'').any() for part in col_parts):
+                dtypes[col] = new_data[col].dtype
+            continue
         try:
-            new_data[col] = np.array(vals, dtype='int')
-        except ValueError:
+            new_data[col] = _convert_csv_fields(col_parts, dtypes[col])
+        except (ValueError, OverflowError):
+            raise ValueError(f'Column {col!r} was read as {dtypes[col].name} from the '
+                             'first chunk but has values that cannot be converted to it')
+    return new_data, dtypes
+
+def _read_csv_blocks(file, header, blocksize=None):
+    """
+    Opens a CSV file and reads its header
+
+    Returns
+    -------
+    A two-item tuple of the list of column names and an iterator of parsed
+    blocks. See `_split_csv_block` for the layout of a block.
+    """
+    if blocksize is None:
+        blocksize = _CSV_BLOCKSIZE
+    f = open(file, 'rb')
+    try:
+        column_names, leftover = _read_csv_header(f, header, blocksize)
+    except BaseException:
+        f.close()
+        raise
+    return column_names, _iter_csv_blocks(f, leftover, len(column_names), blocksize)
+
+def _read_csv_header(f, header, blocksize):
+    # Returns the column names and the bytes read past the header
+    # number of records to read, the last one of which names the columns
+    num_records = header if header else 1
+
+    buf = f.read(blocksize)
+    if buf.startswith(b'\xef\xbb\xbf'):
+        buf = buf[3:]
+    while True:
+        ends = _csv_record_ends(buf)
+        if len(ends) >= num_records:
+            break
+        chunk = f.read(blocksize)
+        if not chunk:
+            # the last record does not have to end with a newline
+            ends = np.append(ends, len(buf))
+            break
+        buf += chunk
+    if len(ends) < num_records or not buf:
+        raise ValueError('The CSV file does not have enough lines for `header`')
+
+    end = ends[num_records - 1]
+    start = ends[num_records - 2] + 1 if num_records > 1 else 0
+    record = buf[start:end].decode('utf-8').rstrip('\r')
+    names = next(csv.reader([record], delimiter=','))
+    if header is None:
+        return [str(n) for n in range(0,len(names))], buf
+    elif header != 0:
+        return [str(n) for n in range(0,len(names))], buf[end + 1:]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f'The CSV header names these columns more than once: {duplicates}')
+    return names, buf[end + 1:]
+
+def _iter_csv_blocks(f, leftover, num_cols, blocksize, size=None):
+    # Yields parsed blocks that always end on a record boundary. A record cut
+    # off at the end of a block is carried over to the next one. When `size`
+    # is given, only that many bytes are read from `f`.
+    with f:
+        while True:
+            if size is None:
+                chunk = f.read(blocksize)
+            else:
+                chunk = f.read(min(blocksize, size))
+                size -= len(chunk)
+            buf = leftover + chunk
+            if not chunk:
+                if buf.strip():
+                    block, _ = _split_csv_block(buf, num_cols, final=True)
+                    if block is not None:
+                        yield block
+                return
+            block, consumed = _split_csv_block(buf, num_cols, final=False)
+            leftover = buf[consumed:]
+            if block is not None:
+                yield block
+
+def _csv_outside_quotes(arr):
+    """
+    Finds the bytes that are not inside a quoted field. A quote only starts a
+    quoted field when it is the first byte of the field, so a stray quote in
+    the middle of an unquoted field (like 5" pipe) is kept as text. `arr`
+    must start at the beginning of a record.
+
+    Returns
+    -------
+    A NumPy array of booleans the same length as `arr`
+    """
+    quotes = np.flatnonzero(arr == _QUOTE)
+    # In well formed data every quote at an even position in `quotes` opens a
+    # field, so it follows a separator. An escaped quote ("") flips the state
+    # twice and needs no special handling.
+    before = arr[np.maximum(quotes - 1, 0)]
+    opens = (quotes == 0) | (before == _COMMA) | (before == _NEWLINE) | (before == _QUOTE)
+    if opens[::2].all():
+        return ~np.logical_xor.accumulate(arr == _QUOTE)
+
+    # Otherwise walk over the quotes only, skipping the stray ones
+    toggles = np.zeros(len(arr), dtype='bool')
+    inside = False
+    skip = False
+    for i, pos in enumerate(quotes.tolist()):
+        if skip:
+            skip = False
+        elif inside:
+            if pos + 1 < len(arr) and arr[pos + 1] == _QUOTE:
+                # an escaped quote
+                skip = True
+            else:
+                inside = False
+                toggles[pos] = True
+        elif pos == 0 or before[i] == _COMMA or before[i] == _NEWLINE:
+            inside = True
+            toggles[pos] = True
+    return ~np.logical_xor.accumulate(toggles)
+
+def _csv_record_ends(buf):
+    # Positions of the newlines that end a record
+    arr = np.frombuffer(buf, dtype=np.uint8)
+    is_newline = arr == _NEWLINE
+    if b'"' in buf:
+        is_newline &= _csv_outside_quotes(arr)
+    return np.flatnonzero(is_newline)
+
+def _split_csv_block(buf, num_cols, final):
+    """
+    Finds every field of a block of CSV bytes at once
+
+    Parameters
+    ----------
+    buf: bytes of one or more records
+    num_cols: int of the expected number of fields in each record
+    final: bool of whether `buf` is the end of the file. Otherwise a trailing
+        record without a newline is left unparsed.
+
+    Returns
+    -------
+    A two-item tuple of the block and the number of bytes consumed. The block is
+    a tuple of the bytes as a uint8 array with eight extra zero bytes at the end and
+    two 2D arrays with the start and end offset of each field (rows by columns).
+    The block is None if `buf` does not hold a complete record.
+    """
+    padded = np.frombuffer(buf + bytes(8), dtype=np.uint8)
+    arr = padded[:-8]
+    is_newline = arr == _NEWLINE
+    is_sep = is_newline | (arr == _COMMA)
+    if b'"' in buf:
+        outside = _csv_outside_quotes(arr)
+        is_newline &= outside
+        is_sep &= outside
+    ends = np.flatnonzero(is_sep)
+    row_ends = is_newline[ends]
+
+    if final:
+        if len(ends) == 0 or ends[-1] != len(arr) - 1 or not row_ends[-1]:
+            ends = np.append(ends, len(arr))
+            row_ends = np.append(row_ends, True)
+        consumed = len(arr)
+    else:
+        last = np.flatnonzero(row_ends)
+        if len(last) == 0:
+            return None, 0
+        ends = ends[:last[-1] + 1]
+        row_ends = row_ends[:last[-1] + 1]
+        consumed = ends[-1] + 1
+
+    starts = np.empty_like(ends)
+    starts[0] = 0
+    starts[1:] = ends[:-1] + 1
+
+    # Drop the carriage return of Windows line endings
+    nl = np.flatnonzero(row_ends)
+    crlf = nl[(ends[nl] > starts[nl]) & (arr[ends[nl] - 1] == _CR)]
+    ends[crlf] -= 1
+
+    # Number of fields in each record. Blank lines are skipped.
+    record_lengths = np.diff(nl, prepend=-1)
+    blank = (record_lengths == 1) & (ends[nl] == starts[nl])
+    if blank.any():
+        keep = np.ones(len(ends), dtype='bool')
+        keep[nl[blank]] = False
+        starts = starts[keep]
+        ends = ends[keep]
+        record_lengths = record_lengths[~blank]
+    bad = np.flatnonzero(record_lengths != num_cols)
+    if len(bad) > 0:
+        raise ValueError(f'Expected {num_cols} fields in each line but found '
+                         f'a line with {record_lengths[bad[0]]}')
+    if len(record_lengths) == 0:
+        return None, consumed
+    return (padded, starts.reshape(-1, num_cols), ends.reshape(-1, num_cols)), consumed
+
+# _BYTE_MASKS[n] keeps the first n bytes of a little-endian 64-bit word
+_BYTE_MASKS = np.array([(1 << (8 * n)) - 1 for n in range(9)], dtype='<u8')
+
+def _csv_block_column(block, i):
+    """
+    Gathers the fields of the ith column of a block into a NumPy bytes array.
+    Quotes around fields are removed and escaped quotes are unescaped.
+    """
+    arr, starts, ends = block
+    # the last eight bytes of `arr` are zeros that pad every field
+    pad = len(arr) - 8
+    starts = starts[:, i]
+    ends = ends[:, i]
+    first = arr[starts]
+    last = arr[np.maximum(ends - 1, 0)]
+    quoted = (ends - starts >= 2) & (first == _QUOTE) & (last == _QUOTE)
+    if quoted.any():
+        starts = starts + quoted
+        ends = ends - quoted
+
+    lengths = ends - starts
+    width = max(int(lengths.max(initial=0)), 1)
+    if width * len(lengths) > 4 * pad + 1024:
+        # A few very long fields would make the padded array huge, so fall
+        # back to slicing each field
+        buf = arr.tobytes()
+        fields = [buf[s:e] for s, e in zip(starts.tolist(), ends.tolist())]
+        fields = np.array(fields, dtype='O')
+    else:
+        # Read eight bytes at a time through a view with one (unaligned)
+        # 64-bit word starting at every byte, one row per word position,
+        # which keeps every step working along the long axis
+        words = np.ndarray(shape=(pad + 1,), dtype='<u8', buffer=arr, strides=(1,))
+        num_words = -(-width // 8)
+        positions = 8 * np.arange(num_words)[:, None]
+        index = positions + starts
+        np.minimum(index, pad, out=index)
+        chunks = words[index]
+        # zero the bytes past the end of each field
+        remaining = np.clip(lengths - positions, 0, 8)
+        chunks &= _BYTE_MASKS[remaining]
+        fields = chunks.T.copy().view(f'S{8 * num_words}').ravel()
+        if 8 * num_words != width:
+            fields = fields.astype(f'S{width}')
+
+    if quoted.any():
+        for j in np.flatnonzero(quoted):
+            if b'""' in fields[j]:
+                fields[j] = fields[j].replace(b'""', b'"')
+    return fields
+
+def _convert_csv_fields(parts, dtype=None, decode=True):
+    """
+    Converts the raw fields of one column into a single NumPy array
+
+    Parameters
+    ----------
+    parts: list of NumPy arrays of bytes, one per block
+    dtype: NumPy data type, 'category' or 'string'
+        Optional. When None, int is tried first, then float, then strings.
+    decode: bool
+        When False, a column of strings is returned as its raw fields
+
+    Returns
+    -------
+    A NumPy array, a Categorical, a StringArray or, for ints and bools with
+    empty fields, a NullableArray
+    """
+    if isinstance(dtype, str) and dtype in ('category', 'string'):
+        if not decode:
+            return _concat_csv_fields(parts)
+        if dtype == 'string':
+            return _csv_string_array(parts)
+        return _categorize_csv_strings(parts)
+    if dtype is not None:
+        dtype = np.dtype(dtype)
+        if dtype.kind == 'O' and not decode:
+            return _concat_csv_fields(parts)
+        return _fill_csv_buffer(parts, dtype)
+    # Fields too long to pad can only be strings
+    if not any(part.dtype.kind == 'O' for part in parts):
+        for dtype in ('int', 'float'):
             try:
-                new_data[col] = np.array(vals, dtype='float')
-            except ValueError:
-                new_data[col] = np.array(vals, dtype='O')
-    return DataFrame(new_data)
+                values = _fill_csv_buffer(parts, np.dtype(dtype))
+            except (ValueError, OverflowError):
+                continue
+            if isinstance(values, NullableArray) and not values.valid.any():
+                # a column of only empty fields is read as NaNs
+                continue
+            return values
+    if not decode:
+        return _concat_csv_fields(parts)
+    return _fill_csv_buffer(parts, np.dtype('O'))
+
+def _concat_csv_fields(parts):
+    # Joins the raw fields of the blocks of a column
+    if not parts:
+        return np.empty(0, dtype='S1')
+    return np.concatenate(parts)
+
+def _fill_csv_buffer(parts, dtype):
+    # Converts each block straight into its slice of one preallocated array.
+    # Empty fields of ints and bools are marked as missing in a bitmap.
+    if dtype.kind == 'O':
+        return _decode_csv_strings(parts)
+    values = np.empty(sum(len(part) for part in parts), dtype=dtype)
+    valid = None
+    start = 0
+    for part in parts:
+        stop = start + len(part)
+        if dtype.kind in 'ib':
+            missing = part == b''
+            if missing.any():
+                if valid is None:
+                    valid = np.ones(len(values), dtype='bool')
+                valid[start:stop] = ~missing
+                values[start:stop] = 0
+                values[start:stop][~missing] = _parse_csv_part(part[~missing], dtype)
+                start = stop
+                continue
+        values[start:stop] = _parse_csv_part(part, dtype)
+        start = stop
+    if valid is not None:
+        return NullableArray._from_valid(values, valid)
+    return values
+
+def _parse_csv_part(fields, dtype):
+    if dtype.kind == 'i':
+        values = _parse_csv_ints(fields)
+        # the ints are parsed as int64, which NumPy would wrap around when
+        # storing them in a narrower type
+        info = np.iinfo(dtype)
+        if len(values) and (values.min() < info.min or values.max() > info.max):
+            raise OverflowError(f'Values out of the range of {dtype.name}')
+        return values
+    if dtype.kind == 'f':
+        return _parse_csv_floats(fields)
+    if dtype.kind == 'b':
+        return _parse_csv_bools(fields)
+    return fields.astype(dtype)
+
+def _decode_csv_strings(parts):
+    """
+    Decodes the raw fields of a string column into an object array. Each
+    distinct value is decoded only once, so a column with few distinct values
+    (like a department or a gender) creates only a few Python strings.
+    """
+    decoded, inverse = _factorize_csv_strings(parts)
+    if inverse is None:
+        return decoded
+    return decoded[inverse]
+
+def _categorize_csv_strings(parts):
+    # Stores the raw fields of a string column as a Categorical. Only the
+    # distinct values are decoded and sorted.
+    decoded, inverse = _factorize_csv_strings(parts)
+    categories, codes = np.unique(decoded, return_inverse=True)
+    codes = codes.ravel().astype(_category_code_dtype(len(categories)))
+    if inverse is not None:
+        codes = codes[inverse]
+    return Categorical._from_codes(codes, categories)
+
+def _csv_string_array(parts):
+    # Copies the raw fields of a string column straight into the buffer of a
+    # StringArray without creating Python strings
+    datas = []
+    lengths = []
+    for part in parts:
+        if part.dtype.kind == 'O':
+            # fields too long to pad
+            datas.append(np.frombuffer(b''.join(part.tolist()), dtype=np.uint8))
+            lengths.append(np.array([len(val) for val in part.tolist()], dtype=np.int64))
+            continue
+        width = part.dtype.itemsize
+        chars = part.view(np.uint8).reshape(len(part), width)
+        # fields are padded with zeros at the end
+        nonzero = chars != 0
+        part_lengths = width - np.argmax(nonzero[:, ::-1], axis=1)
+        part_lengths[~nonzero.any(axis=1)] = 0
+        datas.append(chars[np.arange(width) < part_lengths[:, None]])
+        lengths.append(part_lengths.astype(np.int64))
+    if not datas:
+        return StringArray([])
+    return StringArray._from_buffers(np.concatenate(datas), _lengths_to_offsets(np.concatenate(lengths)))
+
+def _factorize_csv_strings(parts):
+    """
+    Decodes the distinct raw fields of a string column
+
+    Returns
+    -------
+    A two-item tuple of an object array of decoded strings and the position
+    of each field among them. The positions are None when every field was
+    decoded.
+    """
+    if any(part.dtype.kind == 'O' for part in parts):
+        # fields too long to pad
+        values = np.empty(sum(len(part) for part in parts), dtype='O')
+        values[:] = [val.decode('utf-8') for part in parts for val in part.tolist()]
+        return values, None
+    fields = _concat_csv_fields(parts)
+    if len(fields) == 0:
+        return np.empty(0, dtype='O'), None
+
+    # Hash each field 8 bytes at a time
+    width = -(-fields.dtype.itemsize // 8) * 8
+    words = fields.astype(f'S{width}').view(np.uint64).reshape(len(fields), -1)
+    hashes = words[:, 0].copy()
+    for k in range(1, words.shape[1]):
+        hashes *= np.uint64(0x100000001b3)
+        hashes ^= words[:, k]
+
+    # Most string columns have few distinct values and they nearly always all
+    # show up in the first rows, so try to look up every hash among the
+    # distinct hashes of a sample before sorting all of them
+    uniques, first = np.unique(hashes[:1024], return_index=True)
+    inverse = np.minimum(np.searchsorted(uniques, hashes), len(uniques) - 1)
+    if (uniques[inverse] != hashes).any():
+        uniques, first, inverse = np.unique(hashes, return_index=True, return_inverse=True)
+    representatives = fields[first]
+    if len(uniques) > len(fields) // 2 or (representatives[inverse] != fields).any():
+        # mostly distinct values, or two values with the same hash
+        representatives = fields
+        inverse = None
+    decoded = np.empty(len(representatives), dtype='O')
+    decoded[:] = [val.decode('utf-8') for val in representatives.tolist()]
+    if inverse is None:
+        return decoded, None
+    return decoded, inverse.ravel()
+
+# Powers of ten that fit in an int64
+_POW10 = 10 ** np.arange(19, dtype=np.int64)
+
+def _parse_csv_number(fields, allow_point):
+    """
+    Parses fields made of an optional sign, digits and, if `allow_point` is
+    True, one optional decimal point. All fields are parsed at once, one
+    character position at a time.
+
+    Parameters
+    ----------
+    fields: NumPy array of bytes
+    allow_point: bool
+
+    Returns
+    -------
+    A three-item tuple of the integer of all the digits, the number of digits
+    after the decimal point and whether the number is negative. None if any
+    field does not match or has too many digits to be parsed exactly.
+    """
+    width = fields.dtype.itemsize
+    if width > 18:
+        return None
+    # one row per character position, so each step works on contiguous memory
+    chars = fields.view(np.uint8).reshape(len(fields), width).T.copy()
+    digits = chars - np.uint8(ord('0'))
+    is_digit = digits < 10
+    is_pad = chars == 0
+    valid = is_digit | is_pad
+    valid[0] |= (chars[0] == ord('-')) | (chars[0] == ord('+'))
+    if allow_point:
+        is_point = chars == ord('.')
+        valid |= is_point
+    if not (valid.all() and is_digit.any(axis=0).all()):
+        return None
+    if allow_point:
+        if (is_point.sum(axis=0) > 1).any():
+            return None
+        # at most 15 digits always fit exactly in a float64
+        if width > 15 and (is_digit.sum(axis=0) > 15).any():
+            return None
+
+    # Signs, points and the padding after each field count as zero digits
+    digits[~is_digit] = 0
+    number = np.zeros(len(fields), dtype=np.int64)
+    for k in range(width):
+        number *= 10
+        number += digits[k]
+    num_pad = is_pad.sum(axis=0)
+    number //= _POW10[num_pad]
+
+    scale = np.zeros(len(fields), dtype=np.int64)
+    if allow_point:
+        has_point = is_point.any(axis=0)
+        scale[has_point] = (width - num_pad - 1 - np.argmax(is_point, axis=0))[has_point]
+        # drop the zero digit of the point
+        low = number % _POW10[scale]
+        number = np.where(has_point, number // _POW10[scale + 1] * _POW10[scale] + low, number)
+    return number, scale, chars[0] == ord('-')
+
+def _parse_csv_ints(fields):
+    if fields.dtype.kind == 'S' and len(fields) > 0:
+        parsed = _parse_csv_number(fields, allow_point=False)
+        if parsed is not None:
+            number, _, negative = parsed
+            return np.where(negative, -number, number)
+    return fields.astype('int')
+
+def _parse_csv_bools(fields):
+    is_true = np.isin(fields, [b'True', b'true', b'TRUE', b'1'])
+    is_false = np.isin(fields, [b'False', b'false', b'FALSE', b'0'])
+    if not (is_true | is_false).all():
+        raise ValueError('Fields must be True, False, 1 or 0 to be read as bools')
+    return is_true
+
+def _parse_csv_floats(fields):
+    if fields.dtype.kind != 'S' or len(fields) == 0:
+        return fields.astype('float')
+    # empty fields are missing values
+    empty = fields == b''
+    values = np.full(len(fields), np.nan)
+    text = fields[~empty]
+    if len(text) == 0:
+        return values
+    parsed = _parse_csv_number(text, allow_point=True)
+    if parsed is not None:
+        # Both numbers are exact in a float64, so the division is
+        # correctly rounded, just like parsing the text
+        number, scale, negative = parsed
+        parsed = number / _POW10[scale]
+        parsed[negative] *= -1
+        values[~empty] = parsed
+    else:
+        values[~empty] = text.astype('float')
+    return values
+
+
+# Number of rows formatted at a time by `to_csv`
+_CSV_WRITE_CHUNKSIZE = 1 << 16
 
+def _format_csv_column(values):
+    """
+    Formats the values of a column as CSV fields. Missing values become
+    empty fields and strings with commas, quotes or newlines are quoted.
+
+    Returns
+    -------
+    A three-item tuple of a 2D uint8 array of bytes (rows by bytes) and the
+    start and length of the field within each row of it. Columns of strings
+    whose lengths vary too much to pad give a 1D array of the bytes of all
+    fields instead, and the starts are positions in it.
+    """
+    if isinstance(values, Categorical):
+        # format each category once and look the fields up by code
+        labels = values._labels()
+        chars, starts, lengths = _format_csv_column(labels)
+        # missing values look up the last label
+        index = np.where(values.codes < 0, len(labels) - 1, values.codes)
+        if chars.ndim == 2:
+            # the rows of the labels, laid end to end, as one buffer
+            starts = starts + chars.shape[1] * np.arange(len(labels))
+            chars = chars.ravel()
+        return chars, starts[index], lengths[index]
+    if isinstance(values, NullableArray):
+        chars, starts, lengths = _format_csv_column(values.values)
+        if values.bitmap is not None:
+            # missing values are empty fields
+            lengths = np.where(values.valid, lengths, 0)
+        return chars, starts, lengths
+    kind = values.dtype.kind
+    if kind == 'b':
+        return _csv_field_matrix(np.where(values, b'True', b'False'))
+    if kind == 'i' or (kind == 'u' and values.dtype.itemsize < 8):
+        return _format_csv_ints(values.astype(np.int64))
+    if kind == 'f' and values.dtype.itemsize == 8:
+        return _format_csv_floats(values)
+    if kind in 'fu':
+        return _csv_field_matrix(values.astype('S'))
+    if kind == 'M':
+        fields = np.datetime_as_string(values).astype('S')
+        fields[np.isnat(values)] = b''
+        return _csv_field_matrix(fields)
+
+    # Strings are formatted from their UCS-4 code points, so only fields
+    # that are not plain ASCII or need quotes are encoded one at a time
+    values = values.astype('O')
+    missing = np.equal(values, None)
+    if missing.any():
+        values[missing] = ''
+    strings = list(map(str, values.tolist()))
+    lengths = np.fromiter(map(len, strings), dtype=np.int64, count=len(strings))
+    width = int(lengths.max(initial=0))
+    if width * len(strings) > 4 * int(lengths.sum()) + 1024:
+        # A few very long strings would make the padded arrays huge, so
+        # encode each field into one buffer of all of them
+        encoded = [_encode_csv_field(val) for val in strings]
+        lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+        chars = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+        return chars, np.cumsum(lengths) - lengths, lengths
+    fields = values.astype(str)
+    codes = fields.view(np.uint32).reshape(len(fields), -1)
+    chars = codes.astype(np.uint8)
+    # code points past ASCII all look up the last entry
+    flags = _CSV_REDO[np.minimum(codes, 128)]
+    if flags.any():
+        redo = flags.any(axis=1)
+        encoded = [_encode_csv_field(val) for val in fields[redo].tolist()]
+        extra, _, extra_lengths = _csv_field_matrix(np.array(encoded, dtype='S'))
+        if extra.shape[1] > chars.shape[1]:
+            chars = np.pad(chars, ((0, 0), (0, extra.shape[1] - chars.shape[1])))
+        chars[redo, :extra.shape[1]] = extra
+        lengths[redo] = extra_lengths
+    return chars, np.zeros(len(fields), dtype=np.int64), lengths
+
+def _encode_csv_field(val):
+    # The UTF-8 bytes of a string field, quoted if needed
+    val = val.encode('utf-8')
+    if any(char in val for char in (b',', b'"', b'\n', b'\r')):
+        val = b'"' + val.replace(b'"', b'""') + b'"'
+    return val
+
+# Code points of string fields that need quotes or UTF-8 encoding
+_CSV_REDO = np.zeros(129, dtype='bool')
+_CSV_REDO[[_COMMA, _QUOTE, _NEWLINE, _CR, 128]] = True
+
+def _csv_field_matrix(fields):
+    # The bytes, starts and lengths of a NumPy bytes array
+    fields = np.ascontiguousarray(fields)
+    chars = fields.view(np.uint8).reshape(len(fields), fields.dtype.itemsize)
+    lengths = np.char.str_len(fields).astype(np.int64)
+    return chars, np.zeros(len(fields), dtype=np.int64), lengths
+
+# Powers of ten as uint64 and as float64
+_UPOW10 = 10 ** np.arange(20, dtype=np.uint64)
+_FPOW10 = 10.0 ** np.arange(23)
+
+def _format_csv_ints(values):
+    negative = values < 0
+    # negating the smallest int64 only works in unsigned arithmetic
+    magnitude = values.view(np.uint64).copy()
+    magnitude[negative] = np.uint64(0) - magnitude[negative]
+    return _format_csv_digits(magnitude, negative)
+
+def _format_csv_floats(values):
+    """
+    Formats floats with the fewest decimals (at least one) that read back
+    as the same float. A float `v` is written as `m` with a decimal point
+    `k` digits from the right when `m / 10**k == v`, with both `m` and
+    `10**k` exactly representable, so parsing the text gives back `v`.
+    Other floats, like 1e+300 or inf, use NumPy's own formatting.
+    """
+    magnitude = np.abs(values)
+    scale = np.zeros(len(values), dtype=np.int64)
+    mantissa = np.zeros(len(values), dtype=np.uint64)
+    todo = np.flatnonzero(magnitude < 2.0 ** 53)
+    for k in range(1, 18):
+        if len(todo) == 0:
+            break
+        mag = magnitude[todo]
+        m = np.round(mag * _FPOW10[k])
+        exact = m < 2.0 ** 53
+        found = exact & (m / _FPOW10[k] == mag)
+        scale[todo[found]] = k
+        mantissa[todo[found]] = m[found]
+        # larger scales only give larger mantissas
+        todo = todo[exact & ~found]
+
+    done = scale > 0
+    if done.all():
+        return _format_csv_digits(mantissa, np.signbit(values), scale)
+    # NaN stays an empty field
+    other = ~done & ~np.isnan(values)
+    parts = [_format_csv_digits(mantissa[done], np.signbit(values[done]), scale[done]),
+             _csv_field_matrix(values[other].astype('S'))]
+    width = max(part[0].shape[1] for part in parts)
+    chars = np.zeros((len(values), width), dtype=np.uint8)
+    starts = np.zeros(len(values), dtype=np.int64)
+    lengths = np.zeros(len(values), dtype=np.int64)
+    for rows, (part_chars, part_starts, part_lengths) in zip([done, other], parts):
+        chars[rows, :part_chars.shape[1]] = part_chars
+        starts[rows] = part_starts
+        lengths[rows] = part_lengths
+    return chars, starts, lengths
+
+def _format_csv_digits(magnitude, negative, scale=None):
+    """
+    Writes unsigned ints in decimal, one digit position of all numbers at
+    a time, with a minus sign for negative numbers and, if `scale` is
+    given, a decimal point that many digits from the right. Numbers are
+    aligned on the decimal point, so each field starts at its own offset.
 
-def read_sql(sql,drivername,username,password,host,port,database):
+    Returns
+    -------
+    A three-item tuple like `_format_csv_column`
+    """
+    n = len(magnitude)
+    if scale is None:
+        integer = magnitude
+    else:
+        num_frac = int(scale.max(initial=1))
+        divisor = _UPOW10[scale]
+        integer = magnitude // divisor
+        # the fraction digits, padded with zeros to `num_frac` digits
+        frac = magnitude % divisor * _UPOW10[num_frac - scale]
+    num_int = np.maximum(np.searchsorted(_UPOW10, integer, side='right'), 1)
+    lengths = num_int + negative
+    int_width = int(lengths.max(initial=1))
+    width = int_width if scale is None else int_width + 1 + num_frac
+
+    # one row per byte position, so each step works along the long axis
+    chars = np.empty((width, n), dtype=np.uint8)
+    ten = np.uint64(10)
+    rest = integer.copy()
+    for k in range(int_width - 1, -1, -1):
+        chars[k] = rest % ten
+        rest //= ten
+    if scale is not None:
+        rest = frac
+        for k in range(width - 1, int_width, -1):
+            chars[k] = rest % ten
+            rest //= ten
+    chars += ord('0')
+    starts = int_width - lengths
+    chars[starts[negative], np.flatnonzero(negative)] = ord('-')
+    if scale is not None:
+        chars[int_width] = ord('.')
+        lengths = lengths + 1 + scale
+    return np.ascontiguousarray(chars.T), starts, lengths
+
+def _join_csv_fields(columns):
+    """
+    Joins formatted columns into the bytes of CSV records. Every field and
+    separator is a segment of one source array and all segments are
+    gathered at once.
+
+    Parameters
+    ----------
+    columns: list of three-item tuples from `_format_csv_column`
+
+    Returns
+    -------
+    bytes
+    """
+    n = len(columns[0][2])
+    if n == 0:
+        return b''
+    num_cols = len(columns)
+    seg_src = np.empty((n, 2 * num_cols), dtype=np.int64)
+    seg_len = np.ones((n, 2 * num_cols), dtype=np.int64)
+    sources = []
+    base = 0
+    for j, (chars, starts, lengths) in enumerate(columns):
+        if chars.ndim == 1:
+            # one buffer of all the fields of the column
+            seg_src[:, 2 * j] = base + starts
+        else:
+            seg_src[:, 2 * j] = base + np.arange(n) * chars.shape[1] + starts
+        seg_len[:, 2 * j] = lengths
+        sources.append(chars.ravel())
+        base += chars.size
+    sources.append(np.array([_COMMA, _NEWLINE, _QUOTE, _QUOTE], dtype=np.uint8))
+    seg_src[:, 1::2] = base
+    seg_src[:, -1] = base + 1
+    if num_cols == 1:
+        # an empty line would be skipped when read back
+        empty = seg_len[:, 0] == 0
+        seg_src[empty, 0] = base + 2
+        seg_len[empty, 0] = 2
+
+    source = np.concatenate(sources)
+    seg_src = seg_src.ravel()
+    seg_len = seg_len.ravel()
+    out_start = np.cumsum(seg_len) - seg_len
+    index = np.repeat(seg_src - out_start, seg_len)
+    index += np.arange(len(index))
+    return source[index].tobytes()
+
+# sqlalchemy and openpyxl are only imported when a sql or Excel function is
+# first used, which keeps `import ickle` fast and lets it work without them
+
+def _import_sqlalchemy():
+    try:
+        import sqlalchemy
+    except ImportError:
+        raise ImportError('sqlalchemy is required to read and write sql databases. '
+                          'Install it with `pip install sqlalchemy`') from None
+    return sqlalchemy
+
+def _import_openpyxl():
+    try:
+        import openpyxl
+    except ImportError:
+        raise ImportError('openpyxl is required to read and write Excel files. '
+                          'Install it with `pip install openpyxl`') from None
+    return openpyxl
+
+# Number of rows fetched from the database at a time
+_SQL_BATCHSIZE = 10000
+
+def read_sql(sql,drivername,username=None,password=None,host=None,port=None,database=None,chunksize=None):
     """
     Read a sql table based on sql query as a DataFrame
 
@@ -1150,44 +4179,347 @@ def read_sql(sql,drivername,username,password,host,port,database):
     ----------
     sql: str of sql query to be executed
     drivername: str of driver engine of the database
+        A database URL (str or sqlalchemy URL), an sqlalchemy Engine or an
+        open sqlalchemy Connection can be passed instead, in which case the
+        other connection parameters are not used. Engines created from
+        connection parameters or URLs are cached and reused by later calls.
     username: str of username to connect to the database
     password: str of password to connect to the database
     host: str of host to connect to the database
     port: int of port to connect to the database
     database: str of database name  
+    chunksize: int of the number of rows in each DataFrame
+        Optional. When given, the rows are streamed from the database with a
+        server-side cursor and an iterator of DataFrames is returned. Each
+        chunk starts with the data types of the previous one, which are only
+        widened if needed, e.g. an int column becomes float when a later
+        chunk has missing values.
 
     Returns
     -------
-    A DataFrame
+    A DataFrame or an iterator of DataFrames
     """
-    from collections import defaultdict
-    data = defaultdict(list)
-    db_engine = URL.create(drivername,username,password,host,port,database) 
-    conn = sqlalchemy.create_engine(db_engine) 
-    with conn.connect() as con:
-        rs = con.execute(sql)
-        #get column names
-        columns = []
-        for elem in rs.cursor.description:
-            columns.append(elem[0])
-        #key,value mapping
-        for record in rs:
-            for col,val in zip(columns,record):
-                data[col].append(val)
+    if chunksize is not None:
+        if not isinstance(chunksize, int) or isinstance(chunksize, bool):
+            raise TypeError('`chunksize` must be of type int')
+        if chunksize < 1:
+            raise ValueError('`chunksize` must be a positive integer')
+
+    sqlalchemy = _import_sqlalchemy()
+    con = _sql_connectable(drivername, username, password, host, port, database)
+    if chunksize is not None:
+        # connect and run the query now, so errors are raised here rather
+        # than on the first chunk
+        close = not isinstance(con, sqlalchemy.engine.Connection)
+        if close:
+            con = con.connect()
+        try:
+            rs = _execute_sql(con, sql, {'stream_results': True, 'yield_per': chunksize})
+        except BaseException:
+            if close:
+                con.close()
+            raise
+        return _read_sql_chunks(con, rs, chunksize, close)
+
+    if isinstance(con, sqlalchemy.engine.Connection):
+        return DataFrame(_fetch_sql(con, sql))
+    with con.connect() as conn:
+        return DataFrame(_fetch_sql(conn, sql))
+
+# Engines created by `read_sql`, keyed by their URL with the password
+_SQL_ENGINES = {}
+
+def _sql_connectable(drivername, username, password, host, port, database):
+    # Returns the Engine or Connection to run a query on
+    sqlalchemy = _import_sqlalchemy()
+    URL = sqlalchemy.engine.URL
+    if isinstance(drivername, (sqlalchemy.engine.Engine, sqlalchemy.engine.Connection)):
+        return drivername
+    if isinstance(drivername, URL):
+        url = drivername
+    elif isinstance(drivername, str):
+        if '://' in drivername:
+            url = sqlalchemy.engine.make_url(drivername)
+        else:
+            url = URL.create(drivername,username,password,host,port,database)
+    else:
+        raise TypeError('The database must be given as a str, URL, Engine or Connection')
+    key = url.render_as_string(hide_password=False)
+    engine = _SQL_ENGINES.get(key)
+    if engine is None:
+        # setdefault keeps a single engine if two threads get here at once
+        engine = _SQL_ENGINES.setdefault(key, sqlalchemy.create_engine(url))
+    return engine
+
+def _write_sql(df, name, con, if_exists, batchsize):
+    # Creates the table if needed and inserts the rows of `df` batch by batch
+    sqlalchemy = _import_sqlalchemy()
+    metadata = sqlalchemy.MetaData()
+    if sqlalchemy.inspect(con).has_table(name):
+        if if_exists == 'fail':
+            raise ValueError(f'Table {name!r} already exists')
+        if if_exists == 'replace':
+            sqlalchemy.Table(name, metadata).drop(con)
+            metadata = sqlalchemy.MetaData()
+    if if_exists == 'append' and sqlalchemy.inspect(con).has_table(name):
+        table = sqlalchemy.Table(name, metadata, autoload_with=con)
+    else:
+        columns = [sqlalchemy.Column(col, _sql_type(values.dtype)) for col, values in df._data.items()]
+        table = sqlalchemy.Table(name, metadata, *columns)
+        table.create(con)
+
+    insert = table.insert()
+    columns = df.columns
+    for start in range(0, len(df), batchsize):
+        # Each column is converted to Python values at once
+        values = [_to_python_values(arr[start:start + batchsize]) for arr in df._data.values()]
+        con.execute(insert, [dict(zip(columns, row)) for row in zip(*values)])
+
+def _sql_type(dtype):
+    # The sqlalchemy column type for a NumPy data type
+    sqlalchemy = _import_sqlalchemy()
+    if dtype.kind == 'b':
+        return sqlalchemy.Boolean()
+    if dtype.kind in 'iu':
+        return sqlalchemy.BigInteger()
+    if dtype.kind == 'f':
+        return sqlalchemy.Float()
+    if dtype.kind == 'M':
+        if np.datetime_data(dtype)[0] in ('Y', 'M', 'W', 'D'):
+            return sqlalchemy.Date()
+        return sqlalchemy.DateTime()
+    return sqlalchemy.Text()
+
+def _to_python_values(values):
+    # Converts an array to a list of Python values with missing values as None
+    if values.dtype.kind == 'f':
+        missing = np.isnan(values)
+        if missing.any():
+            values = values.astype('O')
+            values[missing] = None
+    elif values.dtype.kind == 'M':
+        unit = np.datetime_data(values.dtype)[0]
+        # finer units would be converted to ints
+        values = values.astype('datetime64[D]' if unit in ('Y', 'M', 'W', 'D') else 'datetime64[us]')
+    return values.tolist()
+
+def _execute_sql(con, sql, execution_options=None):
+    if isinstance(sql, str):
+        sql = _import_sqlalchemy().text(sql)
+    return con.execute(sql, execution_options=execution_options)
+
+def _fetch_sql(con, sql):
+    # Runs `sql` on the connection and returns a dict of column names mapped
+    # to arrays
+    rs = _execute_sql(con, sql)
+    columns = list(rs.keys())
+    # Use the column types of the database when the driver reports them,
+    # otherwise infer them from the first values
+    builders = [_ColumnBuilder(dtype) for dtype in _sql_dtypes(con, rs)]
+    while True:
+        rows = rs.fetchmany(_SQL_BATCHSIZE)
+        if not rows:
+            break
+        for builder, values in zip(builders, zip(*rows)):
+            builder.append(values)
 
     new_data = {}
-    # vals is a list of strings
-    for col, vals in data.items():
-        try:
-            new_data[col] = np.array(vals, dtype='int')
-        except ValueError:
-            try:
-                new_data[col] = np.array(vals, dtype='float')
-            except ValueError:
-                new_data[col] = np.array(vals, dtype='O')
-    return DataFrame(new_data)
+    for col, builder in zip(columns, builders):
+        new_data[col] = builder.finish()
+    return new_data
+
+def _read_sql_chunks(con, rs, chunksize, close):
+    # Generator behind `read_sql(chunksize=...)`. The connection is closed at
+    # the end if `close` is True.
+    try:
+        columns = list(rs.keys())
+        dtypes = _sql_dtypes(con, rs)
+        while True:
+            rows = rs.fetchmany(chunksize)
+            if not rows:
+                break
+            builders = [_ColumnBuilder(dtype) for dtype in dtypes]
+            for builder, values in zip(builders, zip(*rows)):
+                builder.append(values)
+            new_data = {}
+            for col, builder in zip(columns, builders):
+                new_data[col] = builder.finish()
+            # a column with only NULLs so far still has no data type
+            dtypes = [builder.dtype for builder in builders]
+            yield DataFrame(new_data)
+    finally:
+        rs.close()
+        if close:
+            con.close()
+
+# NumPy data types of the PostgreSQL type OIDs that psycopg reports
+_POSTGRES_DTYPES = {16: 'bool', 20: 'int64', 21: 'int64', 23: 'int64',
+                    700: 'float64', 701: 'float64', 1700: 'float64',
+                    18: 'O', 25: 'O', 1042: 'O', 1043: 'O',
+                    1082: 'datetime64[D]', 1114: 'datetime64[us]'}
+
+def _sql_dtypes(con, rs):
+    # One NumPy data type or None per column of the result
+    description = rs.cursor.description
+    if con.dialect.name != 'postgresql':
+        # Other drivers either report no types, like sqlite, or type codes
+        # that mean different things in each of them
+        return [None] * len(description)
+    return [_POSTGRES_DTYPES.get(elem[1]) for elem in description]
+
+def _infer_dtype(values):
+    # The NumPy data type of the first value that is not None
+    import datetime
+    from decimal import Decimal
+    val = next((val for val in values if val is not None), None)
+    if val is None:
+        return None
+    if isinstance(val, bool):
+        return np.dtype('bool')
+    if isinstance(val, int):
+        return np.dtype('int64')
+    if isinstance(val, (float, Decimal)):
+        return np.dtype('float64')
+    if isinstance(val, datetime.datetime):
+        return np.dtype('O') if val.tzinfo is not None else np.dtype('datetime64[us]')
+    if isinstance(val, datetime.date):
+        return np.dtype('datetime64[D]')
+    return np.dtype('O')
+
+def _widen_dtype(dtype):
+    # The data type a column changes to when a value does not fit in it
+    if dtype.kind == 'i':
+        return np.dtype('float64')
+    return np.dtype('O')
+
+# Values of missing data for each kind of data type. Ints and bools mark
+# theirs in a validity mask instead.
+_MISSING_VALUES = {'f': np.nan, 'M': np.datetime64('NaT'), 'O': None}
+
+class _ColumnBuilder:
+    """
+    Collects the values of one column batch by batch into a growing NumPy
+    array. The data type is given up front or inferred from the first value
+    that is not None. It is widened when later values do not fit, so ints
+    with floats become floats and mixed values become objects. Missing ints
+    and bools are tracked in a mask, so those columns keep their data type.
+    """
+
+    def __init__(self, dtype=None):
+        self.dtype = None if dtype is None else np.dtype(dtype)
+        self.values = None
+        self.valid = None
+        self.size = 0
 
-def read_excel(file_path, sheet_name=None):
+    def append(self, values):
+        """
+        Parameters
+        ----------
+        values: tuple or list of Python values
+        """
+        if self.dtype is None:
+            dtype = _infer_dtype(values)
+            if dtype is None:
+                # only missing values so far
+                self.size += len(values)
+                return
+            self.dtype = dtype
+        while True:
+            try:
+                arr, valid = self._convert(values)
+                break
+            except (TypeError, ValueError, OverflowError):
+                self.dtype = _widen_dtype(self.dtype)
+
+        if self.values is None:
+            self.values = np.empty(max(self.size + len(arr), 1024), dtype=self.dtype)
+            if self.size > 0:
+                # leading missing values
+                self._fill_missing(0, self.size)
+        elif self.values.dtype != self.dtype:
+            self.values = self.values.astype(self.dtype)
+            if self.valid is not None and self.dtype.kind in _MISSING_VALUES:
+                # the masked values now have a missing value of their own
+                missing = ~self.valid[:self.size]
+                self.values[:self.size][missing] = _MISSING_VALUES[self.dtype.kind]
+                self.valid = None
+        if self.size + len(arr) > len(self.values):
+            capacity = max(2 * len(self.values), self.size + len(arr))
+            new_values = np.empty(capacity, dtype=self.dtype)
+            new_values[:self.size] = self.values[:self.size]
+            self.values = new_values
+            if self.valid is not None:
+                new_valid = np.ones(capacity, dtype='bool')
+                new_valid[:self.size] = self.valid[:self.size]
+                self.valid = new_valid
+        self.values[self.size:self.size + len(arr)] = arr
+        if valid is not None:
+            if self.valid is None:
+                self.valid = np.ones(len(self.values), dtype='bool')
+            self.valid[self.size:self.size + len(arr)] = valid
+        elif self.valid is not None:
+            self.valid[self.size:self.size + len(arr)] = True
+        self.size += len(arr)
+
+    def _fill_missing(self, start, stop):
+        kind = self.dtype.kind
+        if kind in _MISSING_VALUES:
+            self.values[start:stop] = _MISSING_VALUES[kind]
+            return
+        # `self.valid` marks the missing ints or bools
+        if self.valid is None:
+            self.valid = np.ones(len(self.values), dtype='bool')
+        self.values[start:stop] = False if kind == 'b' else 0
+        self.valid[start:stop] = False
+
+    def _convert(self, values):
+        # Raises a ValueError when a value would be changed by the data type.
+        # Returns the array and, for ints or bools with None, the mask of the
+        # values that are present.
+        kind = self.dtype.kind
+        if kind == 'O':
+            arr = np.empty(len(values), dtype='O')
+            arr[:] = values
+            return arr, None
+        valid = None
+        if kind in 'ib' and any(val is None for val in values):
+            valid = np.array([val is not None for val in values], dtype='bool')
+            fill = False if kind == 'b' else 0
+            values = [fill if val is None else val for val in values]
+        if kind in 'ifb':
+            # NumPy infers ints, floats or bools only if all values are one
+            # of them, so e.g. 0.5 is never cast to an int
+            arr = np.array(values)
+            if arr.dtype.kind == kind or (kind == 'f' and arr.dtype.kind == 'i'):
+                return arr.astype(self.dtype, copy=False), valid
+            if kind != 'f' or any(isinstance(val, (str, bytes)) for val in values):
+                raise ValueError('The values do not fit in this data type')
+            # None, Decimal or a mix of ints and floats
+        return np.array(values, dtype=self.dtype), valid
+
+    def finish(self):
+        """
+        Returns
+        -------
+        A NumPy array of all the values, or a NullableArray for ints and
+        bools with missing values
+        """
+        if self.values is None:
+            if self.dtype is None:
+                return np.full(self.size, None, dtype='O')
+            return np.empty(0, dtype=self.dtype)
+        # drop the unused capacity
+        values = self.values[:self.size].copy()
+        if self.valid is not None:
+            return NullableArray._from_valid(values, self.valid[:self.size].copy())
+        return values
+
+# Number of rows collected from a worksheet before they are converted
+_EXCEL_BATCHSIZE = 10000
+# Number of rows in an Excel sheet, including the header
+_EXCEL_MAX_ROWS = 1048576
+
+def read_excel(file_path, sheet_name=None, usecols=None, nrows=None, skiprows=0, workers=None):
     """
     Read a simple Excel file as a DataFrame
 
@@ -1195,28 +4527,283 @@ def read_excel(file_path, sheet_name=None):
     ----------
     file_path: str of the path to the Excel file that you want to read
     sheet_name: str of sheet name
+        A list of sheet names, or '*' for every sheet, reads each of them
+        into a dict of sheet names mapped to DataFrames
+    usecols: list of column names or column positions
+        Optional. Only these columns are read.
+    nrows: int of the number of rows to read after the header
+        Optional
+    skiprows: int of the number of rows to skip before the header
+    workers: int of the number of processes that read sheets
+        Optional. Only used when several sheets are read.
 
     Returns
     -------
-    A DataFrame
+    A DataFrame or a dict of DataFrames
     """
+    _check_excel_args(nrows, skiprows, workers)
+    if isinstance(sheet_name, list) or sheet_name == '*':
+        names = _excel_sheet_names(file_path, sheet_name)
+        tasks = [(file_path, name) for name in names]
+        results = _read_excel_sheets(tasks, usecols, nrows, skiprows, workers)
+        return {name: DataFrame(data) for name, data in zip(names, results)}
+    return DataFrame(_read_excel_sheet(file_path, sheet_name, usecols, nrows, skiprows))
+
+def read_excel_files(file_paths, sheet_name=None, usecols=None, nrows=None, skiprows=0,
+                     workers=None, concat=False):
+    """
+    Read several Excel files at once, with each sheet read in a pool of
+    processes
+
+    Parameters
+    ----------
+    file_paths: list of str of the paths to the Excel files
+    sheet_name: str of sheet name, list of sheet names or '*' for every sheet
+        Optional. The active sheet of each file is read when None.
+    usecols, nrows, skiprows: same as `read_excel`
+    workers: int of the number of processes
+        Optional. Defaults to the number of CPU cores.
+    concat: bool of whether to stack all sheets into one DataFrame. Every
+        sheet must have the same columns.
+
+    Returns
+    -------
+    A dict of file paths mapped to a DataFrame, or to a dict of sheet names
+    mapped to DataFrames when `sheet_name` is a list or '*'. A single
+    DataFrame if `concat` is True.
+    """
+    if not isinstance(file_paths, list):
+        raise TypeError('`file_paths` must be a list')
+    _check_excel_args(nrows, skiprows, workers)
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    several = isinstance(sheet_name, list) or sheet_name == '*'
+    tasks = []
+    for file_path in file_paths:
+        names = _excel_sheet_names(file_path, sheet_name) if several else [sheet_name]
+        tasks.extend((file_path, name) for name in names)
+    results = _read_excel_sheets(tasks, usecols, nrows, skiprows, workers)
+
+    if concat:
+        return DataFrame(_concat_columns(results))
+    frames = {}
+    for (file_path, name), data in zip(tasks, results):
+        if several:
+            frames.setdefault(file_path, {})[name] = DataFrame(data)
+        else:
+            frames[file_path] = DataFrame(data)
+    return frames
+
+def _check_excel_args(nrows, skiprows, workers):
+    if nrows is not None:
+        if not isinstance(nrows, int) or isinstance(nrows, bool):
+            raise TypeError('`nrows` must be of type int')
+        if nrows < 0:
+            raise ValueError('`nrows` must be a non-negative integer')
+    if not isinstance(skiprows, int) or isinstance(skiprows, bool):
+        raise TypeError('`skiprows` must be of type int')
+    if skiprows < 0:
+        raise ValueError('`skiprows` must be a non-negative integer')
+    if workers is not None:
+        if not isinstance(workers, int) or isinstance(workers, bool):
+            raise TypeError('`workers` must be of type int')
+        if workers < 1:
+            raise ValueError('`workers` must be a positive integer')
+
+def _excel_sheet_names(file_path, sheet_name):
+    # The sheet names of a list or '*' `sheet_name`
+    if sheet_name != '*':
+        return sheet_name
+    openpyxl = _import_openpyxl()
     workbook = openpyxl.load_workbook(filename=file_path, read_only=True)
-    if sheet_name is not None:
-        worksheet = workbook[sheet_name]
-    else:
-        worksheet = workbook.active
-    
-    data = []
-    for row in worksheet.iter_rows(values_only=True):
-        data.append(row)
-    
-    data = np.array(data)
-    
-    headers = data[0]
-    records = data[1:]
+    try:
+        return workbook.sheetnames
+    finally:
+        workbook.close()
+
+def _read_excel_sheets(tasks, usecols, nrows, skiprows, workers):
+    # Reads a list of (file path, sheet name) tuples, in a pool of processes
+    # when more than one worker is useful
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = min(workers or 1, os.cpu_count() or 1, len(tasks))
+    args = [(file_path, name, usecols, nrows, skiprows) for file_path, name in tasks]
+    if workers <= 1:
+        return [_read_excel_sheet(*arg) for arg in args]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_read_excel_sheet, *zip(*args)))
+
+def _read_excel_sheet(file_path, sheet_name, usecols, nrows, skiprows):
+    # Reads one sheet into a dict of column names mapped to arrays. Also
+    # runs in the worker processes of `_read_excel_sheets`.
+    openpyxl = _import_openpyxl()
+    workbook = openpyxl.load_workbook(filename=file_path, read_only=True, data_only=True)
+    try:
+        if sheet_name is not None:
+            worksheet = workbook[sheet_name]
+        else:
+            worksheet = workbook.active
+        return _read_worksheet(worksheet, usecols, nrows, skiprows)
+    finally:
+        # read-only workbooks keep the file open until closed
+        workbook.close()
 
-    columns = {}
-    for i, header in enumerate(headers):
-        columns[header] = records[:, i]
-    
-    return DataFrame(columns)
\ No newline at end of file
+def _concat_columns(datas):
+    """
+    Stacks dicts of column names mapped to arrays that have the same columns.
+    Ints and floats are joined as floats and other mixes of data types as
+    objects.
+
+    Returns
+    -------
+    A dict of column names mapped to arrays
+    """
+    if not datas:
+        raise ValueError('There is nothing to concatenate')
+    columns = list(datas[0])
+    for data in datas[1:]:
+        if list(data) != columns:
+            raise ValueError('All sheets must have the same columns to be concatenated')
+    new_data = {}
+    for col in columns:
+        parts = [data[col] for data in datas]
+        kinds = {part.dtype.kind for part in parts}
+        if len(kinds) > 1 and not kinds <= {'i', 'f'}:
+            parts = [part.astype('O') for part in parts]
+        new_data[col] = _concat_arrays(parts)
+    return new_data
+
+def _read_worksheet(worksheet, usecols, nrows, skiprows):
+    # Streams the rows of a worksheet into one typed array per column
+    rows = worksheet.iter_rows(min_row=skiprows + 1, values_only=True)
+    headers = next(rows, None)
+    if headers is None:
+        raise ValueError('The worksheet does not have a header row')
+    column_names = [str(i) if name is None else str(name) for i, name in enumerate(headers)]
+    usecols = _select_columns(column_names, usecols)
+    positions = [column_names.index(col) for col in usecols]
+    builders = [_ColumnBuilder() for _ in usecols]
+
+    num_cols = len(column_names)
+    num_rows = 0
+    batch = []
+    for row in rows:
+        if nrows is not None and num_rows >= nrows:
+            break
+        if all(val is None for val in row):
+            # blank rows are skipped, like blank lines in `read_csv`
+            continue
+        if len(row) < num_cols:
+            row = row + (None,) * (num_cols - len(row))
+        batch.append(row)
+        num_rows += 1
+        if len(batch) == _EXCEL_BATCHSIZE:
+            _append_rows(builders, positions, batch)
+            batch = []
+    _append_rows(builders, positions, batch)
+    return {col: builder.finish() for col, builder in zip(usecols, builders)}
+
+def _append_rows(builders, positions, rows):
+    if not rows:
+        return
+    values = list(zip(*rows))
+    for builder, i in zip(builders, positions):
+        builder.append(values[i])
+
+# First eight bytes of every file written by `to_ickle`
+_ICKLE_MAGIC = b'ICKLE\x00\x00\x00'
+_ICKLE_VERSION = 1
+# Every buffer starts at a multiple of this many bytes
+_ICKLE_ALIGNMENT = 64
+
+def _align_ickle(position):
+    return -(-position // _ICKLE_ALIGNMENT) * _ICKLE_ALIGNMENT
+
+def _encode_ickle_strings(col, values):
+    # Returns the buffers of a string column: the end offset of each value,
+    # the UTF-8 bytes of all values and, if there are missing values, a
+    # mask of the valid ones
+    valid = np.array([val is not None for val in values.tolist()], dtype='bool')
+    encoded = []
+    for val in values[valid].tolist():
+        if not isinstance(val, str):
+            raise TypeError(f'Column {col!r} must only hold strings or None to be '
+                            'written with `to_ickle`')
+        encoded.append(val.encode('utf-8'))
+    lengths = np.zeros(len(values), dtype='<i8')
+    lengths[valid] = [len(val) for val in encoded]
+    buffers = [np.cumsum(lengths, dtype='<i8'), np.frombuffer(b''.join(encoded), dtype='uint8')]
+    if not valid.all():
+        buffers.append(valid)
+    return buffers
+
+def read_ickle(file, columns=None, decode_strings=False):
+    """
+    Read a file written by `DataFrame.to_ickle` as a DataFrame. The file is
+    memory-mapped, so numeric, bool and datetime columns are read-only
+    views of the file that are only read from disk when used. Ints and
+    bools with missing values come back as NullableArrays. String columns
+    come back as StringArrays over the UTF-8 bytes in the file.
+
+    Parameters
+    ----------
+    file: str of file location
+    columns: list of column names
+        Optional. Only these columns are read.
+    decode_strings: bool of whether to decode string columns into object
+        arrays of Python strings instead
+
+    Returns
+    -------
+    A DataFrame
+    """
+    import json
+    with open(file, 'rb') as f:
+        magic = f.read(8)
+        if magic[:5] != _ICKLE_MAGIC[:5]:
+            raise ValueError('The file was not written by `to_ickle`')
+        header_len = int(np.frombuffer(f.read(8), dtype='<u8')[0])
+        header = json.loads(f.read(header_len).decode('utf-8'))
+    if header['version'] != _ICKLE_VERSION:
+        raise ValueError(f'Unsupported ickle file version {header["version"]}')
+    data_start = _align_ickle(16 + header_len)
+    mm = np.memmap(file, dtype='uint8', mode='r')
+
+    metas = {meta['name']: meta for meta in header['columns']}
+    if columns is None:
+        columns = list(metas)
+    elif not isinstance(columns, list):
+        raise TypeError('`columns` must be a list')
+
+    num_rows = header['num_rows']
+    new_data = {}
+    for col in columns:
+        if col not in metas:
+            raise ValueError(f'Column {col!r} is not in the file')
+        meta = metas[col]
+        buffers = [mm[data_start + buf['offset']:data_start + buf['offset'] + buf['nbytes']]
+                   for buf in meta['buffers']]
+        if meta['dtype'] == 'str' and decode_strings:
+            new_data[col] = _decode_ickle_strings(num_rows, *buffers)
+        elif meta['dtype'] == 'str':
+            ends, data = buffers[:2]
+            offsets = np.concatenate([np.zeros(1, dtype='int64'), ends.view('<i8')])
+            valid = buffers[2].view('bool') if len(buffers) == 3 else None
+            new_data[col] = StringArray._from_buffers(data, offsets, valid)
+        elif len(buffers) == 2:
+            values = buffers[0].view(np.dtype(meta['dtype']))
+            new_data[col] = NullableArray._from_valid(values, None)
+            new_data[col].bitmap = buffers[1]
+        else:
+            new_data[col] = buffers[0].view(np.dtype(meta['dtype']))
+    return DataFrame(new_data)
+
+def _decode_ickle_strings(num_rows, ends, data, valid=None):
+    ends = ends.view('<i8').tolist()
+    data = data.tobytes()
+    values = np.empty(num_rows, dtype='O')
+    values[:] = [data[start:end].decode('utf-8') for start, end in zip([0] + ends, ends)]
+    if valid is not None:
+        values[~valid.view('bool')] = None
+    return values
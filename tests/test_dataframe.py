@@ -3,8 +3,10 @@ from numpy.testing import assert_array_equal
 from sqlalchemy import create_engine, Column, Integer, String, DateTime
 from sqlalchemy.orm import declarative_base, sessionmaker
 from sqlalchemy.engine import URL
+from sqlalchemy.exc import DBAPIError
 from datetime import datetime
 import pytest
+import openpyxl
 
 import ickle as ick
 from tests import assert_df_equals
@@ -55,6 +57,20 @@ class TestDataFrameCreation:
         assert_array_equal(df._data['d'], d)
         assert_array_equal(df._data['e'], e)
 
+    def test_from_dict(self):
+        data = {'a': np.array([1, 2]), 'b': np.array(['x', 'y'], dtype='O')}
+        result = ick.DataFrame._from_dict(data)
+        assert result._data is data
+        assert_df_equals(result, ick.DataFrame(data))
+
+    def test_internal_results_keep_objects(self):
+        result = df[['a', 'e']].min()
+        assert result._data['a'].dtype.kind == 'O'
+        result = df_string.str.lower('movie')
+        assert result._data['movie'].dtype.kind == 'O'
+        with pytest.raises(ValueError):
+            df + np.ones((3, 3))
+
     def test_len(self):
         assert len(df) == 3
 
@@ -265,6 +281,124 @@ c2 = np.array([False, True])
 df2 = ick.DataFrame({'a': a2, 'b': b2, 'c': c2})
 
 
+class TestCopyOnWrite:
+
+    def test_shared_until_written(self):
+        a = np.arange(5)
+        df_cow = ick.DataFrame({'a': a, 'b': np.arange(5.)})
+        df_copy = df_cow.copy()
+        df_head = df_cow.head(3)
+        assert df_copy._data['a'] is a
+        assert np.shares_memory(df_head._data['a'], a)
+
+        df_copy[0, 'a'] = 100
+        assert a[0] == 0 and df_copy._data['a'][0] == 100
+        df_cow[[1, 2], ['a', 'b']] = -1
+        assert_array_equal(a, np.arange(5))
+        assert_array_equal(df_head._data['a'], [0, 1, 2])
+        assert_array_equal(df_cow._data['a'], [0, -1, -1, 3, 4])
+
+        # the copy made by the first write is written in place afterwards
+        owned = df_cow._data['a']
+        df_cow[3, 'a'] = 30
+        assert df_cow._data['a'] is owned
+        # until it is shared again
+        df_a = df_cow[['a']]
+        df_cow[4, 'a'] = 40
+        assert_array_equal(df_a._data['a'], [0, -1, -1, 30, 4])
+        assert df_cow._data['a'][4] == 40
+
+    def test_setitem_selection(self):
+        df_cow = ick.DataFrame({'a': np.arange(4), 's': np.array(['w', 'x', 'y', 'z'])})
+        df_cow[df_cow['a'] > 1, 'a'] = 0.5
+        assert_array_equal(df_cow._data['a'], [0, 1, 0.5, 0.5])
+        df_cow[:2, 1] = 'q'
+        assert df_cow._data['s'].tolist() == ['q', 'q', 'y', 'z']
+        with pytest.raises(KeyError):
+            df_cow[0, 'missing'] = 1
+
+    def test_setitem_keeps_column_types(self):
+        nullable = ick.NullableArray(np.array([3, 0, 2]), np.array([True, False, True]))
+        df_cow = ick.DataFrame({'n': nullable, 'c': ick.Categorical(['a', None, 'b']),
+                                's': ick.StringArray(['x', None, 'y'])})
+        df_cow[1, 'n'] = 7
+        df_cow[0, 'n'] = None
+        assert isinstance(df_cow._data['n'], ick.NullableArray)
+        assert df_cow._data['n'].tolist() == [None, 7, 2]
+        assert nullable.tolist() == [3, None, 2]
+        df_cow[:2, 'c'] = np.array(['z', None], dtype='O')
+        assert isinstance(df_cow._data['c'], ick.Categorical)
+        assert df_cow._data['c'].tolist() == ['z', None, 'b']
+        assert df_cow._data['c'].categories.tolist() == ['a', 'b', 'z']
+        df_cow[1, 's'] = 'w'
+        assert isinstance(df_cow._data['s'], ick.StringArray)
+        assert df_cow._data['s'].tolist() == ['x', 'w', 'y']
+        with pytest.raises(TypeError):
+            df_cow[0, 's'] = 3
+        # floats need NaN for the missing values
+        df_cow[0, 'n'] = 1.5
+        assert_array_equal(df_cow._data['n'], [1.5, 7, 2])
+
+    def test_non_agg_shares_other_columns(self):
+        df_cow = ick.DataFrame({'a': np.arange(3), 's': np.array(['x', 'y', 'z'], dtype='O')})
+        result = df_cow.abs().rename({'a': 'b'}).drop('b')
+        assert result._data['s'] is df_cow._data['s']
+
+class TestIndex:
+
+    def test_loc(self):
+        df_index = ick.DataFrame({'id': np.array([10, 20, 30]),
+                                  's': np.array(['a', 'b', 'c'])}).set_index('id')
+        assert_df_equals(df_index.loc[20], ick.DataFrame({'id': np.array([20]),
+                                                          's': np.array(['b'])}))
+        assert_df_equals(df_index.loc[[30, 10]], ick.DataFrame({'id': np.array([30, 10]),
+                                                                's': np.array(['c', 'a'])}))
+        assert_df_equals(df_index.loc[np.array([20]), 's'], ick.DataFrame({'s': np.array(['b'])}))
+        with pytest.raises(KeyError):
+            df_index.loc[5]
+        with pytest.raises(ValueError):
+            df1.loc[0]
+
+    def test_set_index_errors(self):
+        with pytest.raises(TypeError):
+            df1.set_index(0)
+        with pytest.raises(ValueError):
+            ick.DataFrame({'a': np.array([1, 1])}).set_index('a')
+
+    def test_index_follows_writes(self):
+        df_index = ick.DataFrame({'id': np.array(['x', 'y']), 'v': np.arange(2)}).set_index('id')
+        df_index[0, 'id'] = 'z'
+        assert_array_equal(df_index.loc['z']._data['v'], [0])
+        df_index.columns = ['key', 'v']
+        assert_array_equal(df_index.loc['y']._data['v'], [1])
+        df_index['key'] = np.array(['p', 'q'])
+        assert_array_equal(df_index.loc['q']._data['v'], [1])
+
+
+    def test_sorted_index(self):
+        df_sorted = ick.DataFrame({'ts': np.array([1, 2, 2, 5, 9]), 'v': np.arange(5.)})
+        df_index = df_sorted.set_index('ts', sorted=True)
+        assert_array_equal(df_index.loc[2]._data['v'], [1, 2])
+        assert_array_equal(df_index.loc[[9, 2]]._data['v'], [4, 1, 2])
+        assert_df_equals(df_index.loc[2:5, 'v'], ick.DataFrame({'v': np.array([1., 2., 3.])}))
+        assert_array_equal(df_index.loc[:1]._data['ts'], [1])
+        assert_array_equal(df_index.loc[6:]._data['ts'], [9])
+        assert len(df_index.loc[7:3]) == 0
+        assert np.shares_memory(df_index.loc[2:5]._data['v'], df_sorted._data['v'])
+        with pytest.raises(KeyError):
+            df_index.loc[3]
+        with pytest.raises(ValueError):
+            df_index.loc[1:5:2]
+        with pytest.raises(TypeError):
+            df_sorted.set_index('v').loc[1:2]
+
+        df_index[0, 'ts'] = 100
+        with pytest.raises(ValueError):
+            df_index.loc[2]
+        with pytest.raises(ValueError):
+            ick.DataFrame({'a': np.array([2, 1])}).set_index('a', sorted=True)
+
+
 class TestAggregation:
 
 
@@ -655,6 +789,98 @@ class TestGrouping:
         assert_df_equals(df_result, df_answer)
 
 
+    def test_pivot_table_fill_value_margins(self):
+        df_temp = ick.DataFrame({'a': a8, 'b': b8, 'c': c8,
+                                 'd': np.array(['x', 'x', 'x', 'x', 'x', 'x', 'x', 'y'])})
+        df_result = df_temp.pivot_table(rows='a', columns='d', values='c', aggfunc='sum',
+                                        fill_value=0)
+        df_answer = ick.DataFrame({'a': np.array(['a', 'b'], dtype=object),
+                                   'x': np.array([22, 6]),
+                                   'y': np.array([0, 8])})
+        assert_df_equals(df_result, df_answer)
+
+        df_result = df_temp.pivot_table(rows='a', columns='b', values='c', aggfunc='sum',
+                                        margins=True)
+        df_answer = ick.DataFrame({'a': np.array(['a', 'b', 'All'], dtype=object),
+                                   'A': np.array([9, 8, 17]),
+                                   'B': np.array([13, 6, 19]),
+                                   'All': np.array([22, 14, 36])})
+        assert_df_equals(df_result, df_answer)
+
+        df_result = df_temp.pivot_table(rows='a', values='c', aggfunc='mean', margins=True)
+        df_answer = ick.DataFrame({'a': np.array(['a', 'b', 'All'], dtype=object),
+                                   'mean': np.array([4.4, 14 / 3, 4.5])})
+        assert_df_equals(df_result, df_answer)
+
+        df_result = df_temp.pivot_table(columns='b', values='c', aggfunc='max', margins=True)
+        df_answer = ick.DataFrame({'A': np.array([8]), 'B': np.array([7]), 'All': np.array([8])})
+        assert_df_equals(df_result, df_answer)
+
+
+    def test_groupby(self):
+        df_result = df8.groupby('a').sum()
+        df_answer = ick.DataFrame({'a': np.array(['a', 'b'], dtype=object),
+                                   'c': np.array([22, 14])})
+        assert_df_equals(df_result, df_answer)
+
+        df_result = df8.groupby(['a', 'b']).mean()
+        df_answer = ick.DataFrame({'a': np.array(['a', 'a', 'b', 'b'], dtype=object),
+                                   'b': np.array(['A', 'B', 'A', 'B'], dtype=object),
+                                   'c': np.array([3., 6.5, 8., 3.])})
+        assert_df_equals(df_result, df_answer)
+
+        df_result = df8.groupby('b').size()
+        df_answer = ick.DataFrame({'b': np.array(['A', 'B'], dtype=object),
+                                   'size': np.array([4, 4])})
+        assert_df_equals(df_result, df_answer)
+
+        df_result = df8.groupby('b').max()
+        df_answer = ick.DataFrame({'b': np.array(['A', 'B'], dtype=object),
+                                   'a': np.array(['b', 'b'], dtype=object),
+                                   'c': np.array([8, 7])})
+        assert_df_equals(df_result, df_answer)
+
+        with pytest.raises(TypeError):
+            df8.groupby(0)
+
+    def test_groupby_missing(self):
+        df_temp = ick.DataFrame({'k': np.array([1.5, np.nan, 2.5, 1.5, 2.5]),
+                                 'v': ick.NullableArray(np.arange(5), np.array([1, 1, 0, 1, 0], dtype=bool)),
+                                 'f': np.array([1., 5., np.nan, 3., 4.])})
+        group = df_temp.groupby('k')
+        assert_array_equal(group.size()._data['size'], [2, 2])
+        assert_array_equal(group.count()._data['v'], [2, 0])
+        assert_array_equal(group.sum()._data['v'], [3, 0])
+        assert_array_equal(group.mean()._data['f'], [2, 4])
+        assert_array_equal(group.var()._data['f'], [1, 0])
+        assert group.max()._data['v'].tolist() == [3, None]
+        assert_array_equal(group._agg('median')._data['f'], [2, 4])
+
+
+    def test_groupby_agg(self):
+        df_result = df8.groupby('a').agg({'c': ['count', 'sum', 'mean', 'min', 'max', 'std'],
+                                          'b': 'max'})
+        df_answer = ick.DataFrame({'a': np.array(['a', 'b'], dtype=object),
+                                   'c_count': np.array([5, 3]),
+                                   'c_sum': np.array([22, 14]),
+                                   'c_mean': np.array([4.4, 14 / 3]),
+                                   'c_min': np.array([2, 1]),
+                                   'c_max': np.array([7, 8]),
+                                   'c_std': np.array([np.std([2, 3, 4, 6, 7]), np.std([1, 5, 8])]),
+                                   'b': np.array(['B', 'B'], dtype=object)})
+        assert_df_equals(df_result, df_answer)
+        assert_df_equals(df8.groupby('a').agg('sum'), df8.groupby('a').sum())
+
+        with pytest.raises(TypeError):
+            df8.groupby('a').agg(['sum'])
+        with pytest.raises(TypeError):
+            df8.groupby('a').agg({'b': 'sum'})
+        with pytest.raises(KeyError):
+            df8.groupby('a').agg({'d': 'sum'})
+        with pytest.raises(ValueError):
+            df8.groupby('a').agg({'a': 'count'})
+
+
 movie = np.array(['field of dreams', 'star wars'], dtype='O')
 num = np.array(['5.1', '6'], dtype='O')
 df_string = ick.DataFrame({'movie': movie, 'num': num})
@@ -812,6 +1038,250 @@ class TestStrings:
 
 df_emp = ick.read_csv(file='dataset/employee.csv', header=None)
 
+class TestCategorical:
+
+    values = np.array(['b', 'a', None, 'c', 'a'], dtype='O')
+
+    def test_codes(self):
+        cat = ick.Categorical(self.values)
+        assert_array_equal(cat.categories, np.array(['a', 'b', 'c'], dtype='O'))
+        assert_array_equal(cat.codes, np.array([1, 0, -1, 2, 0]))
+        assert cat.codes.dtype == np.int8
+        assert_array_equal(np.asarray(cat), self.values)
+        assert cat[0] == 'b' and cat[2] is None
+        assert_array_equal(np.asarray(cat[1:3]), self.values[1:3])
+
+    def test_comparisons(self):
+        df_cat = ick.DataFrame({'x': ick.Categorical(self.values)})
+        assert_array_equal((df_cat == 'a').values.ravel(), [False, True, False, False, True])
+        assert_array_equal((df_cat != 'z').values.ravel(), [True] * 5)
+        assert_array_equal((df_cat < 'b').values.ravel(), [False, True, False, False, True])
+        assert_array_equal((df_cat >= 'b').values.ravel(), [True, False, False, True, False])
+        assert_array_equal(df_cat.isna().values.ravel(), [False, False, True, False, False])
+
+    def test_methods(self):
+        df_cat = ick.DataFrame({'x': ick.Categorical(self.values[[0, 1, 3, 4]])})
+        assert df_cat.dtypes._data['Data Type'].tolist() == ['category']
+        assert_array_equal(np.asarray(df_cat.unique()._data['x']), ['a', 'b', 'c'])
+        assert df_cat.nunique()._data['x'][0] == 3
+        counts = df_cat.value_counts()
+        assert_array_equal(np.asarray(counts._data['x']), ['a', 'b', 'c'])
+        assert_array_equal(counts._data['count'], [2, 1, 1])
+        result = df_cat.sort_values('x')
+        assert_array_equal(np.asarray(result._data['x']), ['a', 'a', 'b', 'c'])
+        assert_array_equal(df_cat.min()._data['x'], ['a'])
+
+    def test_str_methods(self):
+        df_cat = ick.DataFrame({'x': ick.Categorical(['b', 'B', None])})
+        result = df_cat.str.lower('x')._data['x']
+        assert isinstance(result, ick.Categorical)
+        assert_array_equal(result.categories, np.array(['b'], dtype='O'))
+        assert_array_equal(np.asarray(result), np.array(['b', 'b', None], dtype='O'))
+        result = df_cat.str.len('x')._data['x']
+        assert_array_equal(result, np.array([1, 1, None], dtype='O'))
+
+    def test_read_csv(self):
+        df_result = ick.read_csv('dataset/employee.csv', header=None, dtype={'0': 'category'})
+        dept = df_result._data['0']
+        assert isinstance(dept, ick.Categorical)
+        assert_df_equals(df_result, df_emp)
+        chunks = ick.read_csv('dataset/employee.csv', header=None, dtype={'0': 'category'},
+                              chunksize=500)
+        assert all(isinstance(chunk._data['0'], ick.Categorical) for chunk in chunks)
+
+    def test_pivot_table(self):
+        df_cat = ick.read_csv('dataset/employee.csv', header=None,
+                              dtype={'0': 'category', '2': 'category'})
+        for kwargs in [{'rows': '0', 'columns': '2'}, {'rows': '0'}, {'columns': '2'}]:
+            result = df_cat.pivot_table(values='3', aggfunc='mean', **kwargs)
+            answer = df_emp.pivot_table(values='3', aggfunc='mean', **kwargs)
+            assert_df_equals(result, answer)
+
+    def test_to_csv(self, tmp_path):
+        file = tmp_path / 'cat.csv'
+        df_cat = ick.DataFrame({'x': ick.Categorical(['a,b', None, 'c']), 'y': np.arange(3)})
+        df_cat.to_csv(file)
+        assert file.read_text() == 'x,y\n"a,b",0\n,1\nc,2\n'
+
+class TestStringArray:
+
+    values = ['Field', None, 'stär wars', '', 'ÉCOLE de', 'field']
+
+    def test_buffers(self):
+        arr = ick.StringArray(self.values)
+        assert arr.data.tobytes() == ''.join(v for v in self.values if v).encode('utf-8')
+        assert_array_equal(arr.offsets, [0, 5, 5, 15, 15, 24, 29])
+        assert_array_equal(arr.valid, [True, False, True, True, True, True])
+        assert_array_equal(np.asarray(arr), np.array(self.values, dtype='O'))
+        assert arr[2] == 'stär wars' and arr[1] is None and arr[-1] == 'field'
+        assert np.asarray(arr[2:5]).tolist() == self.values[2:5]
+        assert np.asarray(arr[[5, 0]]).tolist() == ['field', 'Field']
+
+    def test_str_methods(self):
+        df_arr = ick.DataFrame({'s': ick.StringArray(self.values)})
+        df_obj = ick.DataFrame({'s': np.array(self.values, dtype='O')})
+        for name, args in [('len', ()), ('lower', ()), ('upper', ()), ('capitalize', ()),
+                           ('startswith', ('f',)), ('endswith', ('rs',)),
+                           ('find', ('r',)), ('find', ('de',)), ('find', ('',))]:
+            result = getattr(df_arr.str, name)('s', *args)._data['s']
+            answer = getattr(df_obj.str, name)('s', *args)._data['s']
+            assert np.asarray(result).tolist() == answer.tolist()
+        assert isinstance(df_arr.str.lower('s')._data['s'], ick.StringArray)
+
+    def test_no_missing(self):
+        df_arr = ick.DataFrame({'s': ick.StringArray(['ab', 'b', 'ab'])})
+        assert_array_equal(df_arr.str.len('s')._data['s'], [2, 1, 2])
+        assert_array_equal(df_arr.str.startswith('s', 'a')._data['s'], [True, False, True])
+        assert_array_equal((df_arr == 'ab').values.ravel(), [True, False, True])
+        assert_array_equal(df_arr.isna().values.ravel(), [False, False, False])
+
+    def test_read_csv(self, tmp_path):
+        df_result = ick.read_csv('dataset/employee.csv', header=None, dtype={'0': 'string'})
+        assert isinstance(df_result._data['0'], ick.StringArray)
+        assert_df_equals(df_result, df_emp)
+
+        file = tmp_path / 'strings.ickle'
+        df_result[['0']].to_ickle(file)
+        assert_df_equals(ick.read_ickle(file), df_emp[['0']])
+
+class TestNullableArray:
+
+    values = np.array([3, 0, -1, 5])
+    valid = np.array([True, False, True, True])
+
+    def test_bitmap(self):
+        arr = ick.NullableArray(self.values, self.valid)
+        assert_array_equal(arr.bitmap, [0b1101])
+        assert_array_equal(arr.valid, self.valid)
+        assert arr.dtype == np.int64
+        assert arr.tolist() == [3, None, -1, 5]
+        assert arr[1] is None and arr[3] == 5
+        assert arr[1:3].tolist() == [None, -1]
+        assert_array_equal(np.asarray(arr), [3, np.nan, -1, 5])
+        assert ick.NullableArray(self.values).bitmap is None
+
+    def test_aggregation(self):
+        df_null = ick.DataFrame({'a': ick.NullableArray(self.values, self.valid),
+                                 'b': ick.NullableArray(self.values > 0, self.valid)})
+        assert_array_equal(df_null.isna().values, np.column_stack([~self.valid] * 2))
+        assert_array_equal(df_null.count().values, [[3, 3]])
+        assert df_null.sum()._data['a'].tolist() == [7]
+        assert df_null.min()._data['a'].dtype == np.int64
+        assert df_null.argmax()._data['a'].tolist() == [3]
+        assert df_null.any()._data['b'].tolist() == [True]
+        assert df_null.dtypes._data['Data Type'].tolist() == ['int', 'bool']
+        assert df_null.unique()[0]._data['a'].tolist() == [-1, 3, 5]
+
+    def test_operators(self):
+        df_null = ick.DataFrame({'a': ick.NullableArray(self.values, self.valid)})
+        result = (df_null + 1)._data['a']
+        assert isinstance(result, ick.NullableArray)
+        assert result.tolist() == [4, None, 0, 6]
+        result = (df_null / 2)._data['a']
+        assert_array_equal(result, [1.5, np.nan, -0.5, 2.5])
+        result = df_null[df_null > 0]
+        assert result._data['a'].tolist() == [3, 5]
+
+    def test_read_csv(self, tmp_path):
+        file = tmp_path / 'missing.csv'
+        file.write_text('a,b,c\n1,,True\n,,\n3,,False\n')
+        df_result = ick.read_csv(file, dtype={'c': 'bool'})
+        a, b, c = df_result._data.values()
+        assert isinstance(a, ick.NullableArray) and a.dtype == np.int64
+        assert a.tolist() == [1, None, 3]
+        assert b.dtype == np.float64
+        assert isinstance(c, ick.NullableArray) and c.tolist() == [True, None, False]
+
+        df_result.to_csv(file)
+        assert file.read_text() == 'a,b,c\n1,,True\n,,\n3,,False\n'
+
+        file = tmp_path / 'missing.ickle'
+        df_result.to_ickle(file)
+        df_read = ick.read_ickle(file)
+        assert df_read._data['a'].tolist() == [1, None, 3]
+        assert df_read._data['c'].tolist() == [True, None, False]
+
+class TestMerge:
+
+    df_left = ick.DataFrame({'k': np.array([1, 2, 2, 3, 5]),
+                             'v': np.array([10., 20., 21., 30., 50.]),
+                             's': np.array(['a', 'b', 'c', 'd', 'e'])})
+    df_right = ick.DataFrame({'k': np.array([2, 3, 3, 4]),
+                              'w': np.array([200, 300, 301, 400]),
+                              's': ick.StringArray(['B', 'C', 'D', None])})
+
+    def test_inner(self):
+        df_answer = ick.DataFrame({'k': np.array([2, 2, 3, 3]),
+                                   'v': np.array([20., 21., 30., 30.]),
+                                   's_x': np.array(['b', 'c', 'd', 'd']),
+                                   'w': np.array([200, 200, 300, 301]),
+                                   's_y': np.array(['B', 'B', 'C', 'D'])})
+        assert_df_equals(ick.merge(self.df_left, self.df_right, 'k'), df_answer)
+        # the smaller side is hashed either way, and rows keep the left order
+        df_result = ick.merge(self.df_right, self.df_left, 'k', suffixes=('_r', '_l'))
+        assert df_result.columns == ['k', 'w', 's_r', 'v', 's_l']
+        assert_array_equal(df_result._data['v'], [20., 21., 30., 30.])
+
+    def test_left_outer(self):
+        df_result = ick.merge(self.df_left, self.df_right, 'k', how='left')
+        assert_array_equal(df_result._data['k'], [1, 2, 2, 3, 3, 5])
+        assert df_result._data['w'].tolist() == [None, 200, 200, 300, 301, None]
+        assert df_result._data['s_y'].tolist() == [None, 'B', 'B', 'C', 'D', None]
+
+        df_result = ick.merge(self.df_right, self.df_left, 'k', how='left')
+        assert_array_equal(df_result._data['k'], [2, 2, 3, 3, 4])
+        assert_array_equal(df_result._data['v'], [20., 21., 30., 30., np.nan])
+
+        df_result = ick.merge(self.df_left, self.df_right, 'k', how='outer')
+        assert_array_equal(df_result._data['k'], [1, 2, 2, 3, 3, 5, 4])
+        assert df_result._data['s_x'].tolist() == ['a', 'b', 'c', 'd', 'd', 'e', None]
+        assert df_result._data['w'].tolist() == [None, 200, 200, 300, 301, None, 400]
+
+    def test_several_keys(self):
+        df_left = ick.DataFrame({'a': np.array(['x', 'y', 'x']), 'b': np.array([1, 1, 2]),
+                                 'v': np.arange(3)})
+        df_right = ick.DataFrame({'a': ick.Categorical(['x', 'x', None]),
+                                  'b': np.array([2, 1, 1]), 'w': np.array(['p', 'q', 'r'])})
+        df_result = ick.merge(df_left, df_right, ['a', 'b'], how='outer')
+        assert df_result._data['a'].tolist() == ['x', 'y', 'x', None]
+        assert_array_equal(df_result._data['b'], [1, 1, 2, 1])
+        assert df_result._data['w'].tolist() == ['q', None, 'p', 'r']
+
+    def test_key_types(self):
+        df_left = ick.DataFrame({'c': ick.Categorical(['b', 'a', None, 'c']),
+                                 's': ick.StringArray(['x', 'yy', None, 'x']), 'v': np.arange(4)})
+        df_right = ick.DataFrame({'c': ick.Categorical(['a', 'd', 'b']),
+                                  's': ick.StringArray(['yy', 'z', 'x']), 'w': np.arange(3)})
+        df_result = ick.merge(df_left, df_right, ['c', 's'], how='outer')
+        keys = df_result._data['c']
+        assert isinstance(keys, ick.Categorical)
+        assert keys.tolist() == ['b', 'a', None, 'c', 'd']
+        assert keys.categories.tolist() == ['a', 'b', 'c', 'd']
+        assert isinstance(df_result._data['s'], ick.StringArray)
+        assert df_result._data['s'].tolist() == ['x', 'yy', None, 'x', 'z']
+        assert df_result._data['w'].tolist() == [2, 0, None, None, 1]
+
+    def test_errors(self):
+        with pytest.raises(TypeError):
+            ick.merge(self.df_left, {'k': 1}, 'k')
+        with pytest.raises(TypeError):
+            ick.merge(self.df_left, self.df_right, 1)
+        with pytest.raises(ValueError):
+            ick.merge(self.df_left, self.df_right, 'k', how='cross')
+        with pytest.raises(KeyError):
+            ick.merge(self.df_left, self.df_right, 'v')
+
+class TestImport:
+
+    def test_lazy_backends(self):
+        import subprocess
+        import sys
+        # a fresh interpreter, so no other test has imported the backends
+        code = ('import sys, ickle\n'
+                'print("sqlalchemy" in sys.modules, "openpyxl" in sys.modules)')
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == 'False False'
+
 class TestReadCSV:
 
     def test_columns(self):
@@ -845,6 +1315,314 @@ class TestReadCSV:
         answer = ick.DataFrame(data)
         assert_df_equals(result, answer)
 
+class TestReadCSVChunks:
+
+    def test_chunks(self):
+        chunks = list(ick.read_csv('dataset/employee.csv', header=None, chunksize=500))
+        assert [len(chunk) for chunk in chunks] == [500, 500, 500, 35]
+        assert sum(chunk['3'].sum() for chunk in chunks) == 86387875
+        assert_df_equals(chunks[0].head(), df_emp.head())
+
+    def test_stable_dtypes(self, tmp_path):
+        file = tmp_path / 'data.csv'
+        file.write_text('a,b\n1,x\n2,y\n3,z\n')
+        chunks = list(ick.read_csv(file, chunksize=2))
+        assert_df_equals(chunks[1], ick.DataFrame({'a': np.array([3]),
+                                                   'b': np.array(['z'], dtype='O')}))
+
+        file.write_text('a\n1\n2\nthree\n')
+        with pytest.raises(ValueError):
+            list(ick.read_csv(file, chunksize=2))
+
+    def test_empty_first_chunk(self, tmp_path):
+        file = tmp_path / 'data.csv'
+        file.write_text('a,b\n1,\n2,\n3,hello\n4,\n5,7\n')
+        chunks = list(ick.read_csv(file, chunksize=2))
+        assert_array_equal(chunks[0]._data['b'], [np.nan, np.nan])
+        assert chunks[1]._data['b'].tolist() == ['hello', '']
+        # the type is fixed once the column has a value
+        assert chunks[2]._data['b'].tolist() == ['7']
+
+    def test_errors_at_call(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            ick.read_csv(tmp_path / 'missing.csv', chunksize=2)
+
+        file = tmp_path / 'data.csv'
+        file.write_text('a\n')
+        with pytest.raises(ValueError):
+            ick.read_csv(file, header=3, chunksize=2)
+
+    def test_duplicate_header(self, tmp_path):
+        file = tmp_path / 'data.csv'
+        file.write_text('a,b,a\n1,2,3\n')
+        with pytest.raises(ValueError, match="'a'"):
+            ick.read_csv(file)
+        with pytest.raises(ValueError):
+            ick.read_csv(file, chunksize=1)
+        df_result = ick.read_csv(file, header=None)
+        assert df_result.columns == ['0', '1', '2']
+
+    def test_chunksize_type(self):
+        with pytest.raises(TypeError):
+            ick.read_csv('dataset/employee.csv', chunksize=2.5)
+        with pytest.raises(ValueError):
+            ick.read_csv('dataset/employee.csv', chunksize=0)
+
+class TestCSVParser:
+
+    def test_quoted_fields(self, tmp_path):
+        file = tmp_path / 'data.csv'
+        file.write_bytes(b'skip,me\r\n"Smith, J",1.5\r\n"say ""hi""","2"\r\n"two\nlines",3')
+        df_result = ick.read_csv(file, header=1)
+        df_answer = ick.DataFrame({'0': np.array(['Smith, J', 'say "hi"', 'two\nlines'], dtype='O'),
+                                   '1': np.array([1.5, 2, 3])})
+        assert_df_equals(df_result, df_answer)
+
+        df_result = ick.read_csv(file, header=None)
+        assert_array_equal(df_result['1'].values[:, 0], np.array(['me', '1.5', '2', '3'], dtype='O'))
+
+    def test_stray_quote(self, tmp_path):
+        file = tmp_path / 'data.csv'
+        file.write_text('item,n\n5" pipe,3\n"bolt, 2""",4\n2" pipe,5\n')
+        df_result = ick.read_csv(file)
+        df_answer = ick.DataFrame({'item': np.array(['5" pipe', 'bolt, 2"', '2" pipe'], dtype='O'),
+                                   'n': np.array([3, 4, 5])})
+        assert_df_equals(df_result, df_answer)
+
+    def test_repeated_strings(self, tmp_path):
+        file = tmp_path / 'data.csv'
+        names = ['x', 'a longer value', 'ünïcode'] * 500 + ['only once']
+        file.write_text('s\n' + '\n'.join(names) + '\n', encoding='utf-8')
+        df_result = ick.read_csv(file)
+        assert_array_equal(df_result['s'].values[:, 0], np.array(names, dtype='O'))
+
+    def test_missing_values(self, tmp_path):
+        file = tmp_path / 'data.csv'
+        file.write_text('a,b,c\n1,,x\n\n2,-0.25,\n')
+        df_result = ick.read_csv(file)
+        df_answer = ick.DataFrame({'a': np.array([1, 2]),
+                                   'b': np.array([np.nan, -0.25]),
+                                   'c': np.array(['x', ''], dtype='O')})
+        assert_df_equals(df_result, df_answer)
+
+    def test_small_blocks(self, monkeypatch):
+        monkeypatch.setattr(ick, '_CSV_BLOCKSIZE', 100)
+        assert_df_equals(ick.read_csv('dataset/employee.csv', header=None), df_emp)
+
+    def test_bad_line(self, tmp_path):
+        file = tmp_path / 'data.csv'
+        file.write_text('a,b\n1,2\n3\n')
+        with pytest.raises(ValueError):
+            ick.read_csv(file)
+
+class TestReadCSVSchema:
+
+    def test_usecols(self):
+        df_result = ick.read_csv('dataset/employee.csv', header=None, usecols=['3', 1])
+        assert_df_equals(df_result, df_emp[['1', '3']])
+
+        with pytest.raises(ValueError):
+            ick.read_csv('dataset/employee.csv', usecols=['missing'])
+        with pytest.raises(TypeError):
+            ick.read_csv('dataset/employee.csv', usecols='3')
+
+    def test_nrows(self, monkeypatch):
+        monkeypatch.setattr(ick, '_CSV_BLOCKSIZE', 100)
+        df_result = ick.read_csv('dataset/employee.csv', header=None, nrows=7)
+        assert_df_equals(df_result, df_emp.head(7))
+        assert len(ick.read_csv('dataset/employee.csv', header=None, nrows=0)) == 0
+        with pytest.raises(ValueError):
+            ick.read_csv('dataset/employee.csv', nrows=-1)
+
+    def test_dtype(self, tmp_path):
+        file = tmp_path / 'data.csv'
+        file.write_text('id,n,flag\n007,1,True\n010,2,false\n')
+        df_result = ick.read_csv(file, dtype={'id': 'str', 'n': 'float', 'flag': 'bool'})
+        df_answer = ick.DataFrame({'id': np.array(['007', '010'], dtype='O'),
+                                   'n': np.array([1.0, 2.0]),
+                                   'flag': np.array([True, False])})
+        assert_df_equals(df_result, df_answer)
+
+        with pytest.raises(ValueError):
+            ick.read_csv(file, dtype={'id': 'int', 'flag': 'int'})
+        with pytest.raises(ValueError):
+            ick.read_csv(file, dtype={'missing': 'int'})
+
+    def test_narrow_int_dtype(self, tmp_path):
+        file = tmp_path / 'data.csv'
+        file.write_text('a\n100\n-100\n')
+        df_result = ick.read_csv(file, dtype={'a': 'int8'})
+        assert df_result._data['a'].dtype == np.int8
+        assert_array_equal(df_result._data['a'], [100, -100])
+
+        file.write_text('a\n300\n-200\n')
+        for dtype in ['int8', 'uint8']:
+            with pytest.raises(ValueError, match='cannot be converted'):
+                ick.read_csv(file, dtype={'a': dtype})
+        file.write_text('a\n1\n\n300\n')
+        with pytest.raises(ValueError, match='cannot be converted'):
+            ick.read_csv(file, dtype={'a': 'int8'})
+
+    def test_chunks(self):
+        chunks = ick.read_csv('dataset/employee.csv', header=None, chunksize=500,
+                              usecols=[3], dtype={'3': 'float'}, nrows=1200)
+        assert [len(chunk) for chunk in chunks] == [500, 500, 200]
+        chunk = next(ick.read_csv('dataset/employee.csv', header=None, chunksize=500, usecols=[3]))
+        assert chunk.columns == ['3']
+
+class TestReadCSVWorkers:
+
+    @pytest.fixture(autouse=True)
+    def many_cores(self, monkeypatch):
+        # use several processes even on a machine with one core
+        monkeypatch.setattr(ick.os, 'cpu_count', lambda: 8)
+
+    def test_same_as_one_process(self):
+        for workers in [2, 3, 8]:
+            df_result = ick.read_csv('dataset/employee.csv', header=None, workers=workers)
+            assert_df_equals(df_result, df_emp)
+            assert df_result.dtypes._data['Data Type'].tolist() == ['string', 'string', 'string', 'int']
+
+    def test_unified_dtypes(self, tmp_path):
+        file = tmp_path / 'data.csv'
+        file.write_text('a,b\n' + '1,007\n' * 50 + '1.5,x\n')
+        df_result = ick.read_csv(file, workers=4)
+        assert df_result._data['a'].dtype == np.float64
+        assert df_result._data['a'][-1] == 1.5
+        assert df_result._data['b'].dtype == object
+        assert df_result._data['b'][0] == '007'
+        assert df_result._data['b'][-1] == 'x'
+
+    def test_empty_range(self, tmp_path):
+        file = tmp_path / 'data.csv'
+        file.write_text('a,b\n' + '1,2\n' * 50 + ',3\n' * 50)
+        df_result = ick.read_csv(file, workers=2)
+        df_answer = ick.read_csv(file)
+        assert isinstance(df_result._data['a'], ick.NullableArray)
+        assert df_result._data['a'].tolist() == df_answer._data['a'].tolist()
+        assert_df_equals(df_result[['b']], df_answer[['b']])
+
+    def test_schema(self):
+        df_result = ick.read_csv('dataset/employee.csv', header=None, workers=3,
+                                 usecols=[0, 3], dtype={'3': 'float', '0': 'str'})
+        df_answer = ick.read_csv('dataset/employee.csv', header=None,
+                                 usecols=[0, 3], dtype={'3': 'float'})
+        assert_df_equals(df_result, df_answer)
+        assert df_result._data['3'].dtype == np.float64
+
+    def test_quoted_newlines(self, tmp_path):
+        file = tmp_path / 'data.csv'
+        file.write_text('a,b\n' + '1,"x\n1"\n' * 50)
+        df_result = ick.read_csv(file, workers=4)
+        assert_df_equals(df_result, ick.read_csv(file))
+        assert len(df_result) == 50
+
+    def test_empty(self, tmp_path):
+        file = tmp_path / 'data.csv'
+        file.write_text('a,b\n')
+        df_result = ick.read_csv(file, workers=4)
+        assert df_result.columns == ['a', 'b']
+        assert len(df_result) == 0
+
+    def test_workers_type(self):
+        with pytest.raises(TypeError):
+            ick.read_csv('dataset/employee.csv', workers=2.0)
+        with pytest.raises(ValueError):
+            ick.read_csv('dataset/employee.csv', workers=0)
+        with pytest.raises(ValueError):
+            ick.read_csv('dataset/employee.csv', workers=2, chunksize=10)
+
+class TestToCSV:
+
+    def test_round_trip(self, tmp_path):
+        file = tmp_path / 'data.csv'
+        df_emp.to_csv(file, chunksize=100)
+        assert_df_equals(ick.read_csv(file), df_emp)
+
+    def test_values(self, tmp_path):
+        file = tmp_path / 'data.csv'
+        df_data = ick.DataFrame({'s': np.array(['a,b', 'say "hi"', None, 'ünï\ncode'], dtype='O'),
+                                 'i': np.array([-9223372036854775808, 0, 7, -10]),
+                                 'f': np.array([0.1 + 0.2, np.nan, -0.0, 1e300]),
+                                 'b': np.array([True, False, True, False])})
+        df_data.to_csv(file, chunksize=3)
+        assert file.read_bytes().decode('utf-8') == (
+            's,i,f,b\n'
+            '"a,b",-9223372036854775808,0.30000000000000004,True\n'
+            '"say ""hi""",0,,False\n'
+            ',7,-0.0,True\n'
+            '"ünï\ncode",-10,1e+300,False\n')
+        df_result = ick.read_csv(file, dtype={'b': 'bool'})
+        assert_df_equals(df_result[['i', 'f', 'b']], df_data[['i', 'f', 'b']])
+
+    def test_floats(self, tmp_path):
+        file = tmp_path / 'data.csv'
+        values = np.random.default_rng(0).standard_normal(1000) * 10.0 ** np.linspace(-300, 300, 1000)
+        ick.DataFrame({'a': values}).to_csv(file, header=False)
+        assert_array_equal(ick.read_csv(file, header=None)['0'].values[:, 0], values)
+
+    def test_long_string(self, tmp_path):
+        file = tmp_path / 'data.csv'
+        long_text = 'ü, "x"' * 20000
+        values = np.array(['a'] * 500 + [long_text, None], dtype='O')
+        df_data = ick.DataFrame({'s': values, 'c': ick.Categorical(values), 'i': np.arange(502)})
+        # the fields are not padded to the longest one
+        for col in ['s', 'c']:
+            chars, _, _ = ick._format_csv_column(df_data._data[col])
+            assert chars.size < 10 * len(long_text)
+        df_data.to_csv(file)
+        df_result = ick.read_csv(file)
+        assert df_result._data['s'].tolist() == values.tolist()[:-1] + ['']
+        assert df_result._data['c'].tolist() == values.tolist()[:-1] + ['']
+        assert_array_equal(df_result._data['i'], np.arange(502))
+
+    def test_single_column(self, tmp_path):
+        file = tmp_path / 'data.csv'
+        ick.DataFrame({'a': np.array([1.5, np.nan, 2.0])}).to_csv(file)
+        assert file.read_text() == 'a\n1.5\n""\n2.0\n'
+        assert len(ick.read_csv(file)) == 3
+
+class TestIckleFormat:
+
+    def test_round_trip(self, tmp_path):
+        file = tmp_path / 'data.ickle'
+        df.to_ickle(file)
+        assert_df_equals(ick.read_ickle(file), df)
+
+        df_emp.to_ickle(file)
+        df_result = ick.read_ickle(file)
+        assert_df_equals(df_result, df_emp)
+        assert isinstance(df_result._data['3'], np.memmap)
+        assert not df_result._data['3'].flags.writeable
+
+    def test_strings(self, tmp_path):
+        file = tmp_path / 'data.ickle'
+        values = ['Houston', None, 'stär', '']
+        ick.DataFrame({'s': np.array(values, dtype='O')}).to_ickle(file)
+        strings = ick.read_ickle(file)._data['s']
+        assert isinstance(strings, ick.StringArray)
+        assert isinstance(strings.data.base, np.memmap)
+        assert strings.tolist() == values
+        assert strings[2:].tolist() == values[2:]
+
+        decoded = ick.read_ickle(file, decode_strings=True)._data['s']
+        assert decoded.dtype == object and decoded.tolist() == values
+
+    def test_columns(self, tmp_path):
+        file = tmp_path / 'data.ickle'
+        df_emp.to_ickle(file)
+        assert_df_equals(ick.read_ickle(file, columns=['3', '1']), df_emp[['3', '1']])
+        with pytest.raises(ValueError):
+            ick.read_ickle(file, columns=['missing'])
+
+    def test_errors(self, tmp_path):
+        file = tmp_path / 'data.ickle'
+        with pytest.raises(TypeError):
+            ick.DataFrame({'a': np.array([1, 'x'], dtype='O')}).to_ickle(file)
+        file.write_text('a,b\n1,2\n')
+        with pytest.raises(ValueError):
+            ick.read_ickle(file)
+
 Base = declarative_base()
 
 class Author(Base):
@@ -893,6 +1671,155 @@ class TestSqlDataframe:
         assert df["lastname"] == "Doe"
         assert df["email"] == "upchh@example.com"
 
+@pytest.fixture
+def sqlite_file(tmp_path):
+    file = tmp_path / 'data.db'
+    engine = create_engine(f'sqlite:///{file}')
+    with engine.begin() as con:
+        con.exec_driver_sql('CREATE TABLE t (i INTEGER, f REAL, s TEXT, n INTEGER, z INTEGER)')
+        con.exec_driver_sql("INSERT INTO t VALUES (1, 1.5, 'a', NULL, NULL), "
+                            "(2, 2.5, 'b', 3, NULL), (3, -1.0, NULL, 4, NULL)")
+    engine.dispose()
+    return file
+
+class TestReadSqlTypes:
+
+    def test_types(self, sqlite_file):
+        df_result = ick.read_sql('SELECT * FROM t', 'sqlite', None, None, None, None, str(sqlite_file))
+        df_answer = ick.DataFrame({'i': np.array([1, 2, 3]),
+                                   'f': np.array([1.5, 2.5, -1.0]),
+                                   's': np.array(['a', 'b', None], dtype='O'),
+                                   'n': np.array([np.nan, 3, 4]),
+                                   'z': np.array([None, None, None], dtype='O')})
+        assert_df_equals(df_result, df_answer)
+
+    def test_small_batches(self, sqlite_file, monkeypatch):
+        monkeypatch.setattr(ick, '_SQL_BATCHSIZE', 1)
+        df_result = ick.read_sql('SELECT n, i FROM t', 'sqlite', None, None, None, None, str(sqlite_file))
+        assert_df_equals(df_result, ick.DataFrame({'n': np.array([np.nan, 3, 4]),
+                                                   'i': np.array([1, 2, 3])}))
+
+    def test_column_builder(self):
+        builder = ick._ColumnBuilder()
+        for batch in [(None,), (1, 2), (3,), ('x',)]:
+            builder.append(batch)
+        values = builder.finish()
+        assert values.dtype == object
+        assert values.tolist() == [None, 1, 2, 3, 'x']
+
+        builder = ick._ColumnBuilder()
+        builder.append((None, 1))
+        builder.append((2, None))
+        values = builder.finish()
+        assert isinstance(values, ick.NullableArray)
+        assert_array_equal(values.values, [0, 1, 2, 0])
+        assert_array_equal(values.valid, [False, True, True, False])
+
+        builder = ick._ColumnBuilder()
+        builder.append((True, None))
+        builder.append((1.5,))
+        assert builder.finish().tolist() == [True, None, 1.5]
+
+        builder = ick._ColumnBuilder()
+        builder.append((1, None))
+        builder.append((2.5,))
+        assert_array_equal(builder.finish(), np.array([1, np.nan, 2.5]))
+
+        builder = ick._ColumnBuilder('int64')
+        builder.append(tuple(range(3000)))
+        assert_array_equal(builder.finish(), np.arange(3000))
+
+        builder = ick._ColumnBuilder()
+        builder.append((0, 1))
+        builder.append((0.5, None))
+        assert_array_equal(builder.finish(), np.array([0, 1, 0.5, np.nan]))
+
+        builder = ick._ColumnBuilder()
+        builder.append((1.5, 2))
+        builder.append(('3',))
+        assert builder.finish().tolist() == [1.5, 2, '3']
+
+class TestReadSqlConnections:
+
+    def test_connectables(self, sqlite_file):
+        df_answer = ick.read_sql('SELECT i, s FROM t', 'sqlite', database=str(sqlite_file))
+        engine = create_engine(f'sqlite:///{sqlite_file}')
+        assert_df_equals(ick.read_sql('SELECT i, s FROM t', engine), df_answer)
+        with engine.connect() as con:
+            assert_df_equals(ick.read_sql('SELECT i, s FROM t', con), df_answer)
+            # the connection is still open
+            con.exec_driver_sql('SELECT 1')
+        assert_df_equals(ick.read_sql('SELECT i, s FROM t', f'sqlite:///{sqlite_file}'), df_answer)
+        engine.dispose()
+
+        with pytest.raises(TypeError):
+            ick.read_sql('SELECT i, s FROM t', 5)
+
+    def test_engine_cache(self, sqlite_file):
+        url = URL.create('sqlite', database=str(sqlite_file))
+        ick.read_sql('SELECT i FROM t', url)
+        engine = ick._SQL_ENGINES[url.render_as_string(hide_password=False)]
+        ick.read_sql('SELECT i FROM t', 'sqlite', database=str(sqlite_file))
+        assert ick._SQL_ENGINES[url.render_as_string(hide_password=False)] is engine
+
+class TestReadSqlChunks:
+
+    def test_chunks(self, sqlite_file):
+        chunks = list(ick.read_sql('SELECT i, n FROM t', f'sqlite:///{sqlite_file}', chunksize=2))
+        assert [len(chunk) for chunk in chunks] == [2, 1]
+        assert_df_equals(chunks[0], ick.DataFrame({'i': np.array([1, 2]),
+                                                   'n': np.array([np.nan, 3])}))
+        assert isinstance(chunks[0]._data['n'], ick.NullableArray)
+        assert chunks[1]._data['n'].dtype == np.int64
+
+    def test_null_first_chunk(self, sqlite_file):
+        chunks = list(ick.read_sql('SELECT n, f FROM t', f'sqlite:///{sqlite_file}', chunksize=1))
+        assert chunks[0]._data['n'].tolist() == [None]
+        assert chunks[1]._data['n'].dtype == np.int64
+        assert chunks[2]._data['n'].dtype == np.int64
+        assert chunks[2]._data['f'].dtype == np.float64
+
+    def test_errors_at_call(self, sqlite_file):
+        with pytest.raises(DBAPIError):
+            ick.read_sql('SELECT missing FROM t', f'sqlite:///{sqlite_file}', chunksize=2)
+        with pytest.raises(TypeError):
+            ick.read_sql('SELECT i FROM t', f'sqlite:///{sqlite_file}', chunksize=2.5)
+        with pytest.raises(ValueError):
+            ick.read_sql('SELECT i FROM t', f'sqlite:///{sqlite_file}', chunksize=0)
+
+class TestToSql:
+
+    def test_round_trip(self, tmp_path):
+        url = f'sqlite:///{tmp_path / "out.db"}'
+        df_data = ick.DataFrame({'i': np.array([1, 2, 3]),
+                                 'f': np.array([1.5, np.nan, 3.0]),
+                                 's': np.array(['a', None, 'c'], dtype='O'),
+                                 'b': np.array([True, False, True])})
+        df_data.to_sql('t', url, batchsize=2)
+        df_result = ick.read_sql('SELECT * FROM t', url)
+        assert_df_equals(df_result[['i', 'f', 's']], df_data[['i', 'f', 's']])
+        assert df_result['b'].values[:, 0].tolist() == [1, 0, 1]
+
+        with pytest.raises(ValueError):
+            df_data.to_sql('t', url)
+        df_data.to_sql('t', url, if_exists='append')
+        assert len(ick.read_sql('SELECT * FROM t', url)) == 6
+        df_data.to_sql('t', url, if_exists='replace')
+        assert len(ick.read_sql('SELECT * FROM t', url)) == 3
+
+    def test_employee(self, tmp_path):
+        engine = create_engine(f'sqlite:///{tmp_path / "out.db"}')
+        df_emp.to_sql('employee', engine)
+        assert_df_equals(ick.read_sql('SELECT * FROM employee', engine), df_emp)
+        engine.dispose()
+
+    def test_args(self, tmp_path):
+        url = f'sqlite:///{tmp_path / "out.db"}'
+        with pytest.raises(ValueError):
+            df.to_sql('t', url, if_exists='update')
+        with pytest.raises(TypeError):
+            df.to_sql('t', url, batchsize=1.5)
+
 class TestReadExcel:
     def test_read_excel(self):
         file_path = 'dataset/Book1.xlsx'
@@ -901,9 +1828,109 @@ class TestReadExcel:
 
         expected_data = {
             'Name': np.array(['John', 'Sam', 'Max'], dtype='O'),
-            'Age': np.array(['54', '23', '44'], dtype='O'),
+            'Age': np.array([54, 23, 44]),
             'Country': np.array(['USA', 'UK', 'Pakistan'], dtype='O'),
         }
         expected_df = ick.DataFrame(expected_data)
 
-        assert_df_equals(df, expected_df)
\ No newline at end of file
+        assert_df_equals(df, expected_df)
+
+    def test_options(self):
+        file_path = 'dataset/Book1.xlsx'
+        df = ick.read_excel(file_path, usecols=['Age', 0], nrows=2)
+        expected_df = ick.DataFrame({'Name': np.array(['John', 'Sam'], dtype='O'),
+                                     'Age': np.array([54, 23])})
+        assert_df_equals(df, expected_df)
+
+        df = ick.read_excel(file_path, skiprows=1)
+        assert df.columns == ['John', '54', 'USA']
+        assert len(df) == 2
+
+        with pytest.raises(ValueError):
+            ick.read_excel(file_path, usecols=['Missing'])
+        with pytest.raises(TypeError):
+            ick.read_excel(file_path, nrows=1.5)
+
+    def test_types(self, tmp_path):
+        from datetime import datetime
+        file_path = tmp_path / 'data.xlsx'
+        workbook = openpyxl.Workbook()
+        worksheet = workbook.active
+        worksheet.append(['i', 'f', 's', 'd'])
+        worksheet.append([1, 1.5, 'a', datetime(2020, 1, 2)])
+        worksheet.append([None, 2, None, datetime(2021, 3, 4)])
+        worksheet.append([])
+        worksheet.append([3, 3.25, 'c', None])
+        workbook.save(file_path)
+
+        df = ick.read_excel(file_path)
+        assert_array_equal(df['i'].values[:, 0], np.array([1, np.nan, 3]))
+        assert df._data['f'].dtype == np.float64
+        assert df._data['s'].tolist() == ['a', None, 'c']
+        assert df._data['d'].dtype == np.dtype('datetime64[us]')
+        assert np.isnat(df._data['d'][2])
+
+class TestReadExcelSheets:
+
+    @pytest.fixture
+    def workbooks(self, tmp_path):
+        file_paths = []
+        for n in range(2):
+            workbook = openpyxl.Workbook()
+            first = workbook.active
+            first.title = 'first'
+            second = workbook.create_sheet('second')
+            for worksheet, offset in [(first, 0), (second, 10)]:
+                worksheet.append(['id', 'value'])
+                worksheet.append([n + offset, 0.5])
+                worksheet.append([n + offset + 1, 1])
+            file_path = str(tmp_path / f'book{n}.xlsx')
+            workbook.save(file_path)
+            file_paths.append(file_path)
+        return file_paths
+
+    def test_sheets(self, workbooks):
+        frames = ick.read_excel(workbooks[0], sheet_name='*')
+        assert list(frames) == ['first', 'second']
+        assert_df_equals(frames['second'], ick.DataFrame({'id': np.array([10, 11]),
+                                                          'value': np.array([0.5, 1.0])}))
+        frames = ick.read_excel(workbooks[0], sheet_name=['second'])
+        assert list(frames) == ['second']
+
+    def test_files(self, workbooks, monkeypatch):
+        monkeypatch.setattr(ick.os, 'cpu_count', lambda: 8)
+        frames = ick.read_excel_files(workbooks, workers=2)
+        assert list(frames) == workbooks
+        assert_df_equals(frames[workbooks[1]], ick.read_excel(workbooks[1]))
+
+        frames = ick.read_excel_files(workbooks, sheet_name='*', workers=2)
+        assert_df_equals(frames[workbooks[1]]['second'], ick.read_excel(workbooks[1], 'second'))
+
+        df_result = ick.read_excel_files(workbooks, sheet_name='*', concat=True, workers=1)
+        assert df_result['id'].values[:, 0].tolist() == [0, 1, 10, 11, 1, 2, 11, 12]
+        assert df_result._data['value'].dtype == np.float64
+
+    def test_concat_errors(self, workbooks):
+        with pytest.raises(ValueError):
+            ick.read_excel_files(workbooks + ['dataset/Book1.xlsx'], concat=True)
+        with pytest.raises(TypeError):
+            ick.read_excel_files(workbooks[0])
+
+class TestToExcel:
+
+    def test_round_trip(self, tmp_path):
+        file_path = tmp_path / 'data.xlsx'
+        df_data = ick.DataFrame({'s': np.array(['a', None, 'c'], dtype='O'),
+                                 'i': np.array([1, 2, 3]),
+                                 'f': np.array([1.5, np.nan, 3.25]),
+                                 'b': np.array([True, False, True]),
+                                 't': np.array(['2020-01-02', '2021-03-04', 'NaT'], dtype='datetime64[us]')})
+        df_data.to_excel(file_path, sheet_name='data', chunksize=2)
+        assert_df_equals(ick.read_excel(file_path, 'data'), df_data)
+
+        df_emp.to_excel(file_path)
+        assert_df_equals(ick.read_excel(file_path), df_emp)
+
+    def test_chunksize(self, tmp_path):
+        with pytest.raises(ValueError):
+            df.to_excel(tmp_path / 'data.xlsx', chunksize=0)